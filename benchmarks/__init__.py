@@ -0,0 +1 @@
+# benchmarks - scripts de medicao (python -m benchmarks.<nome>)
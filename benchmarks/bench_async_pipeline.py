@@ -0,0 +1,99 @@
+"""
+Benchmark - N itens com duas etapas async: escada de awaits com AsyncPipe vs AsyncPipeline
+
+uso: python -m benchmarks.bench_async_pipeline [--items 2000] [--latency-ms 1.0]
+
+cada item passa por busca (latencia simulada) -> enriquecimento sync -> auditoria async.
+AsyncPipe aguarda etapa por etapa e item por item; AsyncPipeline roda a cadeia num await
+e espalha os itens com map_concurrent (lista) ou stream (iterable async, sob demanda)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from typing import Any
+
+from src.core import async_pipe, async_pipeline
+
+LIMITS = (1, 16, 64)
+
+
+Row = dict[str, int]
+Stages = tuple[
+    Callable[[int], Awaitable[Row]], Callable[[Row], Row], Callable[[Row], Awaitable[None]]
+]
+
+
+def make_stages(latency: float) -> Stages:
+    async def fetch(n: int) -> Row:
+        await asyncio.sleep(latency)
+        return {"id": n}
+
+    def enrich(row: Row) -> Row:
+        return {**row, "score": row["id"] * 3}
+
+    async def audit(row: Row) -> None:
+        await asyncio.sleep(0)
+
+    return fetch, enrich, audit
+
+
+async def ladder(items: range, latency: float) -> list[Row]:
+    fetch, enrich, audit = make_stages(latency)
+    rows = []
+    for n in items:
+        step = await async_pipe(n).map_async(fetch)
+        step = await step.map(enrich).tap_async(audit)
+        rows.append(step.value)
+    return rows
+
+
+async def fan_out(items: range, latency: float, limit: int) -> list[Row]:
+    fetch, enrich, audit = make_stages(latency)
+    row = async_pipeline().map_async(fetch).map(enrich).tap_async(audit)
+    return await async_pipe(items).lazy().map_concurrent(row, limit=limit)
+
+
+async def streamed(items: range, latency: float, limit: int) -> list[Row]:
+    fetch, enrich, audit = make_stages(latency)
+    row = async_pipeline().map_async(fetch).map(enrich).tap_async(audit)
+
+    async def source() -> AsyncIterator[int]:
+        for n in items:
+            yield n
+
+    return [r async for r in row.stream(source(), limit=limit)]
+
+
+def timed(coro: Coroutine[Any, Any, list[Row]]) -> tuple[float, list[Row]]:
+    start = time.perf_counter()
+    result = asyncio.run(coro)
+    return time.perf_counter() - start, result
+
+
+def main(items: int, latency_ms: float) -> None:
+    print(f"{items:,} itens, busca com {latency_ms} ms de latencia")
+    data = range(items)
+    latency = latency_ms / 1000
+    baseline, expected = timed(ladder(data, latency))
+    print(f"{'escada AsyncPipe':>26} {baseline * 1000:>9.1f} ms  1.00x")
+    for limit in LIMITS:
+        for name, coro in (
+            ("map_concurrent", fan_out(data, latency, limit)),
+            ("stream", streamed(data, latency, limit)),
+        ):
+            elapsed, result = timed(coro)
+            assert result == expected
+            label = f"{name} limit={limit}"
+            print(f"{label:>26} {elapsed * 1000:>9.1f} ms {baseline / elapsed:>5.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=2_000)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    main(args.items, args.latency_ms)
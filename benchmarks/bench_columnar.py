@@ -0,0 +1,92 @@
+"""
+Benchmark - agregados e filtro: repositorio em memoria (dict) vs colunar (numpy)
+
+uso: python -m benchmarks.bench_columnar [--rows 200000] [--repeat 20]
+
+misto: cada repeticao cria um exemplo, apaga outro e lista a primeira pagina
+(o conjunto de vivos muda entre as listagens)
+
+cada repositorio roda num processo proprio (RSS por linha sem interferencia)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+
+from benchmarks.bench_entity_memory import current_rss
+from src.application.specifications.example_specs import example_search
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.repositories import ColumnarExampleRepository, InMemoryExampleRepository
+
+REPOSITORIES = {
+    "dict (InMemory)": InMemoryExampleRepository,
+    "colunar (numpy)": ColumnarExampleRepository,
+}
+
+
+def seed(rows: int) -> list[Example]:
+    entities = [Example.create(name=f"row-{i}", value=i % 1000) for i in range(rows)]
+    for entity in entities[::3]:
+        entity.activate()
+    return entities
+
+
+async def run(name: str, rows: int, repeat: int) -> tuple[float, float, float, float, int]:
+    entities = seed(rows)
+    before = current_rss()
+    repo = REPOSITORIES[name]()
+    await repo.save_many(entities)
+    # so o repositorio fica com as entidades (colunar copia para as colunas)
+    del entities
+    per_row = (current_rss() - before) / rows
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await repo.stats()
+    stats_ms = (time.perf_counter() - start) / repeat * 1000
+
+    spec = example_search(Status.ACTIVE, 100, 500)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        _, total = await repo.find(spec, 1, 10)
+    find_ms = (time.perf_counter() - start) / repeat * 1000
+
+    page, _ = await repo.list_all(1, repeat)
+    start = time.perf_counter()
+    for i in range(repeat):
+        await repo.save(Example.create(name=f"new-{i}"))
+        await repo.delete(page[i].id)
+        await repo.list_all(1, 10)
+    mixed_ms = (time.perf_counter() - start) / repeat * 1000
+    return per_row, stats_ms, find_ms, mixed_ms, total
+
+
+def measure(name: str, rows: int, repeat: int) -> tuple[float, float, float, float, int]:
+    return asyncio.run(run(name, rows, repeat))
+
+
+def main(rows: int, repeat: int) -> None:
+    print(f"{rows:,} exemplos, {repeat} repeticoes")
+    print(
+        f"{'repositorio':>18} {'bytes/linha':>12} {'stats ms':>10} {'find ms':>10} "
+        f"{'misto ms':>10} {'achados':>8}"
+    )
+    with multiprocessing.get_context("fork").Pool(1, maxtasksperchild=1) as pool:
+        for name in REPOSITORIES:
+            per_row, stats_ms, find_ms, mixed_ms, total = pool.apply(measure, (name, rows, repeat))
+            print(
+                f"{name:>18} {per_row:>12,.0f} {stats_ms:>10.2f} {find_ms:>10.2f} "
+                f"{mixed_ms:>10.2f} {total:>8}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
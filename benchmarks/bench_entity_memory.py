@@ -0,0 +1,84 @@
+"""
+Benchmark - memoria por linha de Example: dataclass com __dict__ (antes) vs slots (depois)
+
+uso: python -m benchmarks.bench_entity_memory [--rows 1000000]
+
+mede o RSS de cada layout em processo proprio: objeto, UUID, datetime e nome, sem a lista
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import multiprocessing
+import resource
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+
+
+# mesmo layout de campos da hierarquia antiga, sem slots
+@dataclass
+class DictExample:
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime | None = None
+    created_by: str | None = None
+    updated_by: str | None = None
+    version: int = 1
+    name: str = ""
+    description: str = ""
+    value: int = 0
+    status: Status = Status.PENDING
+
+
+LAYOUTS: dict[str, Callable[[int], object]] = {
+    "dataclass (antes)": lambda i: DictExample(name=f"row-{i}", value=i),
+    "slots (depois)": lambda i: Example.create(name=f"row-{i}", value=i),
+}
+
+
+# RSS atual do processo em bytes (linux)
+def current_rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+# roda num processo novo: memoria liberada por um layout nao mascara o outro
+def bytes_per_row(layout: str, rows: int) -> tuple[float, int]:
+    factory = LAYOUTS[layout]
+    gc.collect()
+    # lista pre-alocada fora da medicao da linha
+    items: list[object] = [None] * rows
+    before = current_rss()
+    for i in range(rows):
+        items[i] = factory(i)
+    return (current_rss() - before) / rows, sys.getsizeof(items[0])
+
+
+def main(rows: int) -> None:
+    print(f"{rows:,} exemplos")
+    print(f"{'layout':>22} {'bytes/linha':>12} {'objeto':>8}")
+    with multiprocessing.get_context("fork").Pool(1, maxtasksperchild=1) as pool:
+        for layout in LAYOUTS:
+            per_row, shallow = pool.apply(bytes_per_row, (layout, rows))
+            print(f"{layout:>22} {per_row:>12,.0f} {shallow:>8}")
+
+    # o que sobra por linha alem do objeto: valores que o proprio objeto referencia
+    now = datetime.now(UTC)
+    print(
+        f"\npor linha tambem: UUID {sys.getsizeof(uuid4()) + sys.getsizeof(uuid4().int)} B, "
+        f"datetime {sys.getsizeof(now)} B (int em us seria {sys.getsizeof(int(now.timestamp() * 1e6))} B)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,87 @@
+"""
+Benchmark - exportacao NDJSON (linhas/s e pico de RSS)
+
+uso: python -m benchmarks.bench_export [--rows 200000]
+
+chama o app ASGI direto e descarta os chunks, pra medir so o caminho de streaming
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import resource
+import time
+from typing import Any
+
+from src.api.app import app
+from src.domain.entities.example import Example
+from src.infrastructure.dependencies import get_example_repository
+
+
+# pico de RSS do processo em MB (ru_maxrss em KB no linux)
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def fill(rows: int) -> None:
+    repo = get_example_repository()
+    await repo.save_many([Example.create(name=f"row-{i}", value=i) for i in range(rows)])
+
+
+# faz GET /examples/export e conta as linhas recebidas
+async def export() -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/examples/export",
+        "raw_path": b"/examples/export",
+        "query_string": b"",
+        "headers": [],
+        "client": ("bench", 0),
+        "server": ("bench", 80),
+    }
+    lines = 0
+    requested = False
+    done = asyncio.Event()
+
+    # primeiro receive entrega o corpo vazio, depois espera ate o fim (disconnect)
+    async def receive() -> dict[str, Any]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal lines
+        if message["type"] == "http.response.body":
+            lines += message.get("body", b"").count(b"\n")
+
+    await app(scope, receive, send)
+    done.set()
+    return lines
+
+
+async def main(rows: int) -> None:
+    await fill(rows)
+    rss_before = peak_rss_mb()
+
+    start = time.perf_counter()
+    count = await export()
+    elapsed = time.perf_counter() - start
+
+    print(f"rows: {count}")
+    print(f"rows/s: {count / elapsed:,.0f}")
+    print(f"peak RSS antes: {rss_before:.1f} MB, depois: {peak_rss_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
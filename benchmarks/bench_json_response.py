@@ -0,0 +1,159 @@
+"""
+Benchmark - GET /examples?page_size=100: response_model (antes) vs FastJSONResponse (depois)
+
+uso: python -m benchmarks.bench_json_response [--requests 1000] [--page-size 100] [--rounds 5]
+
+chama o app ASGI direto (sem rede) pra medir so roteamento + handler + serializacao
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Header, Response
+
+from src.api import responses
+from src.api.app import app
+from src.application.handlers.example_handler import ExampleHandler, ListAllQuery
+from src.application.services.example_service import ExampleService
+from src.application.view_models import (
+    ApiResponse,
+    ExamplePage,
+    ExamplePageEnvelope,
+    ExampleResponse,
+    PaginatedResult,
+)
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.dependencies import ExampleHandlerDep, get_example_repository
+
+# rota com o caminho antigo: devolve o modelo e o FastAPI valida + serializa pelo response_model
+legacy = APIRouter()
+
+
+@legacy.get("/legacy/examples", response_model=ApiResponse[PaginatedResult[ExampleResponse]])
+async def legacy_list(
+    handler: ExampleHandlerDep,
+    response: Response,
+    page: int = 1,
+    page_size: int = 10,
+    cursor: str | None = None,
+    status: Status | None = None,
+    min_value: int | None = None,
+    max_value: int | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ApiResponse[PaginatedResult[ExampleResponse]]:
+    # mesma assinatura e mesmo trabalho do GET /examples, muda so a serializacao
+    etag = f'"{await handler.revision()}"'
+    response.headers["ETag"] = etag
+    query = ListAllQuery(
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        status=status,
+        min_value=min_value,
+        max_value=max_value,
+    )
+    result = await handler.list_all(query)
+    return ApiResponse.success(result)
+
+
+app.include_router(legacy)
+
+
+# faz um GET e devolve o tamanho do corpo
+async def get(path: str, query: bytes) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query,
+        "headers": [],
+        "client": ("bench", 0),
+        "server": ("bench", 80),
+    }
+    size = 0
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def measure(path: str, query: bytes, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await get(path, query)
+    return requests / (time.perf_counter() - start)
+
+
+# monta o envelope e serializa uma pagina pronta, em us por pagina
+def serialize_only(page: ExamplePage, repeat: int) -> list[tuple[str, float]]:
+    model = ApiResponse[PaginatedResult[ExampleResponse]]
+    generic = PaginatedResult.create(page.items, page.total, page.page, page.page_size)
+    steps = [
+        (
+            "validar + serializar (antes)",
+            lambda: model.model_validate(ApiResponse.success(generic)).model_dump_json(),
+        ),
+        (
+            "dump_json tipado (depois)",
+            lambda: responses.dump_json(ExamplePageEnvelope.success(page)),
+        ),
+    ]
+    rows = []
+    for label, step in steps:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            step()
+        rows.append((label, (time.perf_counter() - start) / repeat * 1e6))
+    return rows
+
+
+async def main(requests: int, page_size: int, rounds: int) -> None:
+    repo = get_example_repository()
+    await repo.save_many([Example.create(name=f"row-{i}", value=i) for i in range(page_size)])
+    query = f"page_size={page_size}".encode()
+    paths = {"response_model (antes)": "/legacy/examples", "FastJSONResponse": "/examples"}
+    for path in paths.values():
+        await get(path, query)
+
+    # rodadas alternadas, fica o melhor de cada (reduz ruido da maquina)
+    best = dict.fromkeys(paths, 0.0)
+    for _ in range(rounds):
+        for label, path in paths.items():
+            best[label] = max(best[label], await measure(path, query, requests))
+
+    print(f"GET /examples?page_size={page_size}, {requests} requests x {rounds} rodadas")
+    print(f"{'caminho':>30} {'req/s':>10}")
+    for label, rate in best.items():
+        print(f"{label:>30} {rate:>10,.0f}")
+
+    handler = ExampleHandler(ExampleService(repo))
+    page = await handler.list_all(ListAllQuery(page_size=page_size))
+    print(f"\nso envelope + serializacao de uma pagina de {page_size}")
+    print(f"{'etapa':>30} {'us/pagina':>10}")
+    for label, micros in serialize_only(page, requests):
+        print(f"{label:>30} {micros:>10,.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.page_size, args.rounds))
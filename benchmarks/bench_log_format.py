@@ -0,0 +1,60 @@
+"""
+Benchmark - records/s do ColoredFormatter: sem cache (antigo) vs timestamp/modulo em cache
+
+uso: python -m benchmarks.bench_log_format [--records 20000] [--per-second 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from datetime import datetime
+
+from src.core.logger import ColoredFormatter
+
+
+class LegacyColoredFormatter(logging.Formatter):
+    """formatter antigo (sem cache)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        module = record.name.split(".")[-1][:15].ljust(15)
+        level = record.levelname.ljust(8)
+        return f"{timestamp} {level} {module} {record.getMessage()}"
+
+
+# melhor de 3 passadas
+def records_per_sec(formatter: logging.Formatter, records: list[logging.LogRecord]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        best = min(best, time.perf_counter() - start)
+    return len(records) / best
+
+
+def main(count: int, per_second: int) -> None:
+    base = time.time()
+    records = [
+        logging.LogRecord("app.api.controllers", logging.INFO, "bench.py", 1, "msg %d", (i,), None)
+        for i in range(count)
+    ]
+    # trafego alto: varios records no mesmo segundo
+    for i, record in enumerate(records):
+        record.created = base + i / per_second
+
+    print(f"{count:,} records, {per_second:,} por segundo")
+    legacy = records_per_sec(LegacyColoredFormatter(), records)
+    cached = records_per_sec(ColoredFormatter(), records)
+    print(f"{'sem cache':>10} {legacy:>12,.0f} rec/s")
+    print(f"{'com cache':>10} {cached:>12,.0f} rec/s  {cached / legacy:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--per-second", type=int, default=1_000)
+    args = parser.parse_args()
+    main(args.records, args.per_second)
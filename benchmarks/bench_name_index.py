@@ -0,0 +1,52 @@
+"""
+Benchmark - latencia de create vs tamanho da tabela (indice de nome)
+
+uso: python -m benchmarks.bench_name_index [--max-rows 1000000] [--samples 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from src.application.services.example_service import ExampleService
+from src.domain.entities.example import Example
+from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+# popula repositorio ate n linhas
+async def fill(repo: InMemoryExampleRepository, start: int, end: int) -> None:
+    for i in range(start, end):
+        await repo.save(Example.create(name=f"row-{i}", value=i))
+
+
+# mede latencia media de create (inclui checagem de duplicidade)
+async def measure_create(service: ExampleService, samples: int, tag: int) -> float:
+    start = time.perf_counter()
+    for i in range(samples):
+        await service.create(name=f"bench-{tag}-{i}")
+    return (time.perf_counter() - start) / samples
+
+
+async def main(max_rows: int, samples: int) -> None:
+    repo = InMemoryExampleRepository()
+    service = ExampleService(repo)
+    filled = 0
+
+    print(f"{'rows':>10} {'create (us)':>12}")
+    for size in (s for s in SIZES if s <= max_rows):
+        await fill(repo, filled, size)
+        filled = size
+        latency = await measure_create(service, samples, size)
+        print(f"{size:>10} {latency * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-rows", type=int, default=1_000_000)
+    parser.add_argument("--samples", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.max_rows, args.samples))
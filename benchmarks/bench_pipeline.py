@@ -0,0 +1,92 @@
+"""
+Benchmark - mesma cadeia em N valores: Pipe(value) por item vs Pipeline compilado
+
+uso: python -m benchmarks.bench_pipeline [--values 1000000]
+
+cadeia: map -> when_pred -> tap -> filter. referencia: funcao escrita a mao
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from src.core import Pipe, pipeline
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def scale(x: int) -> int:
+    return x * 10
+
+
+def observe(x: int) -> None:
+    pass
+
+
+def small(x: int) -> bool:
+    return x < 5_000_000
+
+
+def per_item(values: range) -> list[int]:
+    return [
+        Pipe(v).map(inc).when_pred(is_even, scale).tap(observe).filter(small, -1).value
+        for v in values
+    ]
+
+
+def compiled(values: range) -> list[int]:
+    run = pipeline().map(inc).when_pred(is_even, scale).tap(observe).filter(small, -1)
+    return list(run.stream(values))
+
+
+def handwritten(values: range) -> list[int]:
+    def run(v: int) -> int:
+        v = inc(v)
+        if is_even(v):
+            v = scale(v)
+        observe(v)
+        if not small(v):
+            v = -1
+        return v
+
+    return list(map(run, values))
+
+
+MODES: dict[str, Callable[[range], list[int]]] = {
+    "Pipe por item": per_item,
+    "Pipeline": compiled,
+    "a mao": handwritten,
+}
+
+
+def main(values: int) -> None:
+    print(f"{values:,} valores, 4 etapas")
+    data = range(values)
+    expected: list[int] | None = None
+    baseline = 0.0
+    for name, run in MODES.items():
+        start = time.perf_counter()
+        result = run(data)
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected, baseline = result, elapsed
+        assert result == expected
+        print(
+            f"{name:>14} {elapsed * 1000:>9.1f} ms {values / elapsed:>12,.0f}/s "
+            f"{baseline / elapsed:>5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--values", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.values)
@@ -0,0 +1,101 @@
+"""
+Benchmark - custo por item de entidade -> response: BaseModel validado vs dataclass
+
+uso: python -m benchmarks.bench_response_dto [--items 100] [--pages 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.api.responses import dump_json
+from src.application.handlers.example_handler import to_response
+from src.application.view_models import (
+    ApiResponse,
+    ExamplePage,
+    ExamplePageEnvelope,
+    PaginatedResult,
+)
+from src.domain.entities.example import Example
+
+
+# caminho antigo: ExampleResponse como BaseModel, construtor valida cada campo
+class ExampleResponseModel(BaseModel):
+    id: UUID
+    name: str
+    description: str
+    value: int
+    status: str
+    version: int
+
+
+ModelPage = PaginatedResult[ExampleResponseModel]
+ModelPageEnvelope = ApiResponse[ModelPage]
+
+
+def validated(entity: Example) -> ExampleResponseModel:
+    return ExampleResponseModel(
+        id=entity.id,
+        name=entity.name,
+        description=entity.description,
+        value=entity.value,
+        status=entity.status.value,
+        version=entity.version,
+    )
+
+
+# ns por item: so montar os DTOs da pagina, e montar + envelope + serializar
+def per_item_ns(
+    mapper: Callable[[Example], Any],
+    page_type: Any,
+    envelope: Any,
+    entities: list[Example],
+    pages: int,
+) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(pages):
+        [mapper(e) for e in entities]
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(pages):
+        page = page_type.create([mapper(e) for e in entities], len(entities), 1, len(entities))
+        dump_json(envelope.success(page))
+    full = time.perf_counter() - start
+
+    total = pages * len(entities)
+    return build / total * 1e9, full / total * 1e9
+
+
+def main(items: int, pages: int) -> None:
+    entities = [Example.create(name=f"row-{i}", value=i) for i in range(items)]
+    # mesmo corpo JSON nos dois caminhos
+    old = ModelPage.create([validated(e) for e in entities], items, 1, items)
+    new = ExamplePage.create([to_response(e) for e in entities], items, 1, items)
+    old_body = dump_json(ModelPageEnvelope.success(old))
+    new_body = dump_json(ExamplePageEnvelope.success(new))
+    assert old_body == new_body
+
+    print(f"pagina de {items} itens, {pages} paginas")
+    print(f"{'mapper':>20} {'montar ns/item':>16} {'+ serializar ns/item':>22}")
+    modes = [
+        ("BaseModel (antes)", validated, ModelPage, ModelPageEnvelope),
+        ("dataclass", to_response, ExamplePage, ExamplePageEnvelope),
+    ]
+    for label, mapper, page_type, envelope in modes:
+        build, full = per_item_ns(mapper, page_type, envelope, entities, pages)
+        print(f"{label:>20} {build:>16,.0f} {full:>22,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=2_000)
+    args = parser.parse_args()
+    main(args.items, args.pages)
@@ -0,0 +1,130 @@
+"""
+Benchmark - tempo de restart do repositorio duravel: replay do log inteiro vs snapshot + cauda
+
+uso: python -m benchmarks.bench_restart [--rows 5000000] [--updates 2] [--tail 50000] [--dir /tmp/x]
+
+sem snapshot o log guarda o historico (insert + updates por linha); o snapshot guarda so a
+ultima versao e a cauda e o que entrou depois do checkpoint. cada fase roda num processo
+novo (recuperacao parte de memoria vazia, como no restart)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from src.domain.entities.example import Example
+from src.infrastructure.repositories import (
+    DurableExampleRepository,
+    ExampleJournal,
+    InMemoryExampleRepository,
+)
+from src.infrastructure.repositories.example_journal import paused_gc, save_record
+
+BATCH = 10_000
+
+
+def seed(start: int, rows: int) -> list[Example]:
+    return [Example.create(name=f"row-{i}", value=i % 1000) for i in range(start, start + rows)]
+
+
+def directory_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.iterdir())
+
+
+# grava rows linhas direto no log, cada uma com updates versoes a mais (um fsync por lote)
+async def write_log(journal: ExampleJournal, rows: int, updates: int = 0) -> None:
+    for start in range(0, rows, BATCH):
+        entities = seed(start, min(BATCH, rows - start))
+        await journal.append([save_record(e) for e in entities])
+        for _ in range(updates):
+            for entity in entities:
+                entity.value += 1
+                entity.mark_updated()
+            await journal.append([save_record(e) for e in entities])
+
+
+# log inteiro: historico de todas as linhas, nenhum snapshot
+def prepare_log_only(path: str, rows: int, updates: int) -> tuple[float, int]:
+    async def run() -> None:
+        journal = ExampleJournal(path)
+        await write_log(journal, rows, updates)
+        journal.close()
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return time.perf_counter() - start, directory_size(Path(path))
+
+
+# snapshot com rows linhas + tail saves no log depois do checkpoint
+def prepare_snapshot(path: str, rows: int, tail: int) -> tuple[float, int]:
+    async def run() -> float:
+        repo = DurableExampleRepository.recover(ExampleJournal(path))
+        repo.inner.restore(seed(0, rows))
+        start = time.perf_counter()
+        await repo.checkpoint()
+        elapsed = time.perf_counter() - start
+        await write_log(repo.journal, tail)
+        repo.stop()
+        return elapsed
+
+    return asyncio.run(run()), directory_size(Path(path))
+
+
+# restart: recupera do disco e reconstroi os indices (como DurableExampleRepository.recover)
+def restart(path: str) -> tuple[float, float, int]:
+    with paused_gc():
+        start = time.perf_counter()
+        journal = ExampleJournal(path)
+        entities = journal.recover()
+        recovered = time.perf_counter() - start
+        start = time.perf_counter()
+        repo = InMemoryExampleRepository()
+        repo.restore(entities)
+        indexed = time.perf_counter() - start
+    journal.close()
+    return recovered, indexed, repo.count()
+
+
+def main(rows: int, updates: int, tail: int, base: str | None) -> None:
+    root = Path(tempfile.mkdtemp(dir=base))
+    print(
+        f"{rows:,} exemplos com {updates} updates cada, "
+        f"cauda de {tail:,} saves depois do snapshot ({root})"
+    )
+    print(
+        f"{'cenario':>18} {'gravar s':>9} {'MB':>7} {'ler s':>7} {'indices s':>10} "
+        f"{'restart s':>10} {'linhas':>10}"
+    )
+    scenarios = {
+        "log inteiro": (prepare_log_only, (rows + tail, updates)),
+        "snapshot + cauda": (prepare_snapshot, (rows, tail)),
+    }
+    try:
+        with multiprocessing.get_context("fork").Pool(1, maxtasksperchild=1) as pool:
+            for name, (prepare, args) in scenarios.items():
+                path = str(root / name.replace(" ", "-"))
+                written, size = pool.apply(prepare, (path, *args))
+                recovered, indexed, count = pool.apply(restart, (path,))
+                print(
+                    f"{name:>18} {written:>9.2f} {size / 1e6:>7.0f} {recovered:>7.2f} "
+                    f"{indexed:>10.2f} {recovered + indexed:>10.2f} {count:>10,}"
+                )
+                shutil.rmtree(path)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--updates", type=int, default=2)
+    parser.add_argument("--tail", type=int, default=50_000)
+    parser.add_argument("--dir", default=None, help="diretorio base (disco a medir)")
+    args = parser.parse_args()
+    main(args.rows, args.updates, args.tail, args.dir)
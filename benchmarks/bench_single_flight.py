@@ -0,0 +1,76 @@
+"""
+Benchmark - thundering herd em GET por id, com e sem single flight
+
+uso: python -m benchmarks.bench_single_flight [--callers 1000] [--latency-ms 5] [--waves 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from uuid import UUID
+
+from src.application.handlers.example_handler import (
+    CreateExampleCommand,
+    ExampleHandler,
+    GetByIdQuery,
+)
+from src.application.services.example_service import ExampleService
+from src.core import SingleFlight
+from src.core.option import Option
+from src.domain.entities.example import Example
+from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+
+
+class SlowRepository(InMemoryExampleRepository):
+    """simula banco remoto: latencia fixa por leitura e contador de chamadas"""
+
+    __slots__ = ("latency", "reads")
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+        self.reads = 0
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        self.reads += 1
+        await asyncio.sleep(self.latency)
+        return await super().get_by_id(id)
+
+
+# dispara ondas de chamadores concorrentes no mesmo id
+async def run(callers: int, waves: int, latency: float, coalesce: bool) -> tuple[int, float]:
+    repo = SlowRepository(latency)
+    flights: SingleFlight[object] = SingleFlight()
+    service = ExampleService(repo)
+    created = await ExampleHandler(service).create(CreateExampleCommand(name="hot"))
+    query = GetByIdQuery(id=created.value.id)
+
+    start = time.perf_counter()
+    for _ in range(waves):
+        # um handler por request, como na DI; sem coalescer cada um tem o proprio
+        handlers = [
+            ExampleHandler(service, flights if coalesce else SingleFlight()) for _ in range(callers)
+        ]
+        await asyncio.gather(*(h.get_by_id(query) for h in handlers))
+    return repo.reads, time.perf_counter() - start
+
+
+async def main(callers: int, latency_ms: float, waves: int) -> None:
+    latency = latency_ms / 1000
+    print(f"{callers} chamadores x {waves} ondas, latencia {latency_ms}ms")
+    print(f"{'modo':>14} {'backend calls':>14} {'tempo (s)':>10}")
+    for coalesce in (False, True):
+        reads, elapsed = await run(callers, waves, latency, coalesce)
+        label = "single flight" if coalesce else "sem"
+        print(f"{label:>14} {reads:>14} {elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=1_000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--waves", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.callers, args.latency_ms, args.waves))
@@ -0,0 +1,78 @@
+"""
+Benchmark - Specification recursiva vs compilada
+
+uso: python -m benchmarks.bench_specification [--iterations 200000] [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from functools import reduce
+
+from src.application.specifications.example_specs import (
+    ExampleActiveSpec,
+    ExampleNotDeletedSpec,
+    ValueInRangeSpec,
+    ValuePositiveSpec,
+    example_can_be_modified,
+)
+from src.core import Specification
+from src.domain.entities.example import Example
+
+
+# arvore profunda: and encadeado de depth folhas com dupla negacao no meio
+def deep_tree(depth: int) -> Specification[Example]:
+    leaves = [ExampleNotDeletedSpec() if i % 2 else ~~ExampleActiveSpec() for i in range(depth)]
+    return reduce(lambda acc, spec: acc & spec, leaves)
+
+
+def per_call_ns(spec: Specification[Example], entity: Example, iterations: int) -> float:
+    check = spec.is_satisfied_by
+    start = time.perf_counter()
+    for _ in range(iterations):
+        check(entity)
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+# filtra rows exemplos: loop por item vs filter_many (folha avaliada uma vez no lote)
+def batch(rows: int) -> None:
+    entities = [Example.create(name=f"row-{i}", value=i % 1000) for i in range(rows)]
+    spec = ValueInRangeSpec(10, 100).on("value") & ValuePositiveSpec().on("value")
+
+    start = time.perf_counter()
+    per_item = [e for e in entities if spec.is_satisfied_by(e)]
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    batched = spec.filter_many(entities)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    assert per_item == batched
+    print(f"\nfiltro de {rows} exemplos: loop {loop_ms:.1f} ms, filter_many {batch_ms:.1f} ms")
+
+
+def main(iterations: int, rows: int) -> None:
+    entity = Example.create(name="bench")
+    entity.activate()
+    trees = {
+        "example_can_be_modified": example_can_be_modified(),
+        "deep (8 folhas)": deep_tree(8),
+        "deep (32 folhas)": deep_tree(32),
+    }
+
+    print(f"{'arvore':<25} {'recursiva (ns)':>15} {'compilada (ns)':>15} {'speedup':>8}")
+    for name, spec in trees.items():
+        recursive = per_call_ns(spec, entity, iterations)
+        compiled = per_call_ns(spec.compile(), entity, iterations)
+        print(f"{name:<25} {recursive:>15.0f} {compiled:>15.0f} {recursive / compiled:>7.2f}x")
+
+    batch(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.iterations, args.rows)
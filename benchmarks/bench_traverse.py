@@ -0,0 +1,97 @@
+"""
+Benchmark - N buscas por id: loop serial vs traverse_async com limite de concorrencia
+
+uso: python -m benchmarks.bench_traverse [--lookups 2000] [--latency-ms 1.0]
+
+backends: memoria (sem I/O, mede o custo das tasks), memoria com latencia simulada
+(rede) e sqlite em arquivo (pool de threads)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from uuid import UUID
+
+from src.application.services.example_service import ExampleRepository, ExampleService
+from src.core import Either, ErrorResult, Right, traverse_async
+from src.core.option import Option
+from src.domain.entities.example import Example
+from src.infrastructure.database import SqlitePool
+from src.infrastructure.repositories import InMemoryExampleRepository, SqliteExampleRepository
+
+LIMITS = (4, 16, 64)
+
+
+class RemoteRepository(InMemoryExampleRepository):
+    """memoria com latencia fixa por busca (simula store remoto)"""
+
+    __slots__ = ("latency",)
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self.latency = latency
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        await asyncio.sleep(self.latency)
+        return await super().get_by_id(id)
+
+
+async def serial(
+    ids: list[UUID], lookup: Callable[[UUID], Awaitable[Either[ErrorResult, Example]]]
+) -> Either[ErrorResult, list[Example]]:
+    found: list[Example] = []
+    for id in ids:
+        result = await lookup(id)
+        if not isinstance(result, Right):
+            return result  # type: ignore
+        found.append(result.value)
+    return Right(found)
+
+
+async def run(repo: ExampleRepository, lookups: int) -> list[tuple[str, float]]:
+    entities = [Example.create(name=f"row-{i}") for i in range(lookups)]
+    await repo.save_many(entities)
+    service = ExampleService(repo)
+    ids = [e.id for e in entities]
+
+    timings: list[tuple[str, float]] = []
+    start = time.perf_counter()
+    result = await serial(ids, service.get_by_id)
+    timings.append(("serial", time.perf_counter() - start))
+    assert isinstance(result, Right) and len(result.value) == lookups
+    for limit in LIMITS:
+        start = time.perf_counter()
+        result = await traverse_async(ids, service.get_by_id, limit=limit)
+        timings.append((f"limit={limit}", time.perf_counter() - start))
+        assert isinstance(result, Right) and len(result.value) == lookups
+    return timings
+
+
+def main(lookups: int, latency_ms: float) -> None:
+    print(f"{lookups:,} buscas por id (latencia simulada {latency_ms} ms)")
+    modes = ["serial", *(f"limit={limit}" for limit in LIMITS)]
+    print(f"{'backend':>10} " + " ".join(f"{m:>10}" for m in modes) + "   (ms)")
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SqlitePool(str(Path(directory) / "bench.db"))
+        backends: dict[str, ExampleRepository] = {
+            "memoria": InMemoryExampleRepository(),
+            "remoto": RemoteRepository(latency_ms / 1000),
+            "sqlite": SqliteExampleRepository(pool),
+        }
+        for name, repo in backends.items():
+            timings = asyncio.run(run(repo, lookups))
+            print(f"{name:>10} " + " ".join(f"{t * 1000:>10.1f}" for _, t in timings))
+        pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    main(args.lookups, args.latency_ms)
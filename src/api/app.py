@@ -11,15 +11,37 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.controllers import example_router, health_router
+from src.core.logger import setup_logger, shutdown_logging
 from src.infrastructure.config import get_settings
+from src.infrastructure.dependencies import (
+    close_repositories,
+    drain_repositories,
+    start_repositories,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """lifecycle da aplicacao"""
     # startup
+    settings = get_settings()
+    setup_logger(
+        "app",
+        settings.log_level,
+        use_queue=settings.log_use_queue,
+        queue_size=settings.log_queue_size,
+        overflow=settings.log_queue_overflow,
+        json_format=settings.log_json,
+        rate_limit=settings.log_rate_limit,
+        rate_burst=settings.log_rate_burst,
+        rate_summary_interval=settings.log_rate_summary_seconds,
+    )
+    start_repositories()
     yield
-    # shutdown
+    # shutdown (escritas na fila do write-behind antes de fechar o backend)
+    await drain_repositories()
+    close_repositories()
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
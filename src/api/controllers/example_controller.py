@@ -4,10 +4,14 @@ Example Controller - endpoints de exemplo
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
+from src.api.responses import FastJSONResponse, dump_json
 from src.application.handlers.example_handler import (
     CreateExampleCommand,
     GetByIdQuery,
@@ -17,15 +21,24 @@ from src.application.handlers.example_handler import (
 from src.application.view_models import (
     ApiResponse,
     CreateExampleRequest,
+    ExampleEnvelope,
+    ExamplePageEnvelope,
     ExampleResponse,
+    ExampleStatsResponse,
     PaginatedResult,
     UpdateExampleRequest,
 )
-from src.core import Left
-from src.infrastructure.dependencies import ExampleHandlerDep
+from src.core import Left, Nothing, Right, Some
+from src.domain.enums import Status
+from src.infrastructure.dependencies import ExampleHandlerDep, ResponseCacheDep
+from src.infrastructure.repositories.codec import INT64_MAX, INT64_MIN
+from src.infrastructure.repositories.cursor import decode_cursor
 
 router = APIRouter(prefix="/examples", tags=["Examples"])
 
+# limite de itens por requisicao bulk
+BULK_MAX_ITEMS = 1000
+
 
 # helper para converter Either em ApiResponse
 def to_api_response(result) -> ApiResponse:
@@ -36,12 +49,56 @@ def to_api_response(result) -> ApiResponse:
     return ApiResponse.success(result.value)
 
 
+# ETag forte a partir da versao da entidade
+def entity_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+# If-None-Match casa com o etag (lista, "*" e comparacao fraca, RFC 9110)
+def etag_matches(header: str | None, etag: str) -> bool:
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+# versao esperada do If-Match (None = sem condicao ou "*"), levanta 400 se invalido
+def expected_version(header: str | None) -> int | None:
+    if header is None or header.strip() == "*":
+        return None
+    tag = header.strip()
+    # If-Match usa comparacao forte, etag fraco nunca casa
+    if not (len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit()):
+        raise HTTPException(status_code=400, detail="If-Match invalido")
+    return int(tag[1:-1])
+
+
+def not_modified(etag: str) -> Response:
+    """304 sem corpo"""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def fast_response(
+    content: ApiResponse | bytes,
+    etag: str | None = None,
+) -> FastJSONResponse:
+    """serializa uma vez (ou usa bytes prontos), sem passar pelo response_model
+
+    so nas rotas de leitura medidas (bench_json_response), que marcam response_class
+    """
+    headers = {"ETag": etag} if etag else None
+    return FastJSONResponse(content, headers=headers)
+
+
 def unwrap_or_error(result) -> ApiResponse:
     """converte Either para ApiResponse, levanta HTTPException se erro critico"""
     if isinstance(result, Left):
         error = result.value
         if error.is_not_found:
             raise HTTPException(status_code=404, detail=error.first_message)
+        if error.is_conflict:
+            raise HTTPException(status_code=409, detail=error.first_message)
         return ApiResponse.fail(error.first_message)
     return ApiResponse.success(result.value)
 
@@ -61,15 +118,79 @@ async def create(
     return to_api_response(result)
 
 
-@router.get("/{id}", response_model=ApiResponse[ExampleResponse])
+@router.post(
+    "/bulk", response_model=ApiResponse[list[ApiResponse[ExampleResponse]]], status_code=201
+)
+async def create_bulk(
+    requests: Annotated[list[CreateExampleRequest], Body(max_length=BULK_MAX_ITEMS)],
+    handler: ExampleHandlerDep,
+) -> ApiResponse[list[ApiResponse[ExampleResponse]]]:
+    """cria varios exemplos de uma vez, resultado por item"""
+    cmds = [
+        CreateExampleCommand(name=r.name, description=r.description, value=r.value)
+        for r in requests
+    ]
+    results = await handler.create_many(cmds)
+    return ApiResponse.success([to_api_response(r) for r in results])
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export(handler: ExampleHandlerDep) -> StreamingResponse:
+    """exporta todos os exemplos em NDJSON (streaming)"""
+
+    # um chunk por lote, uma linha json por exemplo
+    async def lines() -> AsyncIterator[bytes]:
+        async for batch in handler.export():
+            yield b"".join(dump_json(item) + b"\n" for item in batch)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/stats", response_model=ApiResponse[ExampleStatsResponse])
+async def stats(
+    handler: ExampleHandlerDep,
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ApiResponse[ExampleStatsResponse] | Response:
+    """agregados (total, soma/media/min/max de value, contagem por status), ETag da colecao"""
+    etag = f'"{await handler.revision()}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return ApiResponse.success(await handler.stats())
+
+
+@router.get("/{id}", response_model=ApiResponse[ExampleResponse], response_class=FastJSONResponse)
 async def get_by_id(
     id: UUID,
     handler: ExampleHandlerDep,
-) -> ApiResponse[ExampleResponse]:
-    """busca por id"""
-    query = GetByIdQuery(id=id)
-    result = await handler.get_by_id(query)
-    return unwrap_or_error(result)
+    responses: ResponseCacheDep,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """busca por id (ETag pela versao, 304 no If-None-Match; com cache serve bytes prontos)"""
+    if responses is not None:
+        cached = responses.get(id)
+        if isinstance(cached, Some):
+            etag, body = cached.value
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+            return fast_response(body, etag)
+
+    generation = responses.generation if responses is not None else 0
+    # geracao na chave: busca iniciada antes de uma invalidacao nao serve quem chega depois
+    result = await handler.get_by_id(GetByIdQuery(id=id), generation)
+    if isinstance(result, Left):
+        return fast_response(unwrap_or_error(result))
+
+    # checa antes de montar o ApiResponse
+    etag = entity_etag(result.value.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    body = dump_json(ExampleEnvelope.success(result.value))
+    if responses is not None:
+        responses.put(id, (etag, body), generation)
+    return fast_response(body, etag)
 
 
 @router.put("/{id}", response_model=ApiResponse[ExampleResponse])
@@ -77,15 +198,20 @@ async def update(
     id: UUID,
     request: UpdateExampleRequest,
     handler: ExampleHandlerDep,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
 ) -> ApiResponse[ExampleResponse]:
-    """atualiza exemplo"""
+    """atualiza exemplo (If-Match com o ETag lido evita sobrescrever escrita alheia: 409)"""
     cmd = UpdateExampleCommand(
         id=id,
         name=request.name,
         description=request.description,
         value=request.value,
+        expected_version=expected_version(if_match),
     )
     result = await handler.update(cmd)
+    if isinstance(result, Right):
+        response.headers["ETag"] = entity_etag(result.value.version)
     return unwrap_or_error(result)
 
 
@@ -99,13 +225,42 @@ async def delete(
     return to_api_response(result)
 
 
-@router.get("", response_model=ApiResponse[PaginatedResult[ExampleResponse]])
+@router.get(
+    "",
+    response_model=ApiResponse[PaginatedResult[ExampleResponse]],
+    response_class=FastJSONResponse,
+)
 async def list_all(
     handler: ExampleHandlerDep,
     page: int = 1,
     page_size: int = 10,
-) -> ApiResponse[PaginatedResult[ExampleResponse]]:
-    """lista paginado"""
-    query = ListAllQuery(page=page, page_size=page_size)
-    result = await handler.list_all(query)
-    return ApiResponse.success(result)
+    cursor: str | None = None,
+    status: Status | None = None,
+    min_value: Annotated[int | None, Query(ge=INT64_MIN, le=INT64_MAX)] = None,
+    max_value: Annotated[int | None, Query(ge=INT64_MIN, le=INT64_MAX)] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """lista paginado (offset via page ou keyset via cursor), filtros opcionais, ETag da colecao"""
+    if cursor is not None and isinstance(decode_cursor(cursor), Nothing):
+        raise HTTPException(status_code=400, detail="Cursor invalido")
+
+    filtered = status is not None or min_value is not None or max_value is not None
+    if cursor is not None and filtered:
+        raise HTTPException(status_code=400, detail="Cursor nao suportado com filtros")
+
+    # revisao lida antes da pagina: etag nunca fica mais novo que o conteudo
+    etag = f'"{await handler.revision()}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    query = ListAllQuery(
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        status=status,
+        min_value=min_value,
+        max_value=max_value,
+    )
+    # revisao na chave: nao entra em busca iniciada antes da escrita que mudou o etag
+    result = await handler.list_all(query, etag)
+    return fast_response(ExamplePageEnvelope.success(result), etag)
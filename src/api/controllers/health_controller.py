@@ -5,6 +5,13 @@ Health Controller - endpoints de health check
 from fastapi import APIRouter
 
 from src.infrastructure.config import get_settings
+from src.infrastructure.dependencies import (
+    get_example_repository,
+    get_response_cache,
+    get_single_flight,
+    repository_layer,
+)
+from src.infrastructure.repositories import CachedExampleRepository, WriteBehindExampleRepository
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -24,3 +31,29 @@ async def health() -> dict[str, str]:
 async def ready() -> dict[str, str]:
     """verifica se a api esta pronta"""
     return {"status": "ready"}
+
+
+@router.get("/cache")
+async def cache_stats() -> dict[str, dict[str, int]]:
+    """contadores dos caches de leitura (vazio se desligado)"""
+    stats: dict[str, dict[str, int]] = {}
+    repo = get_example_repository()
+    if isinstance(repo, CachedExampleRepository):
+        stats["entities"] = repo.cache.snapshot()
+    responses = get_response_cache()
+    if responses is not None:
+        stats["responses"] = responses.snapshot()
+    return stats
+
+
+@router.get("/single-flight")
+async def single_flight_stats() -> dict[str, int]:
+    """quantas leituras foram coalescidas"""
+    return get_single_flight().snapshot()
+
+
+@router.get("/write-behind")
+async def write_behind_stats() -> dict[str, int | float]:
+    """fila de escritas: profundidade, lotes, coalescidas e latencia de flush (vazio se desligado)"""
+    repo = repository_layer(get_example_repository(), WriteBehindExampleRepository)
+    return repo.snapshot() if repo is not None else {}
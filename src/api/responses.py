@@ -0,0 +1,37 @@
+"""
+Responses - serializacao JSON em um passo
+
+Endpoints que devolvem FastJSONResponse pulam a validacao do response_model
+(o FastAPI so valida quando recebe o modelo) e serializam direto para bytes.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# serializa para bytes: modelos pelo serializer do pydantic-core, resto via orjson se houver
+def dump_json(content: Any) -> bytes:
+    if isinstance(content, BaseModel) or not ORJSON_AVAILABLE:
+        return to_json(content)
+    return orjson.dumps(content, default=to_jsonable_python)
+
+
+class FastJSONResponse(JSONResponse):
+    """resposta JSON serializada uma vez (aceita bytes ja prontos)"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
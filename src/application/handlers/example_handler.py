@@ -4,13 +4,21 @@ Example Handler - casos de uso para Example
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from uuid import UUID
 
 from src.application.services.example_service import ExampleService
-from src.application.view_models import ExampleResponse, PaginatedResult
-from src.core import Either, ErrorResult, map_right
+from src.application.specifications.example_specs import example_search
+from src.application.view_models import (
+    ExamplePage,
+    ExampleResponse,
+    ExampleStatsResponse,
+    PaginatedResult,
+)
+from src.core import Either, ErrorResult, SingleFlight, map_right
 from src.domain.entities.example import Example
+from src.domain.enums import Status
 
 
 # commands/queries
@@ -31,6 +39,8 @@ class UpdateExampleCommand:
     name: str | None = None
     description: str | None = None
     value: int | None = None
+    # versao vista pelo cliente (If-Match); None = ultima gravada
+    expected_version: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -46,9 +56,13 @@ class ListAllQuery:
 
     page: int = 1
     page_size: int = 10
+    cursor: str | None = None
+    status: Status | None = None
+    min_value: int | None = None
+    max_value: int | None = None
 
 
-# mapper
+# mapper (entidade ja e valida: ExampleResponse e dataclass, nao revalida)
 def to_response(entity: Example) -> ExampleResponse:
     """converte entidade para response"""
     return ExampleResponse(
@@ -57,6 +71,7 @@ def to_response(entity: Example) -> ExampleResponse:
         description=entity.description,
         value=entity.value,
         status=entity.status.value,
+        version=entity.version,
     )
 
 
@@ -64,10 +79,12 @@ def to_response(entity: Example) -> ExampleResponse:
 class ExampleHandler:
     """handler com casos de uso"""
 
-    __slots__ = ("_service",)
+    __slots__ = ("_service", "_flights")
 
-    def __init__(self, service: ExampleService):
+    def __init__(self, service: ExampleService, flights: SingleFlight[object] | None = None):
         self._service = service
+        # (query, snapshot) vira a chave: queries sao frozen; compartilhado entre requests via DI
+        self._flights = flights if flights is not None else SingleFlight()
 
     async def create(self, cmd: CreateExampleCommand) -> Either[ErrorResult, ExampleResponse]:
         """cria novo exemplo"""
@@ -78,8 +95,26 @@ class ExampleHandler:
         )
         return map_right(result, to_response)
 
-    async def get_by_id(self, query: GetByIdQuery) -> Either[ErrorResult, ExampleResponse]:
-        """busca por id"""
+    async def create_many(
+        self, cmds: list[CreateExampleCommand]
+    ) -> list[Either[ErrorResult, ExampleResponse]]:
+        """cria varios exemplos, resultado por item"""
+        results = await self._service.create_many(
+            [(cmd.name, cmd.description, cmd.value) for cmd in cmds]
+        )
+        return [map_right(r, to_response) for r in results]
+
+    async def get_by_id(
+        self, query: GetByIdQuery, snapshot: object = None
+    ) -> Either[ErrorResult, ExampleResponse]:
+        """busca por id (chamadas iguais concorrentes dividem a mesma busca)
+
+        snapshot e a marca de frescor que o chamador leu (ex.: geracao do cache de
+        respostas): quem chega depois de uma escrita nao entra numa busca anterior a ela
+        """
+        return await self._flights.do((query, snapshot), lambda: self._get_by_id(query))
+
+    async def _get_by_id(self, query: GetByIdQuery) -> Either[ErrorResult, ExampleResponse]:
         result = await self._service.get_by_id(query.id)
         return map_right(result, to_response)
 
@@ -90,6 +125,7 @@ class ExampleHandler:
             name=cmd.name,
             description=cmd.description,
             value=cmd.value,
+            expected_version=cmd.expected_version,
         )
         return map_right(result, to_response)
 
@@ -97,12 +133,56 @@ class ExampleHandler:
         """deleta exemplo"""
         return await self._service.delete(id)
 
-    async def list_all(self, query: ListAllQuery) -> PaginatedResult[ExampleResponse]:
-        """lista paginado"""
-        items, total = await self._service.list_all(query.page, query.page_size)
-        return PaginatedResult.create(
+    async def list_all(
+        self, query: ListAllQuery, snapshot: object = None
+    ) -> PaginatedResult[ExampleResponse]:
+        """lista paginado (chamadas iguais concorrentes dividem a mesma busca)
+
+        snapshot e a revisao que o chamador leu: so divide busca com quem viu a mesma
+        """
+        return await self._flights.do((query, snapshot), lambda: self._list_all(query))
+
+    async def _list_all(self, query: ListAllQuery) -> PaginatedResult[ExampleResponse]:
+        # filtros vao pro repositorio, cursor tem prioridade sobre page
+        spec = example_search(query.status, query.min_value, query.max_value)
+        if spec is not None:
+            items, total = await self._service.find(spec, query.page, query.page_size)
+            next_cursor = None
+        # primeira pagina tambem vai por keyset pra ja devolver o proximo cursor
+        elif query.cursor is not None or query.page == 1:
+            items, total, next_cursor = await self._service.list_after(
+                query.cursor, query.page_size
+            )
+        else:
+            items, total = await self._service.list_all(query.page, query.page_size)
+            next_cursor = None
+
+        # tipo concreto: serializer exato, sem inferir tipo item a item
+        return ExamplePage.create(
             items=[to_response(e) for e in items],
             total=total,
             page=query.page,
             page_size=query.page_size,
+            next_cursor=next_cursor,
         )
+
+    async def revision(self) -> str:
+        """marca de modificacao da colecao (base do ETag de listagem)"""
+        return await self._service.revision()
+
+    async def stats(self) -> ExampleStatsResponse:
+        """agregados de value e contagem por status"""
+        stats = await self._service.stats()
+        return ExampleStatsResponse(
+            total=stats.total,
+            value_sum=stats.value_sum,
+            value_avg=stats.value_avg,
+            value_min=stats.value_min,
+            value_max=stats.value_max,
+            by_status=stats.by_status,
+        )
+
+    async def export(self, batch_size: int = 500) -> AsyncIterator[list[ExampleResponse]]:
+        """exporta todos os exemplos em lotes, sem materializar a lista inteira"""
+        async for batch in self._service.iter_batches(batch_size):
+            yield [to_response(e) for e in batch]
@@ -4,14 +4,35 @@ Example Service - logica de negocio para Example
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
 from typing import Protocol
 from uuid import UUID
 
 from src.application.specifications.example_specs import NameNotEmptySpec
-from src.core import Either, ErrorResult, Left
+from src.core import Either, ErrorResult, Left, Right, Specification
 from src.core.option import Option, Some, to_either
 from src.domain.entities.example import Example
 
+# tentativas de update otimista sem versao esperada
+UPDATE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class ExampleStats:
+    """agregados dos exemplos vivos"""
+
+    total: int = 0
+    value_sum: int = 0
+    value_min: int | None = None
+    value_max: int | None = None
+    # contagem por valor do status (so status vivos)
+    by_status: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def value_avg(self) -> float | None:
+        return self.value_sum / self.total if self.total else None
+
 
 # protocol do repositorio
 class ExampleRepository(Protocol):
@@ -19,9 +40,23 @@ class ExampleRepository(Protocol):
 
     async def get_by_id(self, id: UUID) -> Option[Example]: ...
     async def get_by_name(self, name: str) -> Option[Example]: ...
+    async def existing_names(self, names: list[str]) -> set[str]: ...
     async def save(self, entity: Example) -> Either[ErrorResult, Example]: ...
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]: ...
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]: ...
     async def delete(self, id: UUID) -> Either[ErrorResult, None]: ...
     async def list_all(self, page: int, page_size: int) -> tuple[list[Example], int]: ...
+    async def list_after(
+        self, cursor: str | None, page_size: int
+    ) -> tuple[list[Example], int, str | None]: ...
+    async def find(
+        self, spec: Specification[Example], page: int, page_size: int
+    ) -> tuple[list[Example], int]: ...
+    def iter_batches(self, batch_size: int) -> AsyncIterator[list[Example]]: ...
+    async def revision(self) -> str: ...
+    async def stats(self) -> ExampleStats: ...
 
 
 class ExampleService:
@@ -54,6 +89,38 @@ class ExampleService:
         entity = Example.create(name=name, description=description, value=value)
         return await self._repo.save(entity)
 
+    async def create_many(
+        self,
+        items: list[tuple[str, str, int]],
+    ) -> list[Either[ErrorResult, Example]]:
+        """cria varios exemplos (name, description, value) com uma checagem e uma escrita"""
+        name_spec = NameNotEmptySpec()
+        taken = await self._repo.existing_names([name for name, _, _ in items])
+
+        # resultado por item, na ordem de entrada
+        results: list[Either[ErrorResult, Example]] = []
+        to_save: list[Example] = []
+        for name, description, value in items:
+            if not name_spec.is_satisfied_by(name):
+                results.append(Left(ErrorResult.validation(name_spec.error_message)))
+                continue
+            # taken tambem cobre duplicados dentro do proprio lote
+            if name in taken:
+                results.append(Left(ErrorResult.validation("Nome ja existe")))
+                continue
+            taken.add(name)
+            entity = Example.create(name=name, description=description, value=value)
+            to_save.append(entity)
+            results.append(Right(entity))
+
+        if not to_save:
+            return results
+
+        saved = await self._repo.save_many(to_save)
+        if isinstance(saved, Left):
+            return [saved if isinstance(r, Right) else r for r in results]
+        return results
+
     async def get_by_id(self, id: UUID) -> Either[ErrorResult, Example]:
         """busca por id"""
         result = await self._repo.get_by_id(id)
@@ -65,31 +132,48 @@ class ExampleService:
         name: str | None = None,
         description: str | None = None,
         value: int | None = None,
+        expected_version: int | None = None,
     ) -> Either[ErrorResult, Example]:
-        """atualiza exemplo"""
-
-        # busca
-        entity_result = await self.get_by_id(id)
-        if isinstance(entity_result, Left):
-            return entity_result
+        """atualiza exemplo (otimista: grava so se a versao lida nao mudou)"""
 
-        entity = entity_result.value
-
-        # atualiza campos
+        # valida nome
         if name is not None:
             name_spec = NameNotEmptySpec()
             if not name_spec.is_satisfied_by(name):
                 return Left(ErrorResult.validation(name_spec.error_message))
-            entity.name = name
-
-        if description is not None:
-            entity.description = description
 
-        if value is not None:
-            entity.value = value
-
-        entity.mark_updated()
-        return await self._repo.save(entity)
+        # sem versao esperada, conflito com escrita concorrente le de novo e repete
+        for _ in range(UPDATE_ATTEMPTS):
+            entity_result = await self.get_by_id(id)
+            if isinstance(entity_result, Left):
+                return entity_result
+
+            current = entity_result.value
+            if expected_version is not None and current.version != expected_version:
+                return Left(ErrorResult.conflict("Exemplo foi alterado por outra requisicao"))
+
+            # rename nao pode colidir com outro exemplo
+            if name is not None:
+                existing = await self._repo.get_by_name(name)
+                if isinstance(existing, Some) and existing.value.id != id:
+                    return Left(ErrorResult.validation("Nome ja existe"))
+
+            # copia, o objeto lido pode ser o mesmo que o repositorio entrega a outros
+            entity = replace(current)
+            if name is not None:
+                entity.name = name
+            if description is not None:
+                entity.description = description
+            if value is not None:
+                entity.value = value
+            entity.mark_updated()
+
+            result = await self._repo.compare_and_save(entity, current.version)
+            retry = isinstance(result, Left) and result.value.is_conflict
+            if not retry or expected_version is not None:
+                return result
+
+        return Left(ErrorResult.conflict("Exemplo foi alterado por outra requisicao"))
 
     async def delete(self, id: UUID) -> Either[ErrorResult, None]:
         """deleta exemplo"""
@@ -102,3 +186,32 @@ class ExampleService:
     ) -> tuple[list[Example], int]:
         """lista paginado"""
         return await self._repo.list_all(page, page_size)
+
+    async def list_after(
+        self,
+        cursor: str | None = None,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int, str | None]:
+        """lista paginado por cursor"""
+        return await self._repo.list_after(cursor, page_size)
+
+    async def find(
+        self,
+        spec: Specification[Example],
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int]:
+        """lista paginado filtrando pela spec no proprio repositorio"""
+        return await self._repo.find(spec, page, page_size)
+
+    def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        """percorre todos os exemplos em lotes"""
+        return self._repo.iter_batches(batch_size)
+
+    async def revision(self) -> str:
+        """marca opaca que muda a cada escrita no repositorio"""
+        return await self._repo.revision()
+
+    async def stats(self) -> ExampleStats:
+        """agregados de value e contagem por status"""
+        return await self._repo.stats()
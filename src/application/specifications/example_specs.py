@@ -4,7 +4,12 @@ Example Specifications - regras de validacao genericas
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from src.core import Specification
+from src.core.filters import Compare, Filter, between
+from src.core.option import Option, Some
+from src.core.specification import Mask, numeric_column
 from src.domain.entities.example import Example
 from src.domain.enums import Status
 
@@ -28,6 +33,13 @@ class ValuePositiveSpec(Specification[int]):
     def is_satisfied_by(self, entity: int) -> bool:
         return entity > 0
 
+    def batch_mask(self, entities: Sequence[int]) -> Mask:
+        column = numeric_column(entities)
+        return column > 0 if column is not None else super().batch_mask(entities)
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return Some(Compare(field, "gt", 0))
+
     @property
     def error_message(self) -> str:
         return "Valor deve ser positivo"
@@ -43,6 +55,15 @@ class ValueInRangeSpec(Specification[int]):
     def is_satisfied_by(self, entity: int) -> bool:
         return self._min <= entity <= self._max
 
+    def batch_mask(self, entities: Sequence[int]) -> Mask:
+        column = numeric_column(entities)
+        if column is None:
+            return super().batch_mask(entities)
+        return (column >= self._min) & (column <= self._max)
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return Some(between(field, self._min, self._max))
+
     @property
     def error_message(self) -> str:
         return f"Valor deve estar entre {self._min} e {self._max}"
@@ -55,6 +76,9 @@ class ExampleActiveSpec(Specification[Example]):
     def is_satisfied_by(self, entity: Example) -> bool:
         return entity.status == Status.ACTIVE
 
+    def to_filter(self) -> Option[Filter]:
+        return Some(Compare("status", "eq", Status.ACTIVE.value))
+
     @property
     def error_message(self) -> str:
         return "Exemplo deve estar ativo"
@@ -66,12 +90,53 @@ class ExampleNotDeletedSpec(Specification[Example]):
     def is_satisfied_by(self, entity: Example) -> bool:
         return entity.status != Status.DELETED
 
+    def to_filter(self) -> Option[Filter]:
+        return Some(Compare("status", "ne", Status.DELETED.value))
+
     @property
     def error_message(self) -> str:
         return "Exemplo nao pode estar deletado"
 
 
+class ExampleStatusSpec(Specification[Example]):
+    """exemplo deve estar no status informado"""
+
+    def __init__(self, status: Status):
+        self._status = status
+
+    def is_satisfied_by(self, entity: Example) -> bool:
+        return entity.status == self._status
+
+    def to_filter(self) -> Option[Filter]:
+        return Some(Compare("status", "eq", self._status.value))
+
+    @property
+    def error_message(self) -> str:
+        return f"Exemplo deve estar com status {self._status.value}"
+
+
 # specs compostas
 def example_can_be_modified() -> Specification[Example]:
     """exemplo pode ser modificado se ativo e nao deletado"""
     return ExampleActiveSpec() & ExampleNotDeletedSpec()
+
+
+def example_search(
+    status: Status | None = None,
+    min_value: int | None = None,
+    max_value: int | None = None,
+) -> Specification[Example] | None:
+    """monta a spec de busca a partir dos filtros informados (None = sem filtro)"""
+    specs: list[Specification[Example]] = []
+    if status is not None:
+        specs.append(ExampleStatusSpec(status))
+    if min_value is not None or max_value is not None:
+        low = min_value if min_value is not None else -(2**63)
+        high = max_value if max_value is not None else 2**63 - 1
+        specs.append(ValueInRangeSpec(low, high).on("value"))
+    if not specs:
+        return None
+    spec = specs[0]
+    for other in specs[1:]:
+        spec = spec & other
+    return spec
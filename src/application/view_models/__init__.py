@@ -2,7 +2,11 @@
 from src.application.view_models.base import ApiResponse, PaginatedResult
 from src.application.view_models.example_vm import (
     CreateExampleRequest,
+    ExampleEnvelope,
+    ExamplePage,
+    ExamplePageEnvelope,
     ExampleResponse,
+    ExampleStatsResponse,
     UpdateExampleRequest,
 )
 
@@ -12,4 +16,8 @@ __all__ = [
     "CreateExampleRequest",
     "UpdateExampleRequest",
     "ExampleResponse",
+    "ExampleEnvelope",
+    "ExamplePage",
+    "ExamplePageEnvelope",
+    "ExampleStatsResponse",
 ]
@@ -37,6 +37,7 @@ class PaginatedResult(BaseModel, Generic[T]):
     page: int = Field(default=1)
     page_size: int = Field(default=10)
     total_pages: int = Field(default=0)
+    next_cursor: str | None = Field(default=None, description="Cursor da proxima pagina")
 
     @classmethod
     def create(
@@ -45,6 +46,7 @@ class PaginatedResult(BaseModel, Generic[T]):
         total: int,
         page: int,
         page_size: int,
+        next_cursor: str | None = None,
     ) -> PaginatedResult[T]:
         total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
         return cls(
@@ -53,6 +55,7 @@ class PaginatedResult(BaseModel, Generic[T]):
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
 
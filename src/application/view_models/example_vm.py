@@ -4,10 +4,16 @@ Example ViewModels - DTOs de request/response
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.application.view_models.base import ApiResponse, PaginatedResult
+
+# value vai para colunas int64 (sqlite INTEGER, numpy, journal)
+MAX_VALUE = 2**63 - 1
+
 
 # requests
 class CreateExampleRequest(BaseModel):
@@ -15,7 +21,7 @@ class CreateExampleRequest(BaseModel):
 
     name: str = Field(..., min_length=1, max_length=100)
     description: str = Field(default="", max_length=500)
-    value: int = Field(default=0, ge=0)
+    value: int = Field(default=0, ge=0, le=MAX_VALUE)
 
 
 class UpdateExampleRequest(BaseModel):
@@ -23,15 +29,38 @@ class UpdateExampleRequest(BaseModel):
 
     name: str | None = Field(default=None, min_length=1, max_length=100)
     description: str | None = Field(default=None, max_length=500)
-    value: int | None = Field(default=None, ge=0)
+    value: int | None = Field(default=None, ge=0, le=MAX_VALUE)
 
 
 # responses
-class ExampleResponse(BaseModel):
-    """response de exemplo"""
+@dataclass(slots=True)
+class ExampleResponse:
+    """response de exemplo
+
+    dataclass (nao BaseModel): montado direto da entidade ja valida, sem validacao
+    por campo; dentro do envelope serializa pelo schema do pydantic igual a um modelo
+    """
 
     id: UUID
     name: str
     description: str
     value: int
     status: str
+    version: int
+
+
+class ExampleStatsResponse(BaseModel):
+    """agregados dos exemplos vivos"""
+
+    total: int
+    value_sum: int
+    value_avg: float | None
+    value_min: int | None
+    value_max: int | None
+    by_status: dict[str, int]
+
+
+# genericos ja parametrizados: serializam pelo schema exato (sem inferir tipo por valor)
+ExampleEnvelope = ApiResponse[ExampleResponse]
+ExamplePage = PaginatedResult[ExampleResponse]
+ExamplePageEnvelope = ApiResponse[ExamplePage]
@@ -3,10 +3,37 @@ from src.core.either import Either, Left, Right, bind, map_right, match
 from src.core.error_result import ErrorResult, ValidationBuilder
 from src.core.logger import debug, error, get_logger, info, logger, setup_logger, warning
 from src.core.option import Nothing, Option, Some, from_nullable, get_or_default
-from src.core.pipe import AsyncPipe, Pipe, async_pipe, pipe
-from src.core.railway import tap, tap_async, then, then_async, try_catch, try_catch_async
+from src.core.pipe import (
+    AsyncPipe,
+    AsyncPipeline,
+    Pipe,
+    Pipeline,
+    async_pipe,
+    async_pipeline,
+    pipe,
+    pipeline,
+)
+from src.core.railway import (
+    combine_all_async,
+    tap,
+    tap_async,
+    then,
+    then_async,
+    traverse_async,
+    try_catch,
+    try_catch_async,
+    validate_async,
+)
 from src.core.result import Failure, Result, Success, failure, success
-from src.core.specification import AndSpec, NotSpec, OrSpec, Specification
+from src.core.single_flight import FlightStats, SingleFlight
+from src.core.specification import (
+    AndSpec,
+    CompiledSpec,
+    FieldSpec,
+    NotSpec,
+    OrSpec,
+    Specification,
+)
 from src.core.try_monad import Try, TryFailure, TrySuccess, to_either, try_of, try_of_async
 
 __all__ = [
@@ -31,6 +58,8 @@ __all__ = [
     "AndSpec",
     "OrSpec",
     "NotSpec",
+    "CompiledSpec",
+    "FieldSpec",
     # Railway
     "then",
     "then_async",
@@ -38,17 +67,27 @@ __all__ = [
     "tap_async",
     "try_catch",
     "try_catch_async",
+    "traverse_async",
+    "validate_async",
+    "combine_all_async",
     # Pipe
     "Pipe",
     "AsyncPipe",
     "pipe",
     "async_pipe",
+    "Pipeline",
+    "pipeline",
+    "AsyncPipeline",
+    "async_pipeline",
     # Result
     "Result",
     "Success",
     "Failure",
     "success",
     "failure",
+    # Single flight
+    "SingleFlight",
+    "FlightStats",
     # Try
     "Try",
     "TrySuccess",
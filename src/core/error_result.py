@@ -6,6 +6,7 @@ Representa diferentes tipos de erros com mensagens e categorias.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 
@@ -19,6 +20,7 @@ class ErrorResult:
     is_exception: bool = False
     is_unauthorized: bool = False
     is_forbidden: bool = False
+    is_conflict: bool = False
 
     @classmethod
     def validation(cls, msg: str) -> ErrorResult:
@@ -55,6 +57,25 @@ class ErrorResult:
         """sem permissao (403)"""
         return cls(messages=(msg,), is_forbidden=True)
 
+    @classmethod
+    def conflict(cls, msg: str = "Conflito de versao") -> ErrorResult:
+        """estado mudou desde a leitura (409)"""
+        return cls(messages=(msg,), is_conflict=True)
+
+    @classmethod
+    def merge(cls, errors: Iterable[ErrorResult]) -> ErrorResult:
+        """junta varios erros num so (mensagens em ordem, categorias somadas)"""
+        items = list(errors)
+        return cls(
+            messages=tuple(m for e in items for m in e.messages),
+            is_validation=any(e.is_validation for e in items),
+            is_not_found=any(e.is_not_found for e in items),
+            is_exception=any(e.is_exception for e in items),
+            is_unauthorized=any(e.is_unauthorized for e in items),
+            is_forbidden=any(e.is_forbidden for e in items),
+            is_conflict=any(e.is_conflict for e in items),
+        )
+
     @property
     def http_status(self) -> int:
         """retorna status http correspondente"""
@@ -66,6 +87,8 @@ class ErrorResult:
             return 403
         if self.is_not_found:
             return 404
+        if self.is_conflict:
+            return 409
         return 500
 
     @property
@@ -0,0 +1,84 @@
+"""
+Filters - AST de filtro para empurrar Specifications ate o repositorio
+
+Specifications traduziveis viram Filter; cada repositorio resolve o Filter
+do seu jeito (indices em memoria, WHERE no SQL).
+"""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Callable
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Literal
+
+Op = Literal["eq", "ne", "gt", "ge", "lt", "le"]
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Compare:
+    """campo <op> valor"""
+
+    field: str
+    op: Op
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class AllOf:
+    """todos os filtros (AND)"""
+
+    items: tuple[Filter, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class AnyOf:
+    """algum dos filtros (OR)"""
+
+    items: tuple[Filter, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Negate:
+    """nega o filtro (NOT)"""
+
+    item: Filter
+
+
+Filter = Compare | AllOf | AnyOf | Negate
+
+
+# min <= campo <= max
+def between(field: str, min_val: Any, max_val: Any) -> Filter:
+    return AllOf((Compare(field, "ge", min_val), Compare(field, "le", max_val)))
+
+
+# lista plana de condicoes do AND raiz (pra escolher indice)
+def conjuncts(f: Filter) -> list[Filter]:
+    if isinstance(f, AllOf):
+        return [c for item in f.items for c in conjuncts(item)]
+    return [f]
+
+
+# converte filtro em predicado python (fallback e checagem residual)
+def to_predicate(f: Filter) -> Callable[[Any], bool]:
+    if isinstance(f, Compare):
+        get, op, value = attrgetter(f.field), OPERATORS[f.op], f.value
+        return lambda entity: op(get(entity), value)
+    if isinstance(f, Negate):
+        inner = to_predicate(f.item)
+        return lambda entity: not inner(entity)
+    preds = tuple(to_predicate(item) for item in f.items)
+    if isinstance(f, AllOf):
+        return lambda entity: all(p(entity) for p in preds)
+    return lambda entity: any(p(entity) for p in preds)
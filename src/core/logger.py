@@ -4,10 +4,16 @@ Logger - handler universal com cores
 
 from __future__ import annotations
 
+import json
 import logging
+import queue
 import sys
-from datetime import datetime
-from typing import Literal
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Literal
 
 try:
     from colorama import Fore, Style, init
@@ -32,24 +38,57 @@ DIM = Style.DIM if COLORAMA_AVAILABLE else ""
 BRIGHT = Style.BRIGHT if COLORAMA_AVAILABLE else ""
 
 
+class TimestampCache:
+    """formata o timestamp uma vez por segundo (records do mesmo segundo reusam)"""
+
+    __slots__ = ("_fmt", "_last")
+
+    def __init__(self, fmt: str):
+        self._fmt = fmt
+        self._last: tuple[int, str] = (-1, "")
+
+    def format(self, created: float) -> str:
+        second = int(created)
+        last = self._last
+        if last[0] == second:
+            return last[1]
+        text = time.strftime(self._fmt, time.localtime(second))
+        # tupla trocada de uma vez, segura entre threads
+        self._last = (second, text)
+        return text
+
+
+# nome curto do modulo com padding, calculado uma vez por logger
+@lru_cache(maxsize=1024)
+def module_label(name: str) -> str:
+    return name.rsplit(".", 1)[-1][:15].ljust(15)
+
+
+# nivel com padding, calculado uma vez
+LEVEL_LABELS = {name: name.ljust(8) for name in LEVEL_COLORS}
+
+
+def level_label(levelname: str) -> str:
+    return LEVEL_LABELS.get(levelname) or levelname.ljust(8)
+
+
 class ColoredFormatter(logging.Formatter):
     """formatter com cores"""
 
     def __init__(self, fmt: str | None = None, datefmt: str | None = None):
         super().__init__(fmt, datefmt)
+        self._timestamps = TimestampCache("%H:%M:%S")
 
     def format(self, record: logging.LogRecord) -> str:
         # cor do nivel
         level_color = LEVEL_COLORS.get(record.levelname, "")
 
-        # formata timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-
-        # formata nome do modulo (curto)
-        module = record.name.split(".")[-1][:15].ljust(15)
+        # timestamp e modulo vem de cache
+        timestamp = self._timestamps.format(record.created)
+        module = module_label(record.name)
 
         # monta mensagem
-        level = record.levelname.ljust(8)
+        level = level_label(record.levelname)
         msg = record.getMessage()
 
         # adiciona exception se houver
@@ -62,9 +101,13 @@ class ColoredFormatter(logging.Formatter):
 class SimpleFormatter(logging.Formatter):
     """formatter simples sem cores (para arquivos)"""
 
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt, datefmt)
+        self._timestamps = TimestampCache("%Y-%m-%d %H:%M:%S")
+
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        level = record.levelname.ljust(8)
+        timestamp = self._timestamps.format(record.created)
+        level = level_label(record.levelname)
         module = record.name
         msg = record.getMessage()
 
@@ -74,30 +117,272 @@ class SimpleFormatter(logging.Formatter):
         return f"{timestamp} {level} {module} - {msg}"
 
 
+class JsonFormatter(logging.Formatter):
+    """formatter estruturado, um objeto json por linha"""
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt, datefmt)
+        self._timestamps = TimestampCache("%Y-%m-%dT%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": f"{self._timestamps.format(record.created)}.{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """token bucket por call site (logger, nivel, template da mensagem)
+
+    vai nos handlers, entao pega tambem records propagados de loggers filhos; o mesmo
+    filtro em varios handlers decide uma vez por record. record que passa depois de
+    supressao leva "(suppressed N similar messages)"; supressao sem record seguinte
+    (rajada e depois silencio) sai como record proprio via summaries()
+    """
+
+    def __init__(self, rate: float, burst: int = 10, max_keys: int = 4096):
+        super().__init__()
+        self._rate = rate
+        self._burst = float(burst)
+        self._max_keys = max_keys
+        # chave -> [tokens, ultimo refill, suprimidos, args do ultimo suprimido], ordem LRU
+        self._buckets: OrderedDict[tuple[str, int, str], list[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # decisao gravada no record (proximo handler reusa em vez de gastar outro token)
+        self._mark = f"_rate_limited_{id(self)}"
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        decided = record.__dict__.get(self._mark)
+        if decided is None:
+            decided = self._allow(record)
+            record.__dict__[self._mark] = decided
+        return decided
+
+    def summaries(self) -> list[logging.LogRecord]:
+        """um record por call site com supressao ainda nao reportada (zera as contagens)"""
+        records = []
+        with self._lock:
+            for (name, levelno, msg), bucket in self._buckets.items():
+                if not bucket[2]:
+                    continue
+                record = logging.makeLogRecord(
+                    {
+                        "name": name,
+                        "levelno": levelno,
+                        "levelname": logging.getLevelName(levelno),
+                        "msg": f"{msg} (suppressed {int(bucket[2])} similar messages)",
+                        "args": bucket[3],
+                    }
+                )
+                # resumo nao passa pelo bucket de novo
+                record.__dict__[self._mark] = True
+                records.append(record)
+                bucket[2] = 0
+        return records
+
+    def _allow(self, record: logging.LogRecord) -> bool:
+        # msg pode ser qualquer objeto (dict, excecao): chave pelo texto, sempre hashable
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                # descarta a chave usada ha mais tempo pra manter memoria limitada
+                if len(self._buckets) >= self._max_keys:
+                    self._buckets.popitem(last=False)
+                bucket = self._buckets[key] = [self._burst, now, 0, None]
+            else:
+                self._buckets.move_to_end(key)
+
+            tokens = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                bucket[2] += 1
+                bucket[3] = record.args
+                return False
+
+            bucket[0] = tokens - 1
+            suppressed = int(bucket[2])
+            bucket[2] = 0
+
+        if suppressed:
+            record.msg = f"{record.msg} (suppressed {suppressed} similar messages)"
+        return True
+
+
+class RateLimitSummaries(threading.Thread):
+    """emite os resumos pendentes do filtro a cada intervalo (e no stop)"""
+
+    def __init__(self, logger: logging.Logger, rate_filter: RateLimitFilter, interval: float):
+        super().__init__(name=f"log-summaries-{logger.name}", daemon=True)
+        self._logger = logger
+        self._filter = rate_filter
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """manda os resumos pendentes pelos handlers do logger"""
+        for record in self._filter.summaries():
+            self._logger.handle(record)
+
+    def stop(self) -> None:
+        """para a thread e emite o que ainda estiver pendente"""
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+        self.flush()
+
+
+Overflow = Literal["drop", "block"]
+
+
+class BoundedQueueHandler(QueueHandler):
+    """enfileira records numa fila limitada, descarta ou bloqueia quando cheia"""
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord], overflow: Overflow = "drop"):
+        super().__init__(log_queue)
+        self._block = overflow == "block"
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self._block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BoundedQueueListener(QueueListener):
+    """listener que espera espaco na fila pra enfileirar o sentinel no stop"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+# listeners ativos por nome de logger (modo fila)
+_listeners: dict[str, QueueListener] = {}
+
+# threads de resumo do rate limit por nome de logger
+_summaries: dict[str, RateLimitSummaries] = {}
+
+
 def setup_logger(
     name: str = "app",
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO",
     log_file: str | None = None,
+    *,
+    use_queue: bool = False,
+    queue_size: int = 10_000,
+    overflow: Overflow = "drop",
+    json_format: bool = False,
+    rate_limit: float | None = None,
+    rate_burst: int = 10,
+    rate_summary_interval: float = 10.0,
 ) -> logging.Logger:
-    """configura e retorna logger"""
+    """configura e retorna logger (use_queue tira o I/O da thread que loga)"""
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level))
+    _stop_summaries(name)
+    _stop_listener(name, reattach=False)
     logger.handlers.clear()
 
+    # rate limit por call site (mensagens/s), nos handlers: antes de formatar/enfileirar
+    rate_filter = RateLimitFilter(rate_limit, rate_burst) if rate_limit is not None else None
+    if rate_filter is not None:
+        summaries = RateLimitSummaries(logger, rate_filter, rate_summary_interval)
+        summaries.start()
+        _summaries[name] = summaries
+
     # console handler (com cores)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(ColoredFormatter())
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(JsonFormatter() if json_format else ColoredFormatter())
+    handlers: list[logging.Handler] = [console_handler]
 
     # file handler (sem cores)
     if log_file:
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(SimpleFormatter())
-        logger.addHandler(file_handler)
-
+        file_handler.setFormatter(JsonFormatter() if json_format else SimpleFormatter())
+        handlers.append(file_handler)
+
+    if not use_queue:
+        for handler in handlers:
+            if rate_filter is not None:
+                handler.addFilter(rate_filter)
+            logger.addHandler(handler)
+        return logger
+
+    # modo fila: logger so enfileira, thread do listener faz o I/O
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    queue_handler = BoundedQueueHandler(log_queue, overflow)
+    if rate_filter is not None:
+        queue_handler.addFilter(rate_filter)
+    logger.addHandler(queue_handler)
+    listener = _BoundedQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
     return logger
 
 
+def dropped_records(name: str = "app") -> int:
+    """quantidade de records descartados por fila cheia"""
+    return sum(
+        h.dropped for h in logging.getLogger(name).handlers if isinstance(h, BoundedQueueHandler)
+    )
+
+
+def shutdown_logging() -> None:
+    """esvazia as filas e para os listeners (chamar no shutdown)
+
+    o logger volta a escrever direto nos handlers: logs do teardown depois daqui
+    nao ficam numa fila sem consumidor. resumos de supressao pendentes saem antes
+    """
+    for name in list(_summaries):
+        _stop_summaries(name)
+    for name in list(_listeners):
+        _stop_listener(name, reattach=True)
+
+
+# para a thread de resumos do logger, emitindo o que estiver pendente
+def _stop_summaries(name: str) -> None:
+    summaries = _summaries.pop(name, None)
+    if summaries is not None:
+        summaries.stop()
+
+
+# para o listener e tira a fila do logger; handlers voltam pro logger ou sao fechados
+def _stop_listener(name: str, reattach: bool) -> None:
+    listener = _listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    logger = logging.getLogger(name)
+    queue_handlers = [h for h in logger.handlers if isinstance(h, BoundedQueueHandler)]
+    for handler in queue_handlers:
+        logger.removeHandler(handler)
+    # rate limit estava na fila, passa para os handlers reanexados
+    rate_filters = [f for h in queue_handlers for f in h.filters if isinstance(f, RateLimitFilter)]
+    for handler in listener.handlers:
+        if reattach:
+            for rate_filter in rate_filters:
+                handler.addFilter(rate_filter)
+            logger.addHandler(handler)
+        else:
+            handler.close()
+
+
 def get_logger(name: str = "app") -> logging.Logger:
     """retorna logger existente ou cria novo"""
     logger = logging.getLogger(name)
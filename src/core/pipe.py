@@ -6,11 +6,24 @@ Permite compor funcoes de forma fluente e legivel.
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
-from typing import Generic, TypeVar
+import asyncio
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from functools import partial
+from typing import Any, Generic, TypeVar
 
+E = TypeVar("E")
 T = TypeVar("T")
 R = TypeVar("R")
+U = TypeVar("U")
 
 
 class Pipe(Generic[T]):
@@ -81,12 +94,252 @@ class AsyncPipe(Generic[T]):
         f(self._value)
         return self
 
+    def lazy(self) -> AsyncPipeline[T, T]:
+        """passa a gravar as etapas; executa todas num unico await"""
+        return AsyncPipeline(source=self._value)
+
     @property
     def value(self) -> T:
         """retorna o valor"""
         return self._value
 
 
+# etapa de um pipeline: (tipo, funcoes/valores da etapa)
+Stage = tuple[str, tuple[Any, ...]]
+
+
+class Pipeline(Generic[T, R]):
+    """pipeline definido uma vez e aplicado a muitos valores
+
+    cada etapa devolve um Pipeline novo (imutavel, pode ser reaproveitado como prefixo);
+    compile gera uma funcao unica com todas as etapas, sem Pipe por valor nem
+    chamada por etapa alem das funcoes do usuario
+    """
+
+    __slots__ = ("_stages", "_compiled")
+
+    def __init__(self, stages: tuple[Stage, ...] = ()):
+        self._stages = stages
+        self._compiled: Callable[[T], R] | None = None
+
+    def map(self, f: Callable[[R], U]) -> Pipeline[T, U]:
+        """transforma o valor"""
+        return Pipeline(self._stages + (("map", (f,)),))
+
+    def tap(self, f: Callable[[R], None]) -> Pipeline[T, R]:
+        """executa side effect sem alterar o valor"""
+        return Pipeline(self._stages + (("tap", (f,)),))
+
+    def when(self, condition: bool, f: Callable[[R], R]) -> Pipeline[T, R]:
+        """aplica funcao se condicao for True (decidido ao montar)"""
+        return self.map(f) if condition else self
+
+    def when_pred(self, predicate: Callable[[R], bool], f: Callable[[R], R]) -> Pipeline[T, R]:
+        """aplica funcao se predicado for True"""
+        return Pipeline(self._stages + (("when_pred", (predicate, f)),))
+
+    def unless(self, condition: bool, f: Callable[[R], R]) -> Pipeline[T, R]:
+        """aplica funcao se condicao for False (decidido ao montar)"""
+        return self.map(f) if not condition else self
+
+    def filter(self, predicate: Callable[[R], bool], default: R) -> Pipeline[T, R]:
+        """troca por default se predicado for False"""
+        return Pipeline(self._stages + (("filter", (predicate, default)),))
+
+    def compile(self) -> Callable[[T], R]:
+        """funcao unica do pipeline (gerada uma vez)"""
+        if self._compiled is None:
+            self._compiled = build_pipeline(self._stages)
+        return self._compiled
+
+    def __call__(self, value: T) -> R:
+        return self.compile()(value)
+
+    def stream(self, values: Iterable[T]) -> Iterator[R]:
+        """aplica em cada valor sob demanda (map em C, memoria constante)"""
+        return map(self.compile(), values)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        return f"Pipeline({', '.join(kind for kind, _ in self._stages)})"
+
+
+# AsyncPipeline sem valor ligado (so roda via __call__)
+UNBOUND = object()
+
+
+class AsyncPipeline(Generic[T, R]):
+    """pipeline async preguicoso: grava as etapas e roda tudo num unico await
+
+    definido uma vez (async_pipeline()) e chamado por valor, ou ligado a um valor
+    (AsyncPipe.lazy()) e aguardado direto. map_concurrent espalha uma etapa async
+    pelos itens de uma colecao com limite de concorrencia; stream roda o pipeline
+    em cada item de um iterable (sync ou async) sob demanda
+    """
+
+    __slots__ = ("_stages", "_source", "_compiled")
+
+    def __init__(self, stages: tuple[Stage, ...] = (), source: Any = UNBOUND):
+        self._stages = stages
+        self._source = source
+        self._compiled: Callable[[T], Awaitable[R]] | None = None
+
+    def map(self, f: Callable[[R], U]) -> AsyncPipeline[T, U]:
+        """transforma o valor de forma sync"""
+        return self._extend("map", f)
+
+    def map_async(self, f: Callable[[R], Awaitable[U]]) -> AsyncPipeline[T, U]:
+        """transforma o valor de forma async"""
+        return self._extend("map_async", f)
+
+    def tap(self, f: Callable[[R], None]) -> AsyncPipeline[T, R]:
+        """executa side effect sync sem alterar o valor"""
+        return self._extend("tap", f)
+
+    def tap_async(self, f: Callable[[R], Awaitable[None]]) -> AsyncPipeline[T, R]:
+        """executa side effect async sem alterar o valor"""
+        return self._extend("tap_async", f)
+
+    def when_pred(self, predicate: Callable[[R], bool], f: Callable[[R], R]) -> AsyncPipeline[T, R]:
+        """aplica funcao se predicado for True"""
+        return self._extend("when_pred", predicate, f)
+
+    def filter(self, predicate: Callable[[R], bool], default: R) -> AsyncPipeline[T, R]:
+        """troca por default se predicado for False"""
+        return self._extend("filter", predicate, default)
+
+    def map_concurrent(
+        self: AsyncPipeline[T, Iterable[E]] | AsyncPipeline[T, AsyncIterable[E]],
+        f: Callable[[E], Awaitable[U]],
+        limit: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncPipeline[T, list[U]]:
+        """aplica f em cada item do valor com ate limit em voo (None = todos)
+
+        ordered=True devolve na ordem dos itens; False na ordem em que terminam
+        """
+        check_limit(limit)
+        return self._extend("map_concurrent", partial(collect, f=f, limit=limit, ordered=ordered))
+
+    def compile(self) -> Callable[[T], Awaitable[R]]:
+        """funcao async unica do pipeline (gerada uma vez)"""
+        if self._compiled is None:
+            self._compiled = build_pipeline(self._stages, is_async=True)
+        return self._compiled
+
+    def __call__(self, value: T) -> Awaitable[R]:
+        return self.compile()(value)
+
+    def __await__(self) -> Generator[Any, None, R]:
+        if self._source is UNBOUND:
+            raise TypeError("AsyncPipeline sem valor: chame com o valor ou use AsyncPipe.lazy()")
+        return self.compile()(self._source).__await__()  # type: ignore
+
+    def stream(
+        self, values: Iterable[T] | AsyncIterable[T], limit: int = 1, ordered: bool = True
+    ) -> AsyncIterator[R]:
+        """roda o pipeline em cada valor sob demanda, ate limit valores em voo"""
+        check_limit(limit)
+        return fan_out(values, self.compile(), limit, ordered)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        return f"AsyncPipeline({', '.join(kind for kind, _ in self._stages)})"
+
+    def _extend(self, kind: str, *args: Any) -> AsyncPipeline[Any, Any]:
+        return AsyncPipeline(self._stages + ((kind, args),), self._source)
+
+
+# limit menor que 1 nunca agendaria nada e descartaria os itens em silencio
+def check_limit(limit: int | None) -> None:
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit deve ser >= 1 ou None, recebido {limit}")
+
+
+# roda f em cada item com ate limit em voo (None = todos), le a fonte sob demanda;
+# ordered segura os resultados numa janela de limit itens, sem ordem nao espera o mais lento
+async def fan_out(
+    values: Iterable[T] | AsyncIterable[T],
+    f: Callable[[T], Awaitable[R]],
+    limit: int | None,
+    ordered: bool,
+) -> AsyncIterator[R]:
+    check_limit(limit)
+    items = aiter(values) if isinstance(values, AsyncIterable) else iter_async(values)
+    inflight: deque[asyncio.Task[R]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and (limit is None or len(inflight) < limit):
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                inflight.append(asyncio.ensure_future(f(item)))
+            if not inflight:
+                return
+            if ordered:
+                yield await inflight.popleft()
+                continue
+            done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                inflight.remove(task)
+                yield task.result()
+    finally:
+        # excecao, consumidor que parou antes do fim ou cancelamento: ninguem fica rodando
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+
+
+async def iter_async(values: Iterable[T]) -> AsyncIterator[T]:
+    for value in values:
+        yield value
+
+
+async def collect(
+    values: Iterable[T] | AsyncIterable[T],
+    f: Callable[[T], Awaitable[R]],
+    limit: int | None,
+    ordered: bool,
+) -> list[R]:
+    return [r async for r in fan_out(values, f, limit, ordered)]
+
+
+# codigo de cada etapa no corpo da funcao gerada (i = indice da etapa)
+STAGE_CODE = {
+    "map": "    v = f{i}(v)",
+    "tap": "    f{i}(v)",
+    "when_pred": "    if p{i}(v):\n        v = f{i}(v)",
+    "filter": "    if not p{i}(v):\n        v = d{i}",
+    "map_async": "    v = await f{i}(v)",
+    "tap_async": "    await f{i}(v)",
+    "map_concurrent": "    v = await f{i}(v)",
+}
+
+
+# gera uma funcao unica pro pipeline inteiro (mesma ideia de build_predicate)
+def build_pipeline(stages: tuple[Stage, ...], is_async: bool = False) -> Callable[[Any], Any]:
+    namespace: dict[str, Any] = {}
+    lines = ["async def run(v):" if is_async else "def run(v):"]
+    for i, (kind, args) in enumerate(stages):
+        if kind == "when_pred":
+            namespace[f"p{i}"], namespace[f"f{i}"] = args
+        elif kind == "filter":
+            namespace[f"p{i}"], namespace[f"d{i}"] = args
+        else:
+            namespace[f"f{i}"] = args[0]
+        lines.append(STAGE_CODE[kind].format(i=i))
+    lines.append("    return v")
+    exec("\n".join(lines), namespace)
+    return namespace["run"]
+
+
 # funcoes helper para criar pipes
 def pipe(value: T) -> Pipe[T]:
     """cria um Pipe com o valor"""
@@ -96,3 +349,13 @@ def pipe(value: T) -> Pipe[T]:
 def async_pipe(value: T) -> AsyncPipe[T]:
     """cria um AsyncPipe com o valor"""
     return AsyncPipe(value)
+
+
+def pipeline() -> Pipeline[Any, Any]:
+    """cria um Pipeline vazio (identidade) para montar etapas"""
+    return Pipeline()
+
+
+def async_pipeline() -> AsyncPipeline[Any, Any]:
+    """cria um AsyncPipeline vazio (identidade) para montar etapas"""
+    return AsyncPipeline()
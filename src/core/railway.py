@@ -6,10 +6,13 @@ Encadeamento de operacoes onde qualquer falha "desvia" para a trilha de erro.
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
 from typing import TypeVar
 
 from src.core.either import Either, Left, Right
+from src.core.error_result import ErrorResult
 
 L = TypeVar("L")
 R = TypeVar("R")
@@ -97,6 +100,104 @@ def combine_all(
     return Right(tuple(results))
 
 
+# Left que encerra o traverse: sobe pelo gather e cancela os irmaos
+class _ShortCircuit(Exception):
+    def __init__(self, left: Left) -> None:
+        self.left = left
+
+
+# roda f em cada item com ate limit em voo; fail_fast para no primeiro Left
+async def _run_all(
+    items: Iterable[T],
+    f: Callable[[T], Awaitable[Either[L, R]]],
+    limit: int | None,
+    fail_fast: bool,
+) -> list[Either[L, R]]:
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit deve ser >= 1 ou None, recebido {limit}")
+    pending = list(items)
+    results: list[Either[L, R]] = [None] * len(pending)  # type: ignore
+    # workers puxam do mesmo iterador: so limit corrotinas existem por vez
+    feed = iter(enumerate(pending))
+
+    async def worker() -> None:
+        for i, item in feed:
+            result = await f(item)
+            if fail_fast and isinstance(result, Left):
+                raise _ShortCircuit(result)
+            results[i] = result
+
+    size = len(pending) if limit is None else min(limit, len(pending))
+    workers = [asyncio.create_task(worker()) for _ in range(size)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        # Left, excecao ou cancelamento de quem chamou: ninguem fica rodando
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    return results
+
+
+# executa funcao async em cada item, concorrente e limitada
+async def traverse_async(
+    items: Iterable[T],
+    f: Callable[[T], Awaitable[Either[L, R]]],
+    limit: int | None = None,
+) -> Either[L, list[R]]:
+    """aplica f em todos os itens com ate limit em voo (None = todos)
+
+    o primeiro Left (por ordem de chegada) cancela o que ainda roda e e retornado;
+    sem Left, os valores voltam na ordem dos itens
+    """
+    try:
+        results = await _run_all(items, f, limit, fail_fast=True)
+    except _ShortCircuit as stop:
+        return stop.left
+    return Right([r.value for r in results])
+
+
+# valida todos os itens concorrentemente, acumulando os erros
+async def validate_async(
+    items: Iterable[T],
+    f: Callable[[T], Awaitable[Either[ErrorResult, R]]],
+    limit: int | None = None,
+) -> Either[ErrorResult, list[R]]:
+    """como traverse_async, mas roda todos e junta os Left num unico ErrorResult"""
+    results = await _run_all(items, f, limit, fail_fast=False)
+    errors = [r.value for r in results if isinstance(r, Left)]
+    if errors:
+        return Left(ErrorResult.merge(errors))
+    return Right([r.value for r in results])  # type: ignore
+
+
+# combina multiplos Eithers async
+async def combine_all_async(
+    *awaitables: Awaitable[Either[L, R]],
+    limit: int | None = None,
+) -> Either[L, tuple[R, ...]]:
+    """espera os awaitables (ate limit por vez) e combina como combine_all
+
+    no primeiro Left as corrotinas que nem comecaram sao fechadas sem rodar
+    """
+    try:
+        result = await traverse_async(awaitables, _await, limit)
+    finally:
+        for awaitable in awaitables:
+            if (
+                inspect.iscoroutine(awaitable)
+                and inspect.getcoroutinestate(awaitable) == inspect.CORO_CREATED
+            ):
+                awaitable.close()
+    if isinstance(result, Left):
+        return result  # type: ignore
+    return Right(tuple(result.value))
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
 # executa condicional
 def when(
     condition: bool,
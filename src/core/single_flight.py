@@ -0,0 +1,60 @@
+"""
+Single Flight - coalescencia de chamadas identicas concorrentes
+
+Chamadas com a mesma chave enquanto uma esta em voo esperam o mesmo
+resultado em vez de repetir o trabalho.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class FlightStats:
+    """contadores de coalescencia"""
+
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight(Generic[K]):
+    """compartilha uma execucao em voo entre chamadas com a mesma chave"""
+
+    __slots__ = ("_inflight", "stats")
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Future[Any]] = {}
+        self.stats = FlightStats()
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[T]]) -> T:
+        """executa fn ou espera a execucao em voo da mesma chave"""
+        self.stats.calls += 1
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.stats.executions += 1
+        else:
+            self.stats.coalesced += 1
+        # shield: cancelar um chamador nao cancela o trabalho dos outros
+        return await asyncio.shield(future)
+
+    def snapshot(self) -> dict[str, int]:
+        """contadores e chaves em voo"""
+        return {**asdict(self.stats), "inflight": len(self._inflight)}
+
+    def _forget(self, key: K, done: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
+        # marca o erro como lido mesmo se todos os chamadores foram cancelados
+        if not done.cancelled():
+            done.exception()
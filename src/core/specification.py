@@ -7,14 +7,72 @@ Permite compor regras de negocio de forma declarativa.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
 
 from src.core.either import Either, Left, Right
 from src.core.error_result import ErrorResult
+from src.core.filters import AllOf, AnyOf, Compare, Filter, Negate, between
+from src.core.option import Nothing, Option, Some
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 T = TypeVar("T")
 
+# mascara booleana do lote: ndarray[bool] com numpy, list[bool] sem
+Mask = Any
+
+
+# converte lista de bools para mascara
+def as_mask(values: list[bool]) -> Mask:
+    return np.array(values, dtype=bool) if NUMPY_AVAILABLE else values
+
+
+def mask_and(a: Mask, b: Mask) -> Mask:
+    return a & b if NUMPY_AVAILABLE else [x and y for x, y in zip(a, b, strict=True)]
+
+
+def mask_or(a: Mask, b: Mask) -> Mask:
+    return a | b if NUMPY_AVAILABLE else [x or y for x, y in zip(a, b, strict=True)]
+
+
+def mask_not(a: Mask) -> Mask:
+    return ~a if NUMPY_AVAILABLE else [not x for x in a]
+
+
+# coluna numerica como ndarray, None se nao der pra vetorizar
+def numeric_column(values: Sequence[Any]) -> Any | None:
+    if not NUMPY_AVAILABLE:
+        return None
+    try:
+        column = np.asarray(values)
+    except (OverflowError, ValueError):
+        return None
+    return column if column.dtype.kind in "iuf" else None
+
+
+# junta filtros dos filhos, Nothing se algum nao for traduzivel
+def join_filters(
+    options: Sequence[Option[Filter]], combine: Callable[[tuple[Filter, ...]], Filter]
+) -> Option[Filter]:
+    items: list[Filter] = []
+    for option in options:
+        if not isinstance(option, Some):
+            return Nothing()
+        items.append(option.value)
+    return Some(combine(tuple(items)))
+
+
+def negate_filter(option: Option[Filter]) -> Option[Filter]:
+    return Some(Negate(option.value)) if isinstance(option, Some) else Nothing()
+
 
 class Specification(ABC, Generic[T]):
     """classe base para specifications"""
@@ -60,6 +118,41 @@ class Specification(ABC, Generic[T]):
         """permite usar ~ para negar"""
         return self.not_()
 
+    def compile(self) -> CompiledSpec[T]:
+        """achata a arvore (and/or n-arios, sem dupla negacao) numa closure unica"""
+        return CompiledSpec(self)
+
+    def on(self, field: str) -> FieldSpec[Any]:
+        """aplica a spec num atributo da entidade (ex: ValueInRangeSpec(1, 9).on("value"))"""
+        return FieldSpec(field, self)
+
+    def batch_mask(self, entities: Sequence[T]) -> Mask:
+        """avalia o lote inteiro (folhas numericas sobrescrevem com versao vetorizada)"""
+        return as_mask([self.is_satisfied_by(e) for e in entities])
+
+    def mask(self, entities: Sequence[T]) -> list[bool]:
+        """retorna se cada entidade do lote satisfaz a spec"""
+        return list(map(bool, self.batch_mask(entities)))
+
+    def indices(self, entities: Sequence[T]) -> list[int]:
+        """retorna os indices das entidades que satisfazem"""
+        mask = self.batch_mask(entities)
+        if NUMPY_AVAILABLE:
+            return np.flatnonzero(mask).tolist()
+        return [i for i, ok in enumerate(mask) if ok]
+
+    def filter_many(self, entities: Sequence[T]) -> list[T]:
+        """retorna so as entidades que satisfazem, avaliando cada folha uma vez no lote"""
+        return [entities[i] for i in self.indices(entities)]
+
+    def to_filter(self) -> Option[Filter]:
+        """traduz para filtro de repositorio (Nothing = so avaliavel em python)"""
+        return Nothing()
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        """traduz a spec aplicada num campo (usado por FieldSpec)"""
+        return Nothing()
+
 
 @dataclass
 class AndSpec(Specification[T]):
@@ -71,6 +164,15 @@ class AndSpec(Specification[T]):
     def is_satisfied_by(self, entity: T) -> bool:
         return self.left.is_satisfied_by(entity) and self.right.is_satisfied_by(entity)
 
+    def batch_mask(self, entities: Sequence[T]) -> Mask:
+        return mask_and(self.left.batch_mask(entities), self.right.batch_mask(entities))
+
+    def to_filter(self) -> Option[Filter]:
+        return join_filters((self.left.to_filter(), self.right.to_filter()), AllOf)
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return join_filters((self.left.field_filter(field), self.right.field_filter(field)), AllOf)
+
     @property
     def error_message(self) -> str:
         # retorna erro do primeiro que falhar
@@ -103,6 +205,15 @@ class OrSpec(Specification[T]):
     def is_satisfied_by(self, entity: T) -> bool:
         return self.left.is_satisfied_by(entity) or self.right.is_satisfied_by(entity)
 
+    def batch_mask(self, entities: Sequence[T]) -> Mask:
+        return mask_or(self.left.batch_mask(entities), self.right.batch_mask(entities))
+
+    def to_filter(self) -> Option[Filter]:
+        return join_filters((self.left.to_filter(), self.right.to_filter()), AnyOf)
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return join_filters((self.left.field_filter(field), self.right.field_filter(field)), AnyOf)
+
     @property
     def error_message(self) -> str:
         return f"{self.left.error_message} ou {self.right.error_message}"
@@ -117,11 +228,163 @@ class NotSpec(Specification[T]):
     def is_satisfied_by(self, entity: T) -> bool:
         return not self.spec.is_satisfied_by(entity)
 
+    def batch_mask(self, entities: Sequence[T]) -> Mask:
+        return mask_not(self.spec.batch_mask(entities))
+
+    def to_filter(self) -> Option[Filter]:
+        return negate_filter(self.spec.to_filter())
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return negate_filter(self.spec.field_filter(field))
+
     @property
     def error_message(self) -> str:
         return f"Nao: {self.spec.error_message}"
 
 
+# arvore achatada: ("leaf", spec) | ("and", nodes) | ("or", nodes) | ("not", node)
+Node = tuple[str, Any]
+
+
+# achata AndSpec/OrSpec aninhados em nos n-arios e remove ~~
+def flatten(spec: Specification[Any]) -> Node:
+    if isinstance(spec, CompiledSpec):
+        return spec.node
+    if isinstance(spec, AndSpec | OrSpec):
+        kind = "and" if isinstance(spec, AndSpec) else "or"
+        children: list[Node] = []
+        for side in (spec.left, spec.right):
+            node = flatten(side)
+            children.extend(node[1] if node[0] == kind else (node,))
+        return (kind, tuple(children))
+    if isinstance(spec, NotSpec):
+        node = flatten(spec.spec)
+        return node[1] if node[0] == "not" else ("not", node)
+    return ("leaf", spec)
+
+
+# monta expressao python do no, folhas viram p0(e), p1(e), ...
+def node_expression(node: Node, leaves: list[Callable[[Any], bool]]) -> str:
+    kind, value = node
+    if kind == "leaf":
+        leaves.append(value.is_satisfied_by)
+        return f"p{len(leaves) - 1}(e)"
+    if kind == "not":
+        return f"(not {node_expression(value, leaves)})"
+    joiner = f" {kind} "
+    return f"({joiner.join(node_expression(child, leaves) for child in value)})"
+
+
+# gera uma funcao unica pro no inteiro (sem chamada por nivel da arvore)
+def build_predicate(node: Node) -> Callable[[Any], bool]:
+    if node[0] == "leaf":
+        return node[1].is_satisfied_by
+    leaves: list[Callable[[Any], bool]] = []
+    expression = node_expression(node, leaves)
+    namespace: dict[str, Any] = {f"p{i}": leaf for i, leaf in enumerate(leaves)}
+    exec(f"def predicate(e):\n    return {expression}", namespace)
+    return namespace["predicate"]
+
+
+# mensagem de erro de um no (mesma regra de AndSpec/OrSpec/NotSpec)
+def node_message(node: Node) -> str:
+    kind, value = node
+    if kind == "leaf":
+        return value.error_message
+    if kind == "not":
+        return f"Nao: {node_message(value)}"
+    if kind == "and":
+        return node_message(value[0])
+    return " ou ".join(node_message(child) for child in value)
+
+
+# avalia o no no lote inteiro, cada folha uma vez
+def node_mask(node: Node, entities: Sequence[Any]) -> Mask:
+    kind, value = node
+    if kind == "leaf":
+        return value.batch_mask(entities)
+    if kind == "not":
+        return mask_not(node_mask(value, entities))
+    combine = mask_and if kind == "and" else mask_or
+    result = node_mask(value[0], entities)
+    for child in value[1:]:
+        result = combine(result, node_mask(child, entities))
+    return result
+
+
+# traduz o no para filtro, folhas via translate
+def node_filter(node: Node, translate: Callable[[Any], Option[Filter]]) -> Option[Filter]:
+    kind, value = node
+    if kind == "leaf":
+        return translate(value)
+    if kind == "not":
+        return negate_filter(node_filter(value, translate))
+    combine = AllOf if kind == "and" else AnyOf
+    return join_filters([node_filter(child, translate) for child in value], combine)
+
+
+class CompiledSpec(Specification[T]):
+    """spec compilada: avaliacao em uma closure, validate acumula erros do and raiz"""
+
+    __slots__ = ("node", "_predicate", "_checks")
+
+    def __init__(self, spec: Specification[T]):
+        self.node = flatten(spec)
+        self._predicate = build_predicate(self.node)
+        # filhos do and raiz, avaliados so quando a validacao falha
+        children = self.node[1] if self.node[0] == "and" else (self.node,)
+        self._checks = tuple((build_predicate(child), child) for child in children)
+
+    def is_satisfied_by(self, entity: T) -> bool:
+        return self._predicate(entity)
+
+    @property
+    def error_message(self) -> str:
+        return node_message(self.node)
+
+    def validate(self, entity: T) -> Either[ErrorResult, T]:
+        """valida com fast path, acumula erros de todos os filhos que falham"""
+        if self._predicate(entity):
+            return Right(entity)
+        errors = [node_message(child) for check, child in self._checks if not check(entity)]
+        return Left(ErrorResult.validation_list(errors))
+
+    def compile(self) -> CompiledSpec[T]:
+        return self
+
+    def batch_mask(self, entities: Sequence[T]) -> Mask:
+        return node_mask(self.node, entities)
+
+    def to_filter(self) -> Option[Filter]:
+        return node_filter(self.node, lambda spec: spec.to_filter())
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return node_filter(self.node, lambda spec: spec.field_filter(field))
+
+
+class FieldSpec(Specification[T]):
+    """aplica uma spec num atributo da entidade"""
+
+    def __init__(self, field: str, spec: Specification[Any]):
+        self.field = field
+        self.spec = spec
+        self._get = attrgetter(field)
+
+    def is_satisfied_by(self, entity: T) -> bool:
+        return self.spec.is_satisfied_by(self._get(entity))
+
+    @property
+    def error_message(self) -> str:
+        return self.spec.error_message
+
+    def batch_mask(self, entities: Sequence[T]) -> Mask:
+        # extrai a coluna uma vez e deixa a spec do campo vetorizar
+        return self.spec.batch_mask(list(map(self._get, entities)))
+
+    def to_filter(self) -> Option[Filter]:
+        return self.spec.field_filter(self.field)
+
+
 # specs utilitarias comuns
 class NotEmptySpec(Specification[str]):
     """valida se string nao esta vazia"""
@@ -176,6 +439,13 @@ class PositiveNumberSpec(Specification[int | float]):
     def is_satisfied_by(self, entity: int | float) -> bool:
         return entity > 0
 
+    def batch_mask(self, entities: Sequence[int | float]) -> Mask:
+        column = numeric_column(entities)
+        return column > 0 if column is not None else super().batch_mask(entities)
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return Some(Compare(field, "gt", 0))
+
     @property
     def error_message(self) -> str:
         return f"{self._field_name} deve ser positivo"
@@ -192,6 +462,15 @@ class InRangeSpec(Specification[int | float]):
     def is_satisfied_by(self, entity: int | float) -> bool:
         return self._min <= entity <= self._max
 
+    def batch_mask(self, entities: Sequence[int | float]) -> Mask:
+        column = numeric_column(entities)
+        if column is None:
+            return super().batch_mask(entities)
+        return (column >= self._min) & (column <= self._max)
+
+    def field_filter(self, field: str) -> Option[Filter]:
+        return Some(between(field, self._min, self._max))
+
     @property
     def error_message(self) -> str:
         return f"{self._field_name} deve estar entre {self._min} e {self._max}"
@@ -12,14 +12,14 @@ from uuid import UUID, uuid4
 Id = TypeVar("Id")
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity(Generic[Id]):
     """classe base para entidades"""
 
     id: Id
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditableEntity(Entity[Id]):
     """entidade com campos de auditoria"""
 
@@ -27,14 +27,17 @@ class AuditableEntity(Entity[Id]):
     updated_at: datetime | None = None
     created_by: str | None = None
     updated_by: str | None = None
+    # incrementa a cada alteracao (base do ETag)
+    version: int = 1
 
     def mark_updated(self, by: str | None = None) -> None:
         """marca entidade como atualizada"""
         self.updated_at = datetime.now(UTC)
         self.updated_by = by
+        self.version += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class SoftDeletableEntity(AuditableEntity[Id]):
     """entidade com soft delete"""
 
@@ -11,7 +11,7 @@ from src.domain.entities.base import AuditableEntity, generate_uuid
 from src.domain.enums import Status
 
 
-@dataclass
+@dataclass(slots=True)
 class Example(AuditableEntity[UUID]):
     """entidade de exemplo"""
 
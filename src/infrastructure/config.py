@@ -5,6 +5,7 @@ Config - Configuracoes da aplicacao
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,6 +30,34 @@ class Settings(BaseSettings):
 
     # database (exemplo)
     database_url: str = "sqlite:///./app.db"
+    database_pool_size: int = 4
+    # columnar: arrays numpy (requer extra perf)
+    repository_backend: Literal["memory", "sqlite", "columnar"] = "memory"
+    # retencao dos deletados no repositorio em memoria (None = nunca compacta)
+    deleted_retention_seconds: float | None = None
+    compaction_interval_seconds: float = 60.0
+    # journal do repositorio em memoria: log com fsync + snapshots (None = so memoria)
+    durability_dir: str | None = None
+    checkpoint_interval_seconds: float = 300.0
+    # write-behind: escritas respondem ao enfileirar, gravadas em lotes (ate N ou X segundos)
+    write_behind_enabled: bool = False
+    write_behind_max_batch: int = 500
+    write_behind_max_delay_seconds: float = 0.05
+
+    # cache de leitura por id (entidade + resposta serializada)
+    cache_enabled: bool = False
+    cache_max_size: int = 10_000
+    cache_ttl_seconds: float = 30.0
+
+    # logging (fila tira o I/O de log do event loop)
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    log_json: bool = False
+    log_use_queue: bool = False
+    log_queue_size: int = 10_000
+    log_queue_overflow: Literal["drop", "block"] = "drop"
+    log_rate_limit: float | None = None
+    log_rate_burst: int = 10
+    log_rate_summary_seconds: float = 10.0
 
     # cors
     cors_origins: list[str] = ["*"]
@@ -0,0 +1,65 @@
+"""
+Database - pool de conexoes SQLite fora do event loop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+SQLITE_PREFIX = "sqlite:///"
+
+
+def sqlite_path(database_url: str) -> str:
+    """extrai caminho do arquivo de uma url sqlite:///"""
+    if not database_url.startswith(SQLITE_PREFIX):
+        raise ValueError(f"database_url nao e sqlite: {database_url}")
+    return database_url[len(SQLITE_PREFIX) :]
+
+
+class SqlitePool:
+    """pool limitado de conexoes, cada chamada roda numa thread do pool"""
+
+    __slots__ = ("_connections", "_executor")
+
+    def __init__(self, path: str, size: int = 4):
+        # uma thread por conexao, entao get() nunca espera conexao presa
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="sqlite")
+        self._connections: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(self._connect(path))
+
+    async def run(self, f: Callable[[sqlite3.Connection], T]) -> T:
+        """executa f numa conexao do pool sem bloquear o event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.run_sync, f)
+
+    def run_sync(self, f: Callable[[sqlite3.Connection], T]) -> T:
+        """executa f numa conexao do pool dentro de uma transacao"""
+        conn = self._connections.get()
+        try:
+            with conn:
+                return f(conn)
+        finally:
+            self._connections.put(conn)
+
+    def close(self) -> None:
+        """espera operacoes pendentes e fecha as conexoes"""
+        self._executor.shutdown(wait=True)
+        while not self._connections.empty():
+            self._connections.get_nowait().close()
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        # statements ficam compilados no cache da conexao (sql constante = prepared)
+        conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
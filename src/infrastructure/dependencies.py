@@ -5,41 +5,160 @@ Dependencies - injecao de dependencias
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, TypeVar
+from uuid import UUID
 
 from fastapi import Depends
 
 from src.application.handlers.example_handler import ExampleHandler
-from src.application.services.example_service import ExampleService
+from src.application.services.example_service import ExampleRepository, ExampleService
+from src.core import SingleFlight
+from src.domain.entities.example import Example
 from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.database import SqlitePool, sqlite_path
+from src.infrastructure.repositories.cached_example_repository import CachedExampleRepository
+from src.infrastructure.repositories.columnar_example_repository import ColumnarExampleRepository
+from src.infrastructure.repositories.durable_example_repository import DurableExampleRepository
+from src.infrastructure.repositories.example_journal import ExampleJournal
 from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+from src.infrastructure.repositories.sqlite_example_repository import SqliteExampleRepository
+from src.infrastructure.repositories.write_behind_example_repository import (
+    WriteBehindExampleRepository,
+)
+from src.infrastructure.services.cache import LruTtlCache
 
+L = TypeVar("L")
 
-# repositorios (singleton)
+
+# cache de respostas serializadas por id, (etag, corpo) (None = cache desligado)
 @lru_cache
-def get_example_repository() -> InMemoryExampleRepository:
+def get_response_cache() -> LruTtlCache[UUID, tuple[str, bytes]] | None:
+    """retorna cache de respostas"""
+    settings = get_settings()
+    if not settings.cache_enabled:
+        return None
+    return LruTtlCache(settings.cache_max_size, settings.cache_ttl_seconds)
+
+
+# repositorios (singleton, backend escolhido pela config)
+@lru_cache
+def get_example_repository() -> ExampleRepository:
     """retorna repositorio"""
-    return InMemoryExampleRepository()
+    settings = get_settings()
+    repo: ExampleRepository
+    if settings.repository_backend == "sqlite":
+        pool = SqlitePool(sqlite_path(settings.database_url), settings.database_pool_size)
+        repo = SqliteExampleRepository(pool)
+    elif settings.repository_backend == "columnar":
+        repo = ColumnarExampleRepository()
+    elif settings.durability_dir:
+        repo = DurableExampleRepository.recover(ExampleJournal(settings.durability_dir))
+    else:
+        repo = InMemoryExampleRepository()
+
+    if settings.write_behind_enabled:
+        repo = WriteBehindExampleRepository(
+            repo, settings.write_behind_max_batch, settings.write_behind_max_delay_seconds
+        )
+    if not settings.cache_enabled:
+        return repo
+    cache: LruTtlCache[UUID, Example] = LruTtlCache(
+        settings.cache_max_size, settings.cache_ttl_seconds
+    )
+    responses = get_response_cache()
+    return CachedExampleRepository(repo, cache, (responses,) if responses else ())
+
+
+# decorators que envolvem o repositorio concreto (expoem inner)
+Decorator = CachedExampleRepository | WriteBehindExampleRepository | DurableExampleRepository
+
+
+# desembrulha decorators (cache, write-behind, journal) ate o repositorio concreto
+def base_repository(repo: ExampleRepository) -> ExampleRepository:
+    while isinstance(repo, Decorator):
+        repo = repo.inner
+    return repo
+
+
+# camada do tipo pedido na cadeia de decorators, se ligada
+def repository_layer(repo: ExampleRepository, layer: type[L]) -> L | None:
+    while not isinstance(repo, layer):
+        if not isinstance(repo, Decorator):
+            return None
+        repo = repo.inner
+    return repo
+
+
+# inicia tarefas de manutencao dos repositorios (chamado no startup)
+def start_repositories() -> None:
+    """liga a compactacao dos deletados e os checkpoints do journal quando configurados"""
+    settings = get_settings()
+    repo = base_repository(get_example_repository())
+    if isinstance(repo, InMemoryExampleRepository) and settings.deleted_retention_seconds:
+        repo.start_compaction(
+            settings.deleted_retention_seconds, settings.compaction_interval_seconds
+        )
+    durable = repository_layer(get_example_repository(), DurableExampleRepository)
+    if durable is not None:
+        durable.start_checkpoints(settings.checkpoint_interval_seconds)
+
+
+# grava o que o write-behind ainda tem na fila (chamado no shutdown, antes de fechar)
+async def drain_repositories() -> None:
+    """esvazia a fila de escritas pendentes"""
+    if get_example_repository.cache_info().currsize == 0:
+        return
+    write_behind = repository_layer(get_example_repository(), WriteBehindExampleRepository)
+    if write_behind is not None:
+        await write_behind.drain()
+
+
+# libera recursos dos repositorios (chamado no shutdown)
+def close_repositories() -> None:
+    """fecha conexoes abertas"""
+    if get_example_repository.cache_info().currsize == 0:
+        return
+    repo = base_repository(get_example_repository())
+    if isinstance(repo, SqliteExampleRepository):
+        repo.close()
+    elif isinstance(repo, InMemoryExampleRepository):
+        repo.stop_compaction()
+    durable = repository_layer(get_example_repository(), DurableExampleRepository)
+    if durable is not None:
+        durable.stop()
+    get_example_repository.cache_clear()
+    get_response_cache.cache_clear()
 
 
 # services
 def get_example_service(
-    repo: Annotated[InMemoryExampleRepository, Depends(get_example_repository)],
+    repo: Annotated[ExampleRepository, Depends(get_example_repository)],
 ) -> ExampleService:
     """retorna service"""
     return ExampleService(repo)
 
 
+# coalescencia de leituras (singleton, compartilhado entre requests)
+@lru_cache
+def get_single_flight() -> SingleFlight[object]:
+    """retorna single flight das queries"""
+    return SingleFlight()
+
+
 # handlers
 def get_example_handler(
     service: Annotated[ExampleService, Depends(get_example_service)],
+    flights: Annotated[SingleFlight[object], Depends(get_single_flight)],
 ) -> ExampleHandler:
     """retorna handler"""
-    return ExampleHandler(service)
+    return ExampleHandler(service, flights)
 
 
 # type aliases para DI
-ExampleRepoDep = Annotated[InMemoryExampleRepository, Depends(get_example_repository)]
+ExampleRepoDep = Annotated[ExampleRepository, Depends(get_example_repository)]
 ExampleServiceDep = Annotated[ExampleService, Depends(get_example_service)]
 ExampleHandlerDep = Annotated[ExampleHandler, Depends(get_example_handler)]
+ResponseCacheDep = Annotated[
+    LruTtlCache[UUID, tuple[str, bytes]] | None, Depends(get_response_cache)
+]
 SettingsDep = Annotated[Settings, Depends(get_settings)]
@@ -1,4 +1,20 @@
 # repositorios
+from src.infrastructure.repositories.cached_example_repository import CachedExampleRepository
+from src.infrastructure.repositories.columnar_example_repository import ColumnarExampleRepository
+from src.infrastructure.repositories.durable_example_repository import DurableExampleRepository
+from src.infrastructure.repositories.example_journal import ExampleJournal
 from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+from src.infrastructure.repositories.sqlite_example_repository import SqliteExampleRepository
+from src.infrastructure.repositories.write_behind_example_repository import (
+    WriteBehindExampleRepository,
+)
 
-__all__ = ["InMemoryExampleRepository"]
+__all__ = [
+    "CachedExampleRepository",
+    "ColumnarExampleRepository",
+    "DurableExampleRepository",
+    "ExampleJournal",
+    "InMemoryExampleRepository",
+    "SqliteExampleRepository",
+    "WriteBehindExampleRepository",
+]
@@ -0,0 +1,120 @@
+"""
+Example Repository - decorator com cache read-through por id
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID
+
+from src.application.services.example_service import ExampleRepository, ExampleStats
+from src.core import Either, ErrorResult, Specification
+from src.core.option import Option, Some
+from src.domain.entities.example import Example
+from src.infrastructure.services.cache import LruTtlCache
+
+
+class CachedExampleRepository:
+    """envolve qualquer ExampleRepository, cacheia get_by_id e invalida nas escritas"""
+
+    __slots__ = ("_inner", "_cache", "_dependents")
+
+    def __init__(
+        self,
+        inner: ExampleRepository,
+        cache: LruTtlCache[UUID, Example],
+        dependents: tuple[LruTtlCache[UUID, Any], ...] = (),
+    ):
+        self._inner = inner
+        self._cache = cache
+        # caches derivados por id (ex: resposta serializada), invalidados junto
+        self._dependents = dependents
+
+    @property
+    def inner(self) -> ExampleRepository:
+        """repositorio envolvido"""
+        return self._inner
+
+    @property
+    def cache(self) -> LruTtlCache[UUID, Example]:
+        """cache de entidades"""
+        return self._cache
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        """busca por id, origem so no miss (ausencia nao e cacheada)"""
+        cached = self._cache.get(id)
+        if isinstance(cached, Some):
+            return cached
+        generation = self._cache.generation
+        result = await self._inner.get_by_id(id)
+        if isinstance(result, Some):
+            self._cache.put(id, result.value, generation)
+        return result
+
+    async def get_by_name(self, name: str) -> Option[Example]:
+        return await self._inner.get_by_name(name)
+
+    async def existing_names(self, names: list[str]) -> set[str]:
+        return await self._inner.existing_names(names)
+
+    async def save(self, entity: Example) -> Either[ErrorResult, Example]:
+        """salva e invalida (tambem no erro, a entidade cacheada pode ter sido mutada)"""
+        result = await self._inner.save(entity)
+        self._invalidate(entity.id)
+        return result
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        result = await self._inner.save_many(entities)
+        for entity in entities:
+            self._invalidate(entity.id)
+        return result
+
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]:
+        result = await self._inner.compare_and_save(entity, expected_version)
+        self._invalidate(entity.id)
+        return result
+
+    async def delete(self, id: UUID) -> Either[ErrorResult, None]:
+        result = await self._inner.delete(id)
+        self._invalidate(id)
+        return result
+
+    async def list_all(self, page: int, page_size: int) -> tuple[list[Example], int]:
+        return await self._inner.list_all(page, page_size)
+
+    async def list_after(
+        self, cursor: str | None, page_size: int
+    ) -> tuple[list[Example], int, str | None]:
+        return await self._inner.list_after(cursor, page_size)
+
+    async def find(
+        self, spec: Specification[Example], page: int, page_size: int
+    ) -> tuple[list[Example], int]:
+        return await self._inner.find(spec, page, page_size)
+
+    def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        return self._inner.iter_batches(batch_size)
+
+    async def revision(self) -> str:
+        return await self._inner.revision()
+
+    async def stats(self) -> ExampleStats:
+        return await self._inner.stats()
+
+    def clear(self) -> None:
+        """limpa caches e dados (para testes)"""
+        clear = getattr(self._inner, "clear", None)
+        if clear is not None:
+            clear()
+        self._cache.clear()
+        for dependent in self._dependents:
+            dependent.clear()
+
+    # invalida depois da escrita: leitura concorrente com geracao antiga nao repopula
+    def _invalidate(self, id: UUID) -> None:
+        self._cache.invalidate(id)
+        for dependent in self._dependents:
+            dependent.invalidate(id)
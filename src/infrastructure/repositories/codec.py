@@ -0,0 +1,49 @@
+"""
+Codec - conversoes compartilhadas pelos repositorios (timestamps, status vivos, faixa int64)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from src.core import ErrorResult
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# faixa de INTEGER do sqlite, das colunas numpy e do struct "q" do journal
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# soma de int64 estoura int64: soma as metades (value >> 32, value & LOW_MASK) separado
+SUM_SHIFT = 32
+LOW_MASK = (1 << SUM_SHIFT) - 1
+
+# buckets por valor do status (filtros chegam com o valor cru)
+LIVE_STATUSES = tuple(s.value for s in Status if s != Status.DELETED)
+
+
+# datetime <-> microssegundos desde epoch (ordenavel e exato)
+def to_micros(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+# junta as somas das metades numa soma exata (int do python nao estoura)
+def join_sums(high: int, low: int) -> int:
+    return (high << SUM_SHIFT) + low
+
+
+def out_of_range(entities: Iterable[Example]) -> ErrorResult | None:
+    """erro de validacao se algum value/version nao cabe em int64 (armazenamento fixo)"""
+    for entity in entities:
+        if not (INT64_MIN <= entity.value <= INT64_MAX):
+            return ErrorResult.validation(f"value deve estar entre {INT64_MIN} e {INT64_MAX}")
+        if not (INT64_MIN <= entity.version <= INT64_MAX):
+            return ErrorResult.validation(f"version deve estar entre {INT64_MIN} e {INT64_MAX}")
+    return None
@@ -0,0 +1,445 @@
+"""
+Example Repository - implementacao colunar em memoria (arrays NumPy)
+
+Cada campo vive num array (value/version int64, status uint8, timestamps int64 em
+microssegundos, id em dois uint64); name/description ficam em listas de strings
+internadas. Entidades so sao montadas na borda (get/list/find), agregados e filtros
+traduziveis rodam vetorizados sobre as colunas.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID, uuid4
+
+from src.application.services.example_service import ExampleStats
+from src.core import Either, ErrorResult, Left, Right, Specification
+from src.core.filters import OPERATORS, AllOf, Compare, Filter, Negate
+from src.core.option import Nothing, Option, Some
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.repositories.codec import (
+    LIVE_STATUSES,
+    LOW_MASK,
+    SUM_SHIFT,
+    from_micros,
+    join_sums,
+    out_of_range,
+    to_micros,
+)
+from src.infrastructure.repositories.cursor import decode_cursor, encode_cursor
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# status <-> codigo uint8
+STATUSES = tuple(Status)
+STATUS_CODES = {s.value: code for code, s in enumerate(STATUSES)}
+DELETED = STATUS_CODES[Status.DELETED.value]
+
+# updated_at ausente
+NO_TIME = -(2**63)
+
+# capacidade inicial das colunas (dobra quando enche)
+INITIAL_CAPACITY = 1024
+
+MASK64 = (1 << 64) - 1
+
+# colunas numericas que aceitam qualquer comparacao
+NUMERIC_FIELDS = {"value": "_value", "version": "_version", "created_at": "_created"}
+TEXT_FIELDS = {"name": "_name", "description": "_description"}
+
+
+class ColumnarExampleRepository:
+    """repositorio colunar em memoria (requer numpy)"""
+
+    __slots__ = (
+        "_size",
+        "_row_of",
+        "_id_hi",
+        "_id_lo",
+        "_value",
+        "_version",
+        "_status",
+        "_created",
+        "_updated",
+        "_name",
+        "_description",
+        "_created_by",
+        "_updated_by",
+        "_by_name",
+        "_order",
+        "_order_created",
+        "_live",
+        "_epoch",
+        "_revision",
+    )
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("repositorio colunar requer numpy (pip install .[perf])")
+        self._size = 0
+        # id.int -> linha (vivos e deletados, soft delete so troca o status)
+        self._row_of: dict[int, int] = {}
+        self._id_hi = np.zeros(capacity, dtype=np.uint64)
+        self._id_lo = np.zeros(capacity, dtype=np.uint64)
+        self._value = np.zeros(capacity, dtype=np.int64)
+        self._version = np.zeros(capacity, dtype=np.int64)
+        self._status = np.zeros(capacity, dtype=np.uint8)
+        self._created = np.zeros(capacity, dtype=np.int64)
+        self._updated = np.zeros(capacity, dtype=np.int64)
+        self._name: list[str] = []
+        self._description: list[str] = []
+        self._created_by: list[str | None] = []
+        self._updated_by: list[str | None] = []
+        # nome -> linha, so vivos
+        self._by_name: dict[str, int] = {}
+        # linhas vivas em (created_at, id) nas primeiras _live posicoes, mantida a cada
+        # escrita: linha nova cai no fim (created_at cresce), delete desloca o resto
+        self._order = np.zeros(capacity, dtype=np.int64)
+        self._order_created = np.zeros(capacity, dtype=np.int64)
+        self._live = 0
+        self._epoch = uuid4().hex[:8]
+        self._revision = 0
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        """busca por id"""
+        row = self._row_of.get(id.int)
+        if row is None or self._status[row] == DELETED:
+            return Nothing()
+        return Some(self._materialize(row))
+
+    async def get_by_name(self, name: str) -> Option[Example]:
+        """busca por nome (indice de vivos)"""
+        row = self._by_name.get(name)
+        return Some(self._materialize(row)) if row is not None else Nothing()
+
+    async def existing_names(self, names: list[str]) -> set[str]:
+        """retorna os nomes que ja existem"""
+        return {name for name in names if name in self._by_name}
+
+    async def save(self, entity: Example) -> Either[ErrorResult, Example]:
+        """salva entidade (grava as colunas da linha)"""
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        self._store(entity)
+        return Right(entity)
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        """salva varias entidades de uma vez"""
+        # valida antes de gravar: lote nao fica pela metade
+        invalid = out_of_range(entities)
+        if invalid is not None:
+            return Left(invalid)
+        self._reserve(self._size + len(entities))
+        for entity in entities:
+            self._store(entity)
+        return Right(entities)
+
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]:
+        """salva so se a versao guardada ainda for expected_version (sem await, atomico no loop)"""
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        row = self._row_of.get(entity.id.int)
+        if row is None or self._status[row] == DELETED:
+            return Left(ErrorResult.not_found("Nao encontrado"))
+        if self._version[row] != expected_version:
+            return Left(ErrorResult.conflict("Exemplo foi alterado por outra requisicao"))
+        self._store(entity)
+        return Right(entity)
+
+    async def delete(self, id: UUID) -> Either[ErrorResult, None]:
+        """deleta entidade (soft delete: so o codigo de status)"""
+        row = self._row_of.get(id.int)
+        if row is not None and self._status[row] != DELETED:
+            self._unindex_name(row)
+            self._order_remove(row)
+            self._status[row] = DELETED
+            self._revision += 1
+        return Right(None)
+
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int]:
+        """lista paginado por offset"""
+        order = self._live_order()
+        start = max(page - 1, 0) * page_size
+        return self._materialize_many(order[start : start + page_size]), len(order)
+
+    async def list_after(
+        self,
+        cursor: str | None,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int, str | None]:
+        """lista paginado por cursor (keyset em created_at, id)"""
+        order = self._live_order()
+        start = 0
+        if cursor is not None:
+            key = decode_cursor(cursor)
+            if not isinstance(key, Some):
+                return [], len(order), None
+            created_at, id = key.value
+            start = self._position_after(to_micros(created_at), id.int)
+
+        end = start + page_size
+        items = self._materialize_many(order[start:end])
+        next_cursor = None
+        if items and end < len(order):
+            next_cursor = encode_cursor((items[-1].created_at, items[-1].id))
+        return items, len(order), next_cursor
+
+    async def find(
+        self,
+        spec: Specification[Example],
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int]:
+        """lista paginado so o que satisfaz a spec (mascara vetorizada quando traduzivel)"""
+        order = self._live_order()
+        start = max(page - 1, 0) * page_size
+        query = spec.to_filter()
+        mask = self._mask(query.value) if isinstance(query, Some) else Nothing()
+        if isinstance(mask, Some):
+            rows = order[mask.value[order]]
+            return self._materialize_many(rows[start : start + page_size]), len(rows)
+
+        matches = [e for e in self._materialize_many(order) if spec.is_satisfied_by(e)]
+        return matches[start : start + page_size], len(matches)
+
+    async def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        """percorre todos os vivos em lotes (keyset, tolera escrita entre lotes)"""
+        order = self._live_order()
+        start = 0
+        while True:
+            rows = order[start : start + batch_size]
+            if not len(rows):
+                return
+            last = int(rows[-1])
+            yield self._materialize_many(rows)
+            order = self._live_order()
+            start = self._position_after(int(self._created[last]), self._id_int(last))
+
+    async def revision(self) -> str:
+        """marca que muda a cada escrita"""
+        return f"{self._epoch}.{self._revision}"
+
+    async def stats(self) -> ExampleStats:
+        """agregados vetorizados sobre as colunas de value e status"""
+        status = self._status[: self._size]
+        counts = np.bincount(status, minlength=len(STATUSES))
+        live = self._value[: self._size][status != DELETED]
+        return ExampleStats(
+            total=len(live),
+            # soma em int64 daria a volta: metades somadas separado, juntas como int
+            value_sum=join_sums(int((live >> SUM_SHIFT).sum()), int((live & LOW_MASK).sum())),
+            value_min=int(live.min()) if len(live) else None,
+            value_max=int(live.max()) if len(live) else None,
+            by_status={s: int(counts[STATUS_CODES[s]]) for s in LIVE_STATUSES},
+        )
+
+    def count(self, status: Status | None = None) -> int:
+        """conta vivos (ou so os do status) direto na coluna de status"""
+        column = self._status[: self._size]
+        if status is None:
+            return int(np.count_nonzero(column != DELETED))
+        return int(np.count_nonzero(column == STATUS_CODES[status.value]))
+
+    def clear(self) -> None:
+        """limpa dados (para testes)"""
+        self._size = 0
+        self._row_of.clear()
+        for column in (self._name, self._description, self._created_by, self._updated_by):
+            column.clear()
+        self._by_name.clear()
+        self._live = 0
+        self._revision += 1
+
+    # grava a entidade na linha dela (nova linha no fim se o id nao existe)
+    def _store(self, entity: Example) -> None:
+        self._revision += 1
+        key = entity.id.int
+        row = self._row_of.get(key)
+        live = entity.status != Status.DELETED
+        created = to_micros(entity.created_at)
+        ordered = False
+        if row is None:
+            row = self._append(key)
+        else:
+            ordered = self._status[row] != DELETED
+            self._unindex_name(row)
+            # sai da ordem pela chave antiga antes de sobrescrever created_at
+            if ordered and (not live or self._created[row] != created):
+                self._order_remove(row)
+                ordered = False
+
+        self._value[row] = entity.value
+        self._version[row] = entity.version
+        self._status[row] = STATUS_CODES[entity.status.value]
+        self._created[row] = created
+        self._updated[row] = to_micros(entity.updated_at) if entity.updated_at else NO_TIME
+        self._name[row] = sys.intern(entity.name)
+        self._description[row] = sys.intern(entity.description)
+        self._created_by[row] = entity.created_by
+        self._updated_by[row] = entity.updated_by
+        if live:
+            self._by_name[self._name[row]] = row
+            if not ordered:
+                self._order_insert(row)
+
+    # reserva a proxima linha para o id
+    def _append(self, key: int) -> int:
+        row = self._size
+        self._reserve(row + 1)
+        self._size += 1
+        self._row_of[key] = row
+        self._id_hi[row] = key >> 64
+        self._id_lo[row] = key & MASK64
+        self._name.append("")
+        self._description.append("")
+        self._created_by.append(None)
+        self._updated_by.append(None)
+        return row
+
+    # garante capacidade para rows linhas (dobra as colunas numpy)
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self._value)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        for name in (
+            "_id_hi",
+            "_id_lo",
+            "_value",
+            "_version",
+            "_status",
+            "_created",
+            "_updated",
+            "_order",
+            "_order_created",
+        ):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+
+    # tira o nome da linha do indice, se ainda apontar para ela
+    def _unindex_name(self, row: int) -> None:
+        name = self._name[row]
+        if self._by_name.get(name) == row:
+            del self._by_name[name]
+
+    # linhas vivas ordenadas por (created_at, id) (view, vale ate a proxima escrita)
+    def _live_order(self) -> np.ndarray:
+        return self._order[: self._live]
+
+    # primeira posicao da ordem atual depois da chave (created_at, id)
+    def _position_after(self, created: int, id: int) -> int:
+        return self._position(created, id, inclusive=True)
+
+    # posicao da chave na ordem: primeira com chave > (inclusive) ou >= a dada
+    def _position(self, created: int, id: int, inclusive: bool) -> int:
+        order = self._live_order()
+        created_sorted = self._order_created[: self._live]
+        start = int(np.searchsorted(created_sorted, created, side="left"))
+        end = int(np.searchsorted(created_sorted, created, side="right"))
+        # empate no created_at: desempata pelo id (poucas linhas)
+        while start < end:
+            other = self._id_int(int(order[start]))
+            if other > id or (other == id and not inclusive):
+                break
+            start += 1
+        return start
+
+    # entra na ordem; created_at novo e o maior, entao o caso comum e no fim sem deslocar
+    def _order_insert(self, row: int) -> None:
+        n, created = self._live, int(self._created[row])
+        at = n
+        if n and created <= self._order_created[n - 1]:
+            at = self._position(created, self._id_int(row), inclusive=False)
+        # _reserve garante capacidade >= _size >= vivos
+        self._order[at + 1 : n + 1] = self._order[at:n]
+        self._order_created[at + 1 : n + 1] = self._order_created[at:n]
+        self._order[at] = row
+        self._order_created[at] = created
+        self._live = n + 1
+
+    # sai da ordem (memmove do resto, sem reordenar)
+    def _order_remove(self, row: int) -> None:
+        n = self._live
+        at = self._position(int(self._created[row]), self._id_int(row), inclusive=False)
+        self._order[at : n - 1] = self._order[at + 1 : n]
+        self._order_created[at : n - 1] = self._order_created[at + 1 : n]
+        self._live = n - 1
+
+    def _id_int(self, row: int) -> int:
+        return (int(self._id_hi[row]) << 64) | int(self._id_lo[row])
+
+    # mascara booleana (por linha) do filtro, Nothing se tiver campo sem coluna
+    def _mask(self, f: Filter) -> Option[np.ndarray]:
+        if isinstance(f, Compare):
+            return self._compare(f)
+        if isinstance(f, Negate):
+            inner = self._mask(f.item)
+            return Some(~inner.value) if isinstance(inner, Some) else Nothing()
+
+        masks = []
+        for item in f.items:
+            mask = self._mask(item)
+            if not isinstance(mask, Some):
+                return Nothing()
+            masks.append(mask.value)
+        reduce = np.logical_and if isinstance(f, AllOf) else np.logical_or
+        return Some(reduce.reduce(masks))
+
+    # uma comparacao vetorizada; status so aceita eq/ne (codigos nao seguem a ordem)
+    def _compare(self, c: Compare) -> Option[np.ndarray]:
+        op, n = OPERATORS[c.op], self._size
+        if c.field in NUMERIC_FIELDS:
+            value = to_micros(c.value) if c.field == "created_at" else c.value
+            return Some(op(getattr(self, NUMERIC_FIELDS[c.field])[:n], value))
+        if c.field == "status" and c.op in ("eq", "ne"):
+            code = STATUS_CODES.get(to_status_value(c.value))
+            if code is None:
+                return Some(np.full(n, c.op == "ne"))
+            return Some(op(self._status[:n], code))
+        if c.field in TEXT_FIELDS:
+            column = np.array(getattr(self, TEXT_FIELDS[c.field]), dtype=object)
+            return Some(np.asarray(op(column, c.value), dtype=bool))
+        return Nothing()
+
+    # monta a entidade a partir das colunas (so na borda)
+    def _materialize(self, row: int) -> Example:
+        updated = int(self._updated[row])
+        return Example(
+            id=UUID(int=self._id_int(row)),
+            name=self._name[row],
+            description=self._description[row],
+            value=int(self._value[row]),
+            status=STATUSES[self._status[row]],
+            created_at=from_micros(int(self._created[row])),
+            updated_at=from_micros(updated) if updated != NO_TIME else None,
+            created_by=self._created_by[row],
+            updated_by=self._updated_by[row],
+            version=int(self._version[row]),
+        )
+
+    def _materialize_many(self, rows: Any) -> list[Example]:
+        return [self._materialize(int(row)) for row in rows]
+
+
+# valor cru do status vindo do filtro (Status ou string)
+def to_status_value(value: Any) -> Any:
+    return value.value if isinstance(value, Status) else value
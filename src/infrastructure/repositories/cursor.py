@@ -0,0 +1,36 @@
+"""
+Cursor - codifica chave de ordenacao (created_at, id) para paginacao keyset
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from src.core.option import Nothing, Option, Some
+
+# chave de ordenacao usada pelos repositorios
+CursorKey = tuple[datetime, UUID]
+
+
+def encode_cursor(key: CursorKey) -> str:
+    """gera token opaco a partir da chave"""
+    created_at, id = key
+    raw = f"{created_at.isoformat()}|{id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Option[CursorKey]:
+    """le token, retorna Nothing se invalido (inclusive timestamp sem fuso)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        created_at, id = raw.split("|")
+        key = (datetime.fromisoformat(created_at), UUID(hex=id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return Nothing()
+    # chaves gravadas sao aware: naive nao compara nem vira micros
+    if key[0].tzinfo is None:
+        return Nothing()
+    return Some(key)
@@ -0,0 +1,157 @@
+"""
+Example Repository - decorator que torna o repositorio em memoria duravel (journal)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import TypeVar
+from uuid import UUID
+
+from src.application.services.example_service import ExampleStats
+from src.core import Either, ErrorResult, Left, Right, Specification
+from src.core.option import Option
+from src.domain.entities.example import Example
+from src.infrastructure.repositories.codec import out_of_range
+from src.infrastructure.repositories.example_journal import (
+    ExampleJournal,
+    delete_record,
+    paused_gc,
+    save_record,
+)
+from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+
+T = TypeVar("T")
+
+
+class DurableExampleRepository:
+    """envolve o repositorio em memoria, cada escrita so responde depois do fsync do log
+
+    a escrita vale em memoria antes do log (compare_and_save continua atomico no loop);
+    se o fsync falhar a resposta e erro, e o estado em memoria fica a frente do disco
+    """
+
+    __slots__ = ("_inner", "_journal", "_checkpoints")
+
+    def __init__(self, inner: InMemoryExampleRepository, journal: ExampleJournal):
+        self._inner = inner
+        self._journal = journal
+        self._checkpoints: asyncio.Task[None] | None = None
+
+    @classmethod
+    def recover(cls, journal: ExampleJournal) -> DurableExampleRepository:
+        """repositorio novo com o estado salvo no journal (snapshot + replay)"""
+        inner = InMemoryExampleRepository()
+        with paused_gc():
+            inner.restore(journal.recover())
+        return cls(inner, journal)
+
+    @property
+    def inner(self) -> InMemoryExampleRepository:
+        """repositorio envolvido"""
+        return self._inner
+
+    @property
+    def journal(self) -> ExampleJournal:
+        """journal de escritas"""
+        return self._journal
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        return await self._inner.get_by_id(id)
+
+    async def get_by_name(self, name: str) -> Option[Example]:
+        return await self._inner.get_by_name(name)
+
+    async def existing_names(self, names: list[str]) -> set[str]:
+        return await self._inner.existing_names(names)
+
+    async def save(self, entity: Example) -> Either[ErrorResult, Example]:
+        # checado antes da memoria: linha que nao cabe no log nao pode valer so em memoria
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        result = await self._inner.save(entity)
+        return await self._commit(result, [save_record(entity)])
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        invalid = out_of_range(entities)
+        if invalid is not None:
+            return Left(invalid)
+        result = await self._inner.save_many(entities)
+        return await self._commit(result, [save_record(e) for e in entities])
+
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]:
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        result = await self._inner.compare_and_save(entity, expected_version)
+        return await self._commit(result, [save_record(entity)])
+
+    async def delete(self, id: UUID) -> Either[ErrorResult, None]:
+        result = await self._inner.delete(id)
+        return await self._commit(result, [delete_record(id)])
+
+    async def list_all(self, page: int, page_size: int) -> tuple[list[Example], int]:
+        return await self._inner.list_all(page, page_size)
+
+    async def list_after(
+        self, cursor: str | None, page_size: int
+    ) -> tuple[list[Example], int, str | None]:
+        return await self._inner.list_after(cursor, page_size)
+
+    async def find(
+        self, spec: Specification[Example], page: int, page_size: int
+    ) -> tuple[list[Example], int]:
+        return await self._inner.find(spec, page, page_size)
+
+    def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        return self._inner.iter_batches(batch_size)
+
+    async def revision(self) -> str:
+        return await self._inner.revision()
+
+    async def stats(self) -> ExampleStats:
+        return await self._inner.stats()
+
+    async def checkpoint(self) -> int:
+        """grava snapshot dos vivos e descarta o log coberto, retorna linhas"""
+        return await self._journal.checkpoint(self._inner.live_entities)
+
+    def start_checkpoints(self, interval: float) -> None:
+        """inicia checkpoints periodicos em background (precisa de loop rodando)"""
+        if self._checkpoints is None or self._checkpoints.done():
+            self._checkpoints = asyncio.get_running_loop().create_task(
+                self._checkpoint_forever(interval)
+            )
+
+    def stop(self) -> None:
+        """cancela os checkpoints e fecha o journal (grava o que estiver pendente)"""
+        if self._checkpoints is not None:
+            self._checkpoints.cancel()
+            self._checkpoints = None
+        self._journal.close()
+
+    def clear(self) -> None:
+        """limpa dados e journal (para testes)"""
+        self._inner.clear()
+        self._journal.reset()
+
+    # espera o fsync do lote que inclui os registros; so loga escrita que deu certo
+    async def _commit(
+        self, result: Either[ErrorResult, T], records: list[bytes]
+    ) -> Either[ErrorResult, T]:
+        if not isinstance(result, Right):
+            return result
+        try:
+            await self._journal.append(records)
+        except OSError as e:
+            return Left(ErrorResult.from_exception(e))
+        return result
+
+    async def _checkpoint_forever(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.checkpoint()
@@ -0,0 +1,363 @@
+"""
+Example Journal - log binario append-only + snapshot para o repositorio em memoria
+
+Cada escrita vira um registro no segmento de log atual (fsync agrupado: todas as
+escritas que chegam durante um fsync vao juntas no proximo). O checkpoint troca de
+segmento, grava um snapshot compactado (so vivos) em background e apaga os segmentos
+que o snapshot ja cobre. Na partida: snapshot via mmap + replay dos segmentos novos.
+
+Formato (little-endian):
+    snapshot: MAGIC, <QQ (primeiro segmento nao coberto, linhas), linhas
+    segmento: registros <II (tamanho, crc32) + payload; payload = b"S" + linha | b"D" + id
+    linha:    ROW (id, created, updated, version, value, status, 4 tamanhos) + strings utf-8
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO
+from uuid import UUID
+
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.repositories.codec import from_micros, to_micros
+
+MAGIC = b"EXSNAP01"
+SNAPSHOT_HEADER = struct.Struct("<QQ")
+RECORD_HEADER = struct.Struct("<II")
+# id, created_at, updated_at, version, value, status, tamanhos de name/description/created_by/updated_by
+ROW = struct.Struct("<16sqqqqBiiii")
+
+SAVE = b"S"
+DELETE = b"D"
+
+# updated_at ausente / string None
+NO_TIME = -(2**63)
+NO_TEXT = -1
+
+STATUSES = tuple(Status)
+STATUS_CODES = {s: code for code, s in enumerate(STATUSES)}
+
+SNAPSHOT_FILE = "snapshot.bin"
+SEGMENT_PREFIX = "log-"
+
+
+# string opcional -> (tamanho, bytes)
+def _text(value: str | None) -> tuple[int, bytes]:
+    if value is None:
+        return NO_TEXT, b""
+    raw = value.encode()
+    return len(raw), raw
+
+
+def encode_row(entity: Example) -> bytes:
+    """linha binaria da entidade"""
+    texts = [
+        _text(entity.name),
+        _text(entity.description),
+        _text(entity.created_by),
+        _text(entity.updated_by),
+    ]
+    head = ROW.pack(
+        entity.id.bytes,
+        to_micros(entity.created_at),
+        to_micros(entity.updated_at) if entity.updated_at else NO_TIME,
+        entity.version,
+        entity.value,
+        STATUS_CODES[entity.status],
+        *(size for size, _ in texts),
+    )
+    return head + b"".join(raw for _, raw in texts)
+
+
+def decode_row(buffer: bytes | mmap.mmap, offset: int) -> tuple[Example, int]:
+    """le a linha em offset, retorna a entidade e o offset seguinte"""
+    id, created, updated, version, value, status, *sizes = ROW.unpack_from(buffer, offset)
+    offset += ROW.size
+    texts: list[str | None] = [None, None, None, None]
+    for i, size in enumerate(sizes):
+        if size != NO_TEXT:
+            texts[i] = str(buffer[offset : offset + size], "utf-8")
+            offset += size
+    name, description, created_by, updated_by = texts
+    entity = Example(
+        # UUID(int=) evita a validacao mais cara de UUID(bytes=) no replay de milhoes
+        id=UUID(int=int.from_bytes(id)),
+        name=name or "",
+        description=description or "",
+        value=value,
+        status=STATUSES[status],
+        created_at=from_micros(created),
+        updated_at=from_micros(updated) if updated != NO_TIME else None,
+        created_by=created_by,
+        updated_by=updated_by,
+        version=version,
+    )
+    return entity, offset
+
+
+def save_record(entity: Example) -> bytes:
+    """registro de log de um save (estado completo, replay idempotente)"""
+    return _frame(SAVE + encode_row(entity))
+
+
+def delete_record(id: UUID) -> bytes:
+    """registro de log de um delete"""
+    return _frame(DELETE + id.bytes)
+
+
+def _frame(payload: bytes) -> bytes:
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+# (inicio do payload, fim) dos registros validos do segmento;
+# para no primeiro truncado/corrompido (escrita interrompida)
+def scan_segment(buffer: bytes | mmap.mmap) -> Iterator[tuple[int, int]]:
+    offset, end = 0, len(buffer)
+    while offset + RECORD_HEADER.size <= end:
+        size, crc = RECORD_HEADER.unpack_from(buffer, offset)
+        start = offset + RECORD_HEADER.size
+        if start + size > end or zlib.crc32(buffer[start : start + size]) != crc:
+            return
+        yield start, start + size
+        offset = start + size
+
+
+# coleta ciclica parada durante a carga: milhoes de objetos novos disparam coletas completas
+# repetidas que nao liberam nada (entidades nao tem ciclos)
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+@dataclass(slots=True)
+class JournalStats:
+    """contadores do journal"""
+
+    records: int = 0
+    commits: int = 0
+    checkpoints: int = 0
+    recovered_rows: int = 0
+    replayed_records: int = 0
+
+
+class ExampleJournal:
+    """log append-only com group commit e checkpoints em snapshot"""
+
+    __slots__ = (
+        "_dir",
+        "_segment",
+        "_file",
+        "_pending",
+        "_waiters",
+        "_flusher",
+        "_lock",
+        "_executor",
+        "stats",
+    )
+
+    def __init__(self, directory: str | Path):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._segment = max(self._segments(), default=0) + 1
+        self._file = self._open_segment(self._segment)
+        # registros aguardando o proximo fsync e quem espera por eles
+        self._pending: list[bytes] = []
+        self._waiters: list[asyncio.Future[None]] = []
+        self._flusher: asyncio.Task[None] | None = None
+        self._lock: asyncio.Lock | None = None
+        # uma thread so: escritas e fsync em ordem, fora do event loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="journal")
+        self.stats = JournalStats()
+
+    def recover(self) -> list[Example]:
+        """estado salvo: snapshot (mmap) + replay dos segmentos posteriores"""
+        state: dict[UUID, Example] = {}
+        first_segment = 0
+        path = self._dir / SNAPSHOT_FILE
+        if path.exists() and path.stat().st_size:
+            with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[: len(MAGIC)] != MAGIC:
+                    raise ValueError(f"snapshot invalido: {path}")
+                first_segment, rows = SNAPSHOT_HEADER.unpack_from(mm, len(MAGIC))
+                offset = len(MAGIC) + SNAPSHOT_HEADER.size
+                for _ in range(rows):
+                    entity, offset = decode_row(mm, offset)
+                    state[entity.id] = entity
+        self.stats.recovered_rows = len(state)
+
+        for segment in sorted(s for s in self._segments() if s >= first_segment):
+            if segment == self._segment:
+                continue
+            self._replay(segment, state)
+        return list(state.values())
+
+    def append(self, records: Iterable[bytes]) -> asyncio.Future[None]:
+        """enfileira registros, o future completa depois do fsync que os inclui"""
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+        before = len(self._pending)
+        self._pending.extend(records)
+        self.stats.records += len(self._pending) - before
+        self._waiters.append(waiter)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_pending())
+        return waiter
+
+    async def checkpoint(self, capture: Callable[[], list[Example]]) -> int:
+        """troca de segmento, grava snapshot e apaga segmentos cobertos; retorna linhas
+
+        capture roda junto da troca (sem await no meio): tudo que foi para os segmentos
+        antigos esta no snapshot, o que vier depois vai para o segmento novo
+        """
+        async with self._writer_lock():
+            # nenhum flush escrevendo: troca o arquivo entre lotes
+            self._file.close()
+            self._segment += 1
+            self._file = self._open_segment(self._segment)
+            covered = self._segment
+            rows = capture()
+        # thread propria: snapshot grande nao atrasa o fsync do log
+        await asyncio.to_thread(self._write_snapshot, rows, covered)
+        self.stats.checkpoints += 1
+        return len(rows)
+
+    async def flush(self) -> None:
+        """espera os registros ja enfileirados chegarem ao disco"""
+        await self.append(())
+
+    def close(self) -> None:
+        """grava o que faltou (sincrono, usado no shutdown) e fecha o segmento"""
+        # espera a escrita em andamento antes de mexer no arquivo
+        self._executor.shutdown(wait=True)
+        if self._pending:
+            self._write(b"".join(self._pending))
+            self._pending.clear()
+            for waiter in self._waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self._waiters.clear()
+        self._file.close()
+
+    def reset(self) -> None:
+        """apaga snapshot e segmentos e recomeca (para testes)"""
+        self._file.close()
+        for segment in self._segments():
+            self._segment_path(segment).unlink()
+        (self._dir / SNAPSHOT_FILE).unlink(missing_ok=True)
+        self._pending.clear()
+        self._segment += 1
+        self._file = self._open_segment(self._segment)
+
+    def snapshot(self) -> dict[str, int]:
+        """contadores e segmento atual"""
+        return {**asdict(self.stats), "segment": self._segment}
+
+    # grava os lotes pendentes enquanto houver; cada volta e um write + fsync
+    async def _flush_pending(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._waiters:
+            async with self._writer_lock():
+                batch, waiters = b"".join(self._pending), self._waiters
+                self._pending, self._waiters = [], []
+                try:
+                    await loop.run_in_executor(self._executor, self._write, batch)
+                except OSError as e:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                    continue
+                self.stats.commits += 1
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    def _writer_lock(self) -> asyncio.Lock:
+        # criado sob demanda dentro do loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _write(self, batch: bytes) -> None:
+        self._file.write(batch)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    # snapshot em arquivo temporario + rename atomico, depois apaga segmentos cobertos
+    def _write_snapshot(self, rows: list[Example], covered: int) -> None:
+        path = self._dir / SNAPSHOT_FILE
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            f.write(MAGIC + SNAPSHOT_HEADER.pack(covered, len(rows)))
+            for i in range(0, len(rows), 10_000):
+                f.write(b"".join(encode_row(e) for e in rows[i : i + 10_000]))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self._sync_dir()
+        for segment in self._segments():
+            if segment < covered:
+                self._segment_path(segment).unlink()
+
+    # reaplica um segmento sobre o estado; corta a cauda corrompida
+    def _replay(self, segment: int, state: dict[UUID, Example]) -> None:
+        path = self._segment_path(segment)
+        if not path.stat().st_size:
+            return
+        valid = 0
+        # primeira passada so le ids: decodifica uma vez por id a ultima versao do segmento
+        latest: dict[bytes, int] = {}
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start, end in scan_segment(mm):
+                latest[mm[start + 1 : start + 17]] = start
+                valid = end
+                self.stats.replayed_records += 1
+            for id, start in latest.items():
+                if mm[start : start + 1] == SAVE:
+                    entity, _ = decode_row(mm, start + 1)
+                    state[entity.id] = entity
+                    continue
+                deleted = state.get(UUID(bytes=id))
+                if deleted is not None:
+                    deleted.status = Status.DELETED
+            size = len(mm)
+        if valid < size:
+            os.truncate(path, valid)
+
+    def _segments(self) -> list[int]:
+        return [
+            int(p.stem[len(SEGMENT_PREFIX) :])
+            for p in self._dir.glob(f"{SEGMENT_PREFIX}*.bin")
+            if p.stem[len(SEGMENT_PREFIX) :].isdigit()
+        ]
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._dir / f"{SEGMENT_PREFIX}{segment:08d}.bin"
+
+    def _open_segment(self, segment: int) -> BinaryIO:
+        file = self._segment_path(segment).open("ab", buffering=0)
+        self._sync_dir()
+        return file
+
+    def _sync_dir(self) -> None:
+        fd = os.open(self._dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
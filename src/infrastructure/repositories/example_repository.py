@@ -4,39 +4,113 @@ Example Repository - implementacao em memoria (para desenvolvimento/testes)
 
 from __future__ import annotations
 
-from uuid import UUID
+import asyncio
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import AsyncIterator
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from uuid import UUID, uuid4
 
-from src.core import Either, ErrorResult, Right
+from src.application.services.example_service import ExampleStats
+from src.core import Either, ErrorResult, Left, Right, Specification
+from src.core.filters import Compare, Filter, conjuncts, to_predicate
 from src.core.option import Nothing, Option, Some
 from src.domain.entities.example import Example
 from src.domain.enums import Status
+from src.infrastructure.repositories.codec import LIVE_STATUSES
+from src.infrastructure.repositories.cursor import CursorKey, decode_cursor, encode_cursor
+
+
+# chave de ordenacao (created_at, id)
+def sort_key(entity: Example) -> CursorKey:
+    return (entity.created_at, entity.id)
+
+
+# chave do indice de valor (value, created_at, id)
+ValueKey = tuple[int, datetime, UUID]
+
+
+def value_key(entity: Example) -> ValueKey:
+    return (entity.value, entity.created_at, entity.id)
+
+
+value_of = itemgetter(0)
+
+# campos indexados da ultima versao salva (name, value, status.value)
+Indexed = tuple[str, int, str]
 
 
 class InMemoryExampleRepository:
     """repositorio em memoria"""
 
-    __slots__ = ("_data",)
+    __slots__ = (
+        "_data",
+        "_deleted",
+        "_indexed",
+        "_by_name",
+        "_by_status",
+        "_order",
+        "_by_value",
+        "_compaction",
+        "_epoch",
+        "_revision",
+    )
 
     def __init__(self) -> None:
+        # so vivos; deletados ficam a parte com o instante do delete (monotonic)
         self._data: dict[UUID, Example] = {}
+        self._deleted: dict[UUID, tuple[Example, float]] = {}
+        # campos indexados por id (entidade e mutada antes do save, indice guarda a versao antiga)
+        self._indexed: dict[UUID, Indexed] = {}
+        self._by_name: dict[str, UUID] = {}
+        self._by_status: dict[str, set[UUID]] = {s: set() for s in LIVE_STATUSES}
+        # chaves ordenadas dos vivos (len = total vivo) e ordenadas por valor
+        self._order: list[CursorKey] = []
+        self._by_value: list[ValueKey] = []
+        self._compaction: asyncio.Task[None] | None = None
+        # contador de escritas; epoch distingue instancias (dados somem no restart)
+        self._epoch = uuid4().hex[:8]
+        self._revision = 0
 
     async def get_by_id(self, id: UUID) -> Option[Example]:
         """busca por id"""
         entity = self._data.get(id)
-        if entity and entity.status != Status.DELETED:
-            return Some(entity)
-        return Nothing()
+        return Some(entity) if entity else Nothing()
 
     async def get_by_name(self, name: str) -> Option[Example]:
-        """busca por nome"""
-        for entity in self._data.values():
-            if entity.name == name and entity.status != Status.DELETED:
-                return Some(entity)
-        return Nothing()
+        """busca por nome usando o indice O(1)"""
+        id = self._by_name.get(name)
+        if id is None:
+            return Nothing()
+        return Some(self._data[id])
+
+    async def existing_names(self, names: list[str]) -> set[str]:
+        """retorna os nomes que ja existem (checagem em lote)"""
+        return {name for name in names if name in self._by_name}
 
     async def save(self, entity: Example) -> Either[ErrorResult, Example]:
         """salva entidade"""
-        self._data[entity.id] = entity
+        self._store(entity)
+        return Right(entity)
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        """salva varias entidades de uma vez"""
+        for entity in entities:
+            self._store(entity)
+        return Right(entities)
+
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]:
+        """salva so se a versao guardada ainda for expected_version (sem await, atomico no loop)"""
+        current = self._data.get(entity.id)
+        if current is None:
+            return Left(ErrorResult.not_found("Nao encontrado"))
+        if current.version != expected_version:
+            return Left(ErrorResult.conflict("Exemplo foi alterado por outra requisicao"))
+        self._store(entity)
         return Right(entity)
 
     async def delete(self, id: UUID) -> Either[ErrorResult, None]:
@@ -44,6 +118,7 @@ class InMemoryExampleRepository:
         entity = self._data.get(id)
         if entity:
             entity.status = Status.DELETED
+            self._store(entity)
         return Right(None)
 
     async def list_all(
@@ -51,17 +126,223 @@ class InMemoryExampleRepository:
         page: int = 1,
         page_size: int = 10,
     ) -> tuple[list[Example], int]:
-        """lista paginado"""
-        # filtra deletados
-        items = [e for e in self._data.values() if e.status != Status.DELETED]
-        total = len(items)
+        """lista paginado por offset, O(page_size)"""
+        start = max(page - 1, 0) * page_size
+        keys = self._order[start : start + page_size]
+        return [self._data[id] for _, id in keys], len(self._order)
+
+    async def list_after(
+        self,
+        cursor: str | None,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int, str | None]:
+        """lista paginado por cursor (keyset), retorna itens, total e proximo cursor"""
+        start = 0
+        if cursor is not None:
+            key = decode_cursor(cursor)
+            if not isinstance(key, Some):
+                return [], len(self._order), None
+            start = bisect_right(self._order, key.value)
 
-        # pagina
-        start = (page - 1) * page_size
         end = start + page_size
+        keys = self._order[start:end]
+        next_cursor = encode_cursor(keys[-1]) if keys and end < len(self._order) else None
+        return [self._data[id] for _, id in keys], len(self._order), next_cursor
+
+    async def find(
+        self,
+        spec: Specification[Example],
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int]:
+        """lista paginado so o que satisfaz a spec, partindo do menor indice que cobre o filtro"""
+        query = spec.to_filter()
+        if isinstance(query, Some):
+            keys = self._candidates(conjuncts(query.value))
+            predicate = to_predicate(query.value)
+        else:
+            keys = self._order
+            predicate = spec.is_satisfied_by
 
-        return items[start:end], total
+        # conta enquanto percorre, so a pagina vira lista
+        matches = filter(predicate, (self._data[id] for _, id in keys))
+        skipped = sum(1 for _ in islice(matches, max(page - 1, 0) * page_size))
+        items = list(islice(matches, page_size))
+        return items, skipped + len(items) + sum(1 for _ in matches)
+
+    async def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        """percorre todos os vivos em lotes (keyset, memoria constante)"""
+        start = 0
+        while True:
+            keys = self._order[start : start + batch_size]
+            if not keys:
+                return
+            yield [self._data[id] for _, id in keys]
+            # reposiciona pela chave, tolera insert/delete entre lotes
+            start = bisect_right(self._order, keys[-1])
+
+    async def revision(self) -> str:
+        """marca que muda a cada escrita"""
+        return f"{self._epoch}.{self._revision}"
+
+    async def stats(self) -> ExampleStats:
+        """agregados dos vivos (min/max direto do indice de valor)"""
+        return ExampleStats(
+            total=len(self._order),
+            value_sum=sum(e.value for e in self._data.values()),
+            value_min=self._by_value[0][0] if self._by_value else None,
+            value_max=self._by_value[-1][0] if self._by_value else None,
+            by_status={s: len(ids) for s, ids in self._by_status.items()},
+        )
+
+    def count(self, status: Status | None = None) -> int:
+        """conta vivos (ou so os do status) sem percorrer linhas"""
+        if status is None:
+            return len(self._order)
+        return len(self._by_status.get(status.value, ()))
+
+    def purge_deleted(self, retention: float) -> int:
+        """remove de vez os deletados ha mais de retention segundos, retorna quantos"""
+        cutoff = time.monotonic() - retention
+        expired: list[UUID] = []
+        # dict fica em ordem de delete, para no primeiro que ainda nao expirou
+        for id, (_, deleted_at) in self._deleted.items():
+            if deleted_at > cutoff:
+                break
+            expired.append(id)
+        for id in expired:
+            del self._deleted[id]
+        return len(expired)
+
+    def start_compaction(self, retention: float, interval: float = 60.0) -> None:
+        """inicia a compactacao periodica em background (precisa de loop rodando)"""
+        if self._compaction is None or self._compaction.done():
+            self._compaction = asyncio.get_running_loop().create_task(
+                self._compact_forever(retention, interval)
+            )
+
+    def stop_compaction(self) -> None:
+        """cancela a compactacao em background"""
+        if self._compaction is not None:
+            self._compaction.cancel()
+            self._compaction = None
+
+    def restore(self, entities: list[Example]) -> None:
+        """substitui o conteudo em lote (recuperacao): indices ordenados uma vez, sem insort"""
+        self.clear()
+        now = time.monotonic()
+        for entity in entities:
+            id, status = entity.id, entity.status.value
+            if status == Status.DELETED.value:
+                self._deleted[id] = (entity, now)
+                continue
+            self._data[id] = entity
+            self._indexed[id] = (entity.name, entity.value, status)
+            self._by_name[entity.name] = id
+            self._by_status[status].add(id)
+        self._order = sorted(map(sort_key, self._data.values()))
+        self._by_value = sorted(map(value_key, self._data.values()))
+
+    def live_entities(self) -> list[Example]:
+        """copia rasa da lista de vivos (base do snapshot)"""
+        return list(self._data.values())
 
     def clear(self) -> None:
         """limpa dados (para testes)"""
         self._data.clear()
+        self._deleted.clear()
+        self._indexed.clear()
+        self._by_name.clear()
+        for bucket in self._by_status.values():
+            bucket.clear()
+        self._order.clear()
+        self._by_value.clear()
+        self._revision += 1
+
+    async def _compact_forever(self, retention: float, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.purge_deleted(retention)
+
+    # guarda a entidade no lado certo (vivos/deletados) e atualiza indices
+    def _store(self, entity: Example) -> None:
+        self._revision += 1
+        if entity.status == Status.DELETED:
+            self._data.pop(entity.id, None)
+            previous = self._deleted.get(entity.id)
+            deleted_at = previous[1] if previous else time.monotonic()
+            self._deleted[entity.id] = (entity, deleted_at)
+        else:
+            self._deleted.pop(entity.id, None)
+            self._data[entity.id] = entity
+        self._reindex(entity)
+
+    # menores chaves candidatas (ordem de listagem) para as condicoes do and raiz
+    def _candidates(self, conditions: list[Filter]) -> list[CursorKey]:
+        best: list[CursorKey] = self._order
+        value_keys = self._value_candidates(conditions)
+        if value_keys is not None and len(value_keys) < len(best):
+            # faixa do indice de valor volta para a ordem de listagem
+            best = sorted((created_at, id) for _, created_at, id in value_keys)
+
+        for c in conditions:
+            if isinstance(c, Compare) and c.field == "status" and c.op == "eq":
+                bucket = self._by_status.get(c.value, set())
+                if len(bucket) < len(best):
+                    best = sorted(sort_key(self._data[id]) for id in bucket)
+        return best
+
+    # faixa do indice de valor que cobre as condicoes em "value" do and raiz
+    def _value_candidates(self, conditions: list[Filter]) -> list[ValueKey] | None:
+        start, end, bounded = 0, len(self._by_value), False
+        for c in conditions:
+            if not isinstance(c, Compare) or c.field != "value" or c.op == "ne":
+                continue
+            bounded = True
+            if c.op in ("eq", "ge"):
+                start = max(start, bisect_left(self._by_value, c.value, key=value_of))
+            elif c.op == "gt":
+                start = max(start, bisect_right(self._by_value, c.value, key=value_of))
+            if c.op in ("eq", "le"):
+                end = min(end, bisect_right(self._by_value, c.value, key=value_of))
+            elif c.op == "lt":
+                end = min(end, bisect_left(self._by_value, c.value, key=value_of))
+        if not bounded:
+            return None
+        return self._by_value[start:end] if start < end else []
+
+    # atualiza indices comparando com a versao indexada (rename, valor, status, delete)
+    def _reindex(self, entity: Example) -> None:
+        id = entity.id
+        old = self._indexed.pop(id, None)
+        live = entity.status != Status.DELETED
+        new = (entity.name, entity.value, entity.status.value) if live else None
+        old_name, old_value, old_status = old or (None, None, None)
+        new_name, new_value, new_status = new or (None, None, None)
+
+        if old_name is not None and old_name != new_name and self._by_name.get(old_name) == id:
+            del self._by_name[old_name]
+        if new_name is not None:
+            self._by_name[new_name] = id
+
+        if old_status != new_status:
+            if old_status is not None:
+                self._by_status[old_status].discard(id)
+            if new_status is not None:
+                self._by_status[new_status].add(id)
+
+        if old_value != new_value:
+            if old_value is not None:
+                old_key = (old_value, entity.created_at, id)
+                del self._by_value[bisect_left(self._by_value, old_key)]
+            if new_value is not None:
+                insort(self._by_value, value_key(entity))
+
+        # created_at nao muda, so mexe na ordem quando entra/sai dos vivos
+        if old is None and new is not None:
+            insort(self._order, sort_key(entity))
+        elif old is not None and new is None:
+            del self._order[bisect_left(self._order, sort_key(entity))]
+
+        if new is not None:
+            self._indexed[id] = new
@@ -0,0 +1,424 @@
+"""
+Example Repository - implementacao SQLite (persistente, WAL + pool)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from src.application.services.example_service import ExampleStats
+from src.core import Either, ErrorResult, Left, Right, Specification
+from src.core.filters import AllOf, Compare, Filter, Negate
+from src.core.option import Nothing, Option, Some
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.database import SqlitePool
+from src.infrastructure.repositories.codec import (
+    LIVE_STATUSES,
+    LOW_MASK,
+    SUM_SHIFT,
+    from_micros,
+    join_sums,
+    out_of_range,
+    to_micros,
+)
+from src.infrastructure.repositories.cursor import decode_cursor, encode_cursor
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS examples (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER,
+    created_by TEXT,
+    updated_by TEXT,
+    version INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS ix_examples_name ON examples(name) WHERE status != 'deleted';
+CREATE INDEX IF NOT EXISTS ix_examples_status ON examples(status);
+CREATE INDEX IF NOT EXISTS ix_examples_order ON examples(created_at, id) WHERE status != 'deleted';
+CREATE INDEX IF NOT EXISTS ix_examples_value ON examples(value) WHERE status != 'deleted';
+CREATE TABLE IF NOT EXISTS examples_meta (id INTEGER PRIMARY KEY CHECK (id = 1), revision INTEGER);
+INSERT OR IGNORE INTO examples_meta (id, revision) VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS tr_examples_insert AFTER INSERT ON examples
+BEGIN UPDATE examples_meta SET revision = revision + 1; END;
+CREATE TRIGGER IF NOT EXISTS tr_examples_update AFTER UPDATE ON examples
+BEGIN UPDATE examples_meta SET revision = revision + 1; END;
+CREATE TRIGGER IF NOT EXISTS tr_examples_delete AFTER DELETE ON examples
+BEGIN UPDATE examples_meta SET revision = revision + 1; END;
+"""
+
+# bancos criados antes da coluna version
+MIGRATE_VERSION = "ALTER TABLE examples ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+
+COLUMNS = (
+    "id, name, description, value, status, created_at, updated_at, created_by, updated_by, version"
+)
+
+SELECT_BY_ID = f"SELECT {COLUMNS} FROM examples WHERE id = ? AND status != 'deleted'"
+SELECT_BY_NAME = f"SELECT {COLUMNS} FROM examples WHERE name = ? AND status != 'deleted' LIMIT 1"
+UPSERT = f"""
+INSERT INTO examples ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name,
+    description = excluded.description,
+    value = excluded.value,
+    status = excluded.status,
+    updated_at = excluded.updated_at,
+    updated_by = excluded.updated_by,
+    version = excluded.version
+"""
+SELECT_NAMES_IN = "SELECT name FROM examples WHERE status != 'deleted' AND name IN ({})"
+UPDATE_IF_VERSION = """
+UPDATE examples SET
+    name = ?, description = ?, value = ?, status = ?, updated_at = ?, updated_by = ?, version = ?
+WHERE id = ? AND version = ? AND status != 'deleted'
+"""
+SOFT_DELETE = "UPDATE examples SET status = 'deleted' WHERE id = ?"
+COUNT_LIVE = "SELECT COUNT(*) FROM examples WHERE status != 'deleted'"
+SELECT_REVISION = "SELECT revision FROM examples_meta WHERE id = 1"
+SELECT_STATS = f"""
+SELECT status, COUNT(*), SUM(value >> {SUM_SHIFT}), SUM(value & {LOW_MASK}), MIN(value), MAX(value)
+FROM examples WHERE status != 'deleted' GROUP BY status
+"""
+SELECT_PAGE = f"""
+SELECT {COLUMNS} FROM examples WHERE status != 'deleted'
+ORDER BY created_at, id LIMIT ? OFFSET ?
+"""
+SELECT_AFTER = f"""
+SELECT {COLUMNS} FROM examples WHERE status != 'deleted' AND (created_at, id) > (?, ?)
+ORDER BY created_at, id LIMIT ?
+"""
+SELECT_FIND = f"""
+SELECT {COLUMNS} FROM examples WHERE status != 'deleted' AND ({{}})
+ORDER BY created_at, id LIMIT ? OFFSET ?
+"""
+COUNT_FIND = "SELECT COUNT(*) FROM examples WHERE status != 'deleted' AND ({})"
+
+# campos do filtro que viram coluna
+FILTER_COLUMNS = frozenset(
+    {"id", "name", "description", "value", "status", "created_at", "updated_at"}
+)
+SQL_OPERATORS = {"eq": "=", "ne": "!=", "gt": ">", "ge": ">=", "lt": "<", "le": "<="}
+
+# limite de parametros por IN (abaixo do SQLITE_MAX_VARIABLE_NUMBER antigo)
+IN_CHUNK = 500
+
+Row = tuple[str, str, str, int, str, int, int | None, str | None, str | None, int]
+
+
+# query pronta pra rodar no pool
+def fetch_all(sql: str, params: tuple[object, ...]) -> Callable[[sqlite3.Connection], list[Row]]:
+    return lambda conn: conn.execute(sql, params).fetchall()
+
+
+# valor do filtro no formato da coluna
+def to_param(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return value.hex
+    if isinstance(value, datetime):
+        return to_micros(value)
+    return value
+
+
+# traduz filtro em clausula WHERE parametrizada, Nothing se tiver campo sem coluna
+def where_clause(f: Filter) -> Option[tuple[str, list[Any]]]:
+    if isinstance(f, Compare):
+        if f.field not in FILTER_COLUMNS:
+            return Nothing()
+        return Some((f"{f.field} {SQL_OPERATORS[f.op]} ?", [to_param(f.value)]))
+
+    if isinstance(f, Negate):
+        inner = where_clause(f.item)
+        if not isinstance(inner, Some):
+            return Nothing()
+        sql, params = inner.value
+        return Some((f"NOT ({sql})", params))
+
+    parts: list[str] = []
+    params = []
+    for item in f.items:
+        clause = where_clause(item)
+        if not isinstance(clause, Some):
+            return Nothing()
+        parts.append(f"({clause.value[0]})")
+        params.extend(clause.value[1])
+    if not parts:
+        return Some(("1" if isinstance(f, AllOf) else "0", params))
+    joiner = " AND " if isinstance(f, AllOf) else " OR "
+    return Some((joiner.join(parts), params))
+
+
+# cria schema e adiciona colunas novas em bancos antigos
+def migrate(conn: sqlite3.Connection) -> None:
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'examples'").fetchone()
+    if exists:
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(examples)")}
+        if "version" not in columns:
+            conn.execute(MIGRATE_VERSION)
+    conn.executescript(SCHEMA)
+
+
+# conta linhas vivas
+def count_live(conn: sqlite3.Connection) -> int:
+    return conn.execute(COUNT_LIVE).fetchone()[0]
+
+
+# converte entidade para linha
+def to_row(entity: Example) -> Row:
+    return (
+        entity.id.hex,
+        entity.name,
+        entity.description,
+        entity.value,
+        entity.status.value,
+        to_micros(entity.created_at),
+        to_micros(entity.updated_at) if entity.updated_at else None,
+        entity.created_by,
+        entity.updated_by,
+        entity.version,
+    )
+
+
+# converte linha para entidade
+def from_row(row: Row) -> Example:
+    (
+        id,
+        name,
+        description,
+        value,
+        status,
+        created_at,
+        updated_at,
+        created_by,
+        updated_by,
+        version,
+    ) = row
+    return Example(
+        id=UUID(hex=id),
+        name=name,
+        description=description,
+        value=value,
+        status=Status(status),
+        created_at=from_micros(created_at),
+        updated_at=from_micros(updated_at) if updated_at is not None else None,
+        created_by=created_by,
+        updated_by=updated_by,
+        version=version,
+    )
+
+
+class SqliteExampleRepository:
+    """repositorio SQLite"""
+
+    __slots__ = ("_pool",)
+
+    def __init__(self, pool: SqlitePool):
+        self._pool = pool
+        self._pool.run_sync(migrate)
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        """busca por id"""
+        row = await self._pool.run(lambda conn: conn.execute(SELECT_BY_ID, (id.hex,)).fetchone())
+        return Some(from_row(row)) if row else Nothing()
+
+    async def get_by_name(self, name: str) -> Option[Example]:
+        """busca por nome (indice parcial de nome)"""
+        row = await self._pool.run(lambda conn: conn.execute(SELECT_BY_NAME, (name,)).fetchone())
+        return Some(from_row(row)) if row else Nothing()
+
+    async def existing_names(self, names: list[str]) -> set[str]:
+        """retorna os nomes que ja existem (uma query por bloco de nomes)"""
+
+        def query(conn: sqlite3.Connection) -> set[str]:
+            found: set[str] = set()
+            for i in range(0, len(names), IN_CHUNK):
+                chunk = names[i : i + IN_CHUNK]
+                sql = SELECT_NAMES_IN.format(", ".join("?" * len(chunk)))
+                found.update(r[0] for r in conn.execute(sql, chunk))
+            return found
+
+        return await self._pool.run(query)
+
+    async def save(self, entity: Example) -> Either[ErrorResult, Example]:
+        """salva entidade (upsert)"""
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        row = to_row(entity)
+        try:
+            await self._pool.run(lambda conn: conn.execute(UPSERT, row))
+        except sqlite3.Error as e:
+            return Left(ErrorResult.from_exception(e))
+        return Right(entity)
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        """salva varias entidades numa unica transacao"""
+        invalid = out_of_range(entities)
+        if invalid is not None:
+            return Left(invalid)
+        rows = [to_row(e) for e in entities]
+        try:
+            await self._pool.run(lambda conn: conn.executemany(UPSERT, rows))
+        except sqlite3.Error as e:
+            return Left(ErrorResult.from_exception(e))
+        return Right(entities)
+
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]:
+        """salva so se a versao no banco ainda for expected_version (UPDATE condicional)"""
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        id, name, description, value, status, _, updated_at, _, updated_by, version = to_row(entity)
+        params = (name, description, value, status, updated_at, updated_by, version)
+
+        def run(conn: sqlite3.Connection) -> bool | None:
+            if conn.execute(UPDATE_IF_VERSION, (*params, id, expected_version)).rowcount:
+                return True
+            # nao atualizou: distingue conflito de inexistente
+            return False if conn.execute(SELECT_BY_ID, (id,)).fetchone() else None
+
+        try:
+            updated = await self._pool.run(run)
+        except sqlite3.Error as e:
+            return Left(ErrorResult.from_exception(e))
+        if updated is None:
+            return Left(ErrorResult.not_found("Nao encontrado"))
+        if not updated:
+            return Left(ErrorResult.conflict("Exemplo foi alterado por outra requisicao"))
+        return Right(entity)
+
+    async def delete(self, id: UUID) -> Either[ErrorResult, None]:
+        """deleta entidade (soft delete)"""
+        try:
+            await self._pool.run(lambda conn: conn.execute(SOFT_DELETE, (id.hex,)))
+        except sqlite3.Error as e:
+            return Left(ErrorResult.from_exception(e))
+        return Right(None)
+
+    async def list_all(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int]:
+        """lista paginado por offset"""
+        offset = max(page - 1, 0) * page_size
+
+        def query(conn: sqlite3.Connection) -> tuple[list[Row], int]:
+            return conn.execute(SELECT_PAGE, (page_size, offset)).fetchall(), count_live(conn)
+
+        rows, total = await self._pool.run(query)
+        return [from_row(r) for r in rows], total
+
+    async def list_after(
+        self,
+        cursor: str | None,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int, str | None]:
+        """lista paginado por cursor (keyset em created_at, id)"""
+        # busca um a mais pra saber se existe proxima pagina
+        if cursor is None:
+            sql, params = SELECT_PAGE, (page_size + 1, 0)
+        else:
+            key = decode_cursor(cursor)
+            if not isinstance(key, Some):
+                return [], await self._pool.run(count_live), None
+            created_at, id = key.value
+            sql, params = SELECT_AFTER, (to_micros(created_at), id.hex, page_size + 1)
+
+        def query(conn: sqlite3.Connection) -> tuple[list[Row], int]:
+            return conn.execute(sql, params).fetchall(), count_live(conn)
+
+        rows, total = await self._pool.run(query)
+        items = [from_row(r) for r in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            next_cursor = encode_cursor((items[-1].created_at, items[-1].id))
+        return items, total, next_cursor
+
+    async def find(
+        self,
+        spec: Specification[Example],
+        page: int = 1,
+        page_size: int = 10,
+    ) -> tuple[list[Example], int]:
+        """lista paginado so o que satisfaz a spec (WHERE quando traduzivel)"""
+        offset = max(page - 1, 0) * page_size
+        query = spec.to_filter()
+        clause = where_clause(query.value) if isinstance(query, Some) else Nothing()
+        if not isinstance(clause, Some):
+            return await self._find_scan(spec, offset, page_size)
+
+        where, params = clause.value
+        select, count = SELECT_FIND.format(where), COUNT_FIND.format(where)
+
+        def run(conn: sqlite3.Connection) -> tuple[list[Row], int]:
+            rows = conn.execute(select, (*params, page_size, offset)).fetchall()
+            return rows, conn.execute(count, params).fetchone()[0]
+
+        rows, total = await self._pool.run(run)
+        return [from_row(r) for r in rows], total
+
+    async def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        """percorre todos os vivos em lotes (keyset, memoria constante)"""
+        sql, params = SELECT_PAGE, (batch_size, 0)
+        while True:
+            rows = await self._pool.run(fetch_all(sql, params))
+            if not rows:
+                return
+            yield [from_row(r) for r in rows]
+            last = rows[-1]
+            sql, params = SELECT_AFTER, (last[5], last[0], batch_size)
+
+    # spec sem traducao: varre em lotes e guarda so a pagina pedida
+    async def _find_scan(
+        self, spec: Specification[Example], offset: int, page_size: int
+    ) -> tuple[list[Example], int]:
+        items: list[Example] = []
+        total = 0
+        async for batch in self.iter_batches():
+            for entity in batch:
+                if spec.is_satisfied_by(entity):
+                    if offset <= total < offset + page_size:
+                        items.append(entity)
+                    total += 1
+        return items, total
+
+    async def revision(self) -> str:
+        """contador de escritas mantido por trigger (vale entre processos)"""
+        row = await self._pool.run(lambda conn: conn.execute(SELECT_REVISION).fetchone())
+        return str(row[0])
+
+    async def stats(self) -> ExampleStats:
+        """agregados numa query (GROUP BY status, soma exata pelas metades)"""
+        rows = await self._pool.run(fetch_all(SELECT_STATS, ()))
+        by_status = dict.fromkeys(LIVE_STATUSES, 0)
+        for status, count, *_ in rows:
+            by_status[status] = count
+        return ExampleStats(
+            total=sum(r[1] for r in rows),
+            value_sum=join_sums(sum(r[2] for r in rows), sum(r[3] for r in rows)),
+            value_min=min((r[4] for r in rows), default=None),
+            value_max=max((r[5] for r in rows), default=None),
+            by_status=by_status,
+        )
+
+    def clear(self) -> None:
+        """limpa dados (para testes)"""
+        self._pool.run_sync(lambda conn: conn.execute("DELETE FROM examples"))
+
+    def close(self) -> None:
+        """fecha o pool de conexoes"""
+        self._pool.close()
@@ -0,0 +1,293 @@
+"""
+Example Repository - decorator write-behind: escritas respondem ao enfileirar e vao em lote
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from itertools import islice
+from uuid import UUID
+
+from src.application.services.example_service import ExampleRepository, ExampleStats
+from src.core import Either, ErrorResult, Left, Right, Specification
+from src.core.logger import error
+from src.core.option import Nothing, Option, Some
+from src.domain.entities.example import Example
+from src.infrastructure.repositories.codec import out_of_range
+
+# escrita pendente por id: entidade a salvar ou None (delete)
+Pending = Example | None
+
+# id sem escrita pendente
+MISSING = object()
+
+
+@dataclass(slots=True)
+class WriteBehindStats:
+    """contadores do write-behind"""
+
+    enqueued: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    flushed: int = 0
+    failures: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+
+
+class WriteBehindExampleRepository:
+    """envolve qualquer ExampleRepository, agrupa escritas e grava em lotes
+
+    escritas no mesmo id antes do flush viram uma so (vale a ultima). get_by_id,
+    get_by_name e compare_and_save enxergam a fila; listagens, busca, stats e
+    revision esvaziam a fila antes de ler o repositorio envolvido. erro no flush
+    nao chega a quem escreveu (ja respondido): o lote volta para a fila e e logado
+    """
+
+    __slots__ = (
+        "_inner",
+        "_max_batch",
+        "_max_delay",
+        "_pending",
+        "_inflight",
+        "_loop",
+        "_lock",
+        "_flusher",
+        "_wake",
+        "_counters",
+    )
+
+    def __init__(self, inner: ExampleRepository, max_batch: int = 500, max_delay: float = 0.05):
+        self._inner = inner
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        # ordem de chegada; lote em gravacao fica em _inflight ate terminar
+        self._pending: dict[UUID, Pending] = {}
+        self._inflight: dict[UUID, Pending] = {}
+        # um lote por vez (flusher em background e flush() de quem le); ligados ao loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+        # acorda o flusher antes de max_delay quando um lote enche
+        self._wake: asyncio.Future[None] | None = None
+        self._counters = WriteBehindStats()
+
+    @property
+    def inner(self) -> ExampleRepository:
+        """repositorio envolvido"""
+        return self._inner
+
+    async def get_by_id(self, id: UUID) -> Option[Example]:
+        """busca por id, fila primeiro"""
+        queued = self._queued(id)
+        if queued is not MISSING:
+            return Some(queued) if isinstance(queued, Example) else Nothing()
+        return await self._inner.get_by_id(id)
+
+    async def get_by_name(self, name: str) -> Option[Example]:
+        """busca por nome, fila primeiro (rename/delete pendente esconde o guardado)"""
+        for queue in (self._pending, self._inflight):
+            for entity in queue.values():
+                if entity is not None and entity.name == name:
+                    return Some(entity)
+        found = await self._inner.get_by_name(name)
+        if isinstance(found, Some) and self._queued(found.value.id) is not MISSING:
+            # versao na fila ja foi checada acima e nao tem esse nome
+            return Nothing()
+        return found
+
+    async def existing_names(self, names: list[str]) -> set[str]:
+        await self.flush()
+        return await self._inner.existing_names(names)
+
+    async def save(self, entity: Example) -> Either[ErrorResult, Example]:
+        """enfileira e responde"""
+        # lote que o backend sempre recusa voltaria para a fila para sempre
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        self._enqueue(entity.id, entity)
+        return Right(entity)
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        invalid = out_of_range(entities)
+        if invalid is not None:
+            return Left(invalid)
+        for entity in entities:
+            self._enqueue(entity.id, entity)
+        return Right(entities)
+
+    async def compare_and_save(
+        self, entity: Example, expected_version: int
+    ) -> Either[ErrorResult, Example]:
+        """checa a versao contra a fila (ou o guardado) e enfileira sem await no meio"""
+        invalid = out_of_range([entity])
+        if invalid is not None:
+            return Left(invalid)
+        current = self._queued(entity.id)
+        if current is MISSING:
+            found = await self._inner.get_by_id(entity.id)
+            # escrita enfileirada durante o await vale mais que o guardado
+            current = self._queued(entity.id)
+            if current is MISSING:
+                current = found.value if isinstance(found, Some) else None
+        if not isinstance(current, Example):
+            return Left(ErrorResult.not_found("Nao encontrado"))
+        if current.version != expected_version:
+            return Left(ErrorResult.conflict("Exemplo foi alterado por outra requisicao"))
+        self._enqueue(entity.id, entity)
+        return Right(entity)
+
+    async def delete(self, id: UUID) -> Either[ErrorResult, None]:
+        self._enqueue(id, None)
+        return Right(None)
+
+    async def list_all(self, page: int, page_size: int) -> tuple[list[Example], int]:
+        await self.flush()
+        return await self._inner.list_all(page, page_size)
+
+    async def list_after(
+        self, cursor: str | None, page_size: int
+    ) -> tuple[list[Example], int, str | None]:
+        await self.flush()
+        return await self._inner.list_after(cursor, page_size)
+
+    async def find(
+        self, spec: Specification[Example], page: int, page_size: int
+    ) -> tuple[list[Example], int]:
+        await self.flush()
+        return await self._inner.find(spec, page, page_size)
+
+    async def iter_batches(self, batch_size: int = 500) -> AsyncIterator[list[Example]]:
+        await self.flush()
+        async for batch in self._inner.iter_batches(batch_size):
+            yield batch
+
+    async def revision(self) -> str:
+        await self.flush()
+        return await self._inner.revision()
+
+    async def stats(self) -> ExampleStats:
+        await self.flush()
+        return await self._inner.stats()
+
+    async def flush(self) -> bool:
+        """grava tudo que foi enfileirado ate agora; False se um lote falhou"""
+        # o lock espera o lote que o flusher estiver gravando
+        while True:
+            if not await self._flush_batch():
+                return False
+            if not self._pending:
+                return True
+
+    async def drain(self) -> bool:
+        """esvazia a fila e para o flusher (shutdown)"""
+        flushed = await self.flush()
+        # fila vazia: flusher so esta esperando, cancelar nao corta escrita
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        return flushed
+
+    def snapshot(self) -> dict[str, int | float]:
+        """contadores e profundidade da fila"""
+        return {**asdict(self._counters), "queue_depth": len(self._pending) + len(self._inflight)}
+
+    def clear(self) -> None:
+        """descarta a fila e limpa dados (para testes)"""
+        self._pending.clear()
+        clear = getattr(self._inner, "clear", None)
+        if clear is not None:
+            clear()
+
+    # escrita na fila (ou no lote em gravacao) para o id
+    def _queued(self, id: UUID) -> Pending | object:
+        queued = self._pending.get(id, MISSING)
+        return self._inflight.get(id, MISSING) if queued is MISSING else queued
+
+    def _enqueue(self, id: UUID, write: Pending) -> None:
+        loop = self._bind()
+        self._counters.enqueued += 1
+        if id in self._pending:
+            self._counters.coalesced += 1
+        self._pending[id] = write
+        if len(self._pending) >= self._max_batch and self._wake and not self._wake.done():
+            self._wake.set_result(None)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_forever())
+
+    # lock e flusher valem para o loop atual; loop novo (ex: TestClient sem contexto)
+    # recomeca com o lote que estava em gravacao de volta na fila
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop, self._lock, self._flusher, self._wake = loop, asyncio.Lock(), None, None
+            self._pending = {**self._inflight, **self._pending}
+            self._inflight = {}
+        return loop
+
+    # espera encher um lote ou max_delay, grava; sai quando a fila esvazia
+    async def _flush_forever(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            if len(self._pending) < self._max_batch:
+                self._wake = loop.create_future()
+                try:
+                    await asyncio.wait_for(self._wake, self._max_delay)
+                except TimeoutError:
+                    pass
+            if not await self._flush_batch():
+                # backend com erro: espera antes de tentar o mesmo lote de novo
+                await asyncio.sleep(self._max_delay)
+
+    # grava ate max_batch escritas: saves num save_many, deletes um a um
+    async def _flush_batch(self) -> bool:
+        self._bind()
+        async with self._lock:
+            if not self._pending:
+                return True
+            ids = list(islice(self._pending, self._max_batch))
+            self._inflight = {id: self._pending.pop(id) for id in ids}
+            saves = [e for e in self._inflight.values() if e is not None]
+            deletes = [id for id, e in self._inflight.items() if e is None]
+
+            start = time.perf_counter()
+            try:
+                failure = await self._write(saves, deletes)
+            except Exception as e:
+                failure = ErrorResult.from_exception(e)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            batch, self._inflight = self._inflight, {}
+            if failure is not None:
+                # volta para a fila, sem passar por cima de escrita mais nova no mesmo id
+                self._pending = {**batch, **self._pending}
+                self._counters.failures += 1
+                error(
+                    "write-behind: lote de %d escritas falhou: %s",
+                    len(batch),
+                    failure.first_message,
+                )
+                return False
+
+            self._counters.batches += 1
+            self._counters.flushed += len(batch)
+            self._counters.last_flush_ms = elapsed
+            self._counters.max_flush_ms = max(self._counters.max_flush_ms, elapsed)
+            self._counters.total_flush_ms += elapsed
+            return True
+
+    async def _write(self, saves: list[Example], deletes: list[UUID]) -> ErrorResult | None:
+        if saves:
+            saved = await self._inner.save_many(saves)
+            if isinstance(saved, Left):
+                return saved.value
+        for id in deletes:
+            deleted = await self._inner.delete(id)
+            if isinstance(deleted, Left):
+                return deleted.value
+        return None
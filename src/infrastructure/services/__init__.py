@@ -1,2 +1,4 @@
 # servicos de infraestrutura
+from src.infrastructure.services.cache import CacheStats, LruTtlCache
 
+__all__ = ["CacheStats", "LruTtlCache"]
@@ -0,0 +1,97 @@
+"""
+Cache - LRU com TTL e contadores (em processo)
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Generic, TypeVar
+
+from src.core.option import Nothing, Option, Some
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """contadores do cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LruTtlCache(Generic[K, V]):
+    """cache LRU limitado por tamanho, com TTL por entrada"""
+
+    __slots__ = ("_entries", "_max_size", "_ttl", "_clock", "_generation", "stats")
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        # muda a cada invalidacao, protege contra put de leitura antiga
+        self._generation = 0
+        self.stats = CacheStats()
+
+    @property
+    def generation(self) -> int:
+        """geracao atual (ler antes de buscar na origem e passar no put)"""
+        return self._generation
+
+    def get(self, key: K) -> Option[V]:
+        """busca e marca como usado recentemente"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return Nothing()
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return Nothing()
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return Some(value)
+
+    def put(self, key: K, value: V, generation: int | None = None) -> None:
+        """guarda valor, ignora se houve invalidacao desde generation"""
+        if generation is not None and generation != self._generation:
+            return
+        expires_at = self._clock() + self._ttl if self._ttl is not None else float("inf")
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """remove a chave"""
+        self._generation += 1
+        if self._entries.pop(key, None) is not None:
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """remove tudo"""
+        self._generation += 1
+        self._entries.clear()
+
+    def snapshot(self) -> dict[str, int]:
+        """contadores e tamanho atual"""
+        return {**asdict(self.stats), "size": len(self._entries)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
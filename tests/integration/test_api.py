@@ -4,11 +4,24 @@ Integration Tests for API
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+from collections.abc import Iterator
+from uuid import UUID, uuid4
+
+import httpx
 import pytest
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 
 from src.api.app import app
-from src.infrastructure.dependencies import get_example_repository
+from src.api.controllers.example_controller import router as example_router
+from src.api.responses import FastJSONResponse
+from src.domain.entities.example import Example
+from src.infrastructure.dependencies import get_example_repository, get_response_cache
+from src.infrastructure.repositories import CachedExampleRepository, InMemoryExampleRepository
+from src.infrastructure.services.cache import LruTtlCache
 
 
 @pytest.fixture
@@ -63,6 +76,14 @@ class TestExampleController:
         )
         assert response.status_code == 422  # pydantic validation
 
+    def test_value_beyond_int64_is_rejected(self, client: TestClient) -> None:
+        response = client.post("/examples", json={"name": "Big", "value": 2**63})
+        assert response.status_code == 422
+
+        created = client.post("/examples", json={"name": "Big", "value": 2**63 - 1}).json()
+        id = created["result"]["id"]
+        assert client.put(f"/examples/{id}", json={"value": 2**63}).status_code == 422
+
     def test_create_duplicate_name_returns_error(self, client: TestClient) -> None:
         # cria primeiro
         client.post("/examples", json={"name": "Duplicate"})
@@ -169,6 +190,74 @@ class TestExampleController:
         assert data["result"]["page"] == 2
         assert data["result"]["total_pages"] == 3
 
+    def test_list_cursor_pagination(self, client: TestClient) -> None:
+        for i in range(5):
+            client.post("/examples", json={"name": f"Item {i}"})
+
+        first = client.get("/examples?page_size=3").json()["result"]
+        response = client.get(f"/examples?page_size=3&cursor={first['next_cursor']}")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [i["name"] for i in data["result"]["items"]] == ["Item 3", "Item 4"]
+        assert data["result"]["next_cursor"] is None
+        assert data["result"]["total"] == 5
+
+    def test_list_invalid_cursor_returns_400(self, client: TestClient) -> None:
+        response = client.get("/examples?cursor=lixo")
+        assert response.status_code == 400
+
+    def test_list_naive_timestamp_cursor_returns_400(self, client: TestClient) -> None:
+        client.post("/examples", json={"name": "Item"})
+        raw = f"2024-01-01T00:00:00|{uuid4().hex}".encode()
+        cursor = base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+        response = client.get(f"/examples?cursor={cursor}")
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("param", ["min_value", "max_value"])
+    @pytest.mark.parametrize("value", [2**63, -(2**63) - 1, 10**20])
+    def test_list_value_filter_beyond_int64_is_rejected(
+        self, client: TestClient, param: str, value: int
+    ) -> None:
+        response = client.get(f"/examples?{param}={value}")
+        assert response.status_code == 422
+
+    def test_list_filtered_by_value_range(self, client: TestClient) -> None:
+        for i in range(6):
+            client.post("/examples", json={"name": f"Item {i}", "value": i * 10})
+
+        response = client.get("/examples?min_value=15&max_value=40&status=pending")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [i["name"] for i in data["result"]["items"]] == ["Item 2", "Item 3", "Item 4"]
+        assert data["result"]["total"] == 3
+        assert data["result"]["next_cursor"] is None
+
+    def test_list_filter_rejects_unknown_status(self, client: TestClient) -> None:
+        response = client.get("/examples?status=lixo")
+        assert response.status_code == 422
+
+    def test_stats_aggregates_live_examples(self, client: TestClient) -> None:
+        created = [
+            client.post("/examples", json={"name": f"Item {i}", "value": v}).json()
+            for i, v in enumerate([10, 20, 60])
+        ]
+        client.delete(f"/examples/{created[0]['result']['id']}")
+
+        response = client.get("/examples/stats")
+        assert response.status_code == 200
+        stats = response.json()["result"]
+
+        assert stats["total"] == 2
+        assert stats["value_sum"] == 80
+        assert stats["value_avg"] == 40
+        assert (stats["value_min"], stats["value_max"]) == (20, 60)
+        assert stats["by_status"]["pending"] == 2
+        etag = response.headers["etag"]
+        assert client.get("/examples/stats", headers={"If-None-Match": etag}).status_code == 304
+
 
 class TestApiResponseStructure:
     """testes para estrutura padrao de resposta"""
@@ -191,3 +280,260 @@ class TestApiResponseStructure:
         assert data["error"] is True
         assert data["error_message"] is not None
         assert isinstance(data["error_message"], str)
+
+    def test_fast_json_only_on_measured_read_routes(self) -> None:
+        fast = {
+            (route.path, method)
+            for route in example_router.routes
+            if isinstance(route, APIRoute) and route.response_class is FastJSONResponse
+            for method in route.methods
+        }
+
+        assert fast == {("/examples", "GET"), ("/examples/{id}", "GET")}
+
+
+class TestBulkCreate:
+    """testes para criacao em lote"""
+
+    def test_bulk_create_returns_result_per_item(self, client: TestClient) -> None:
+        client.post("/examples", json={"name": "Existing"})
+
+        response = client.post(
+            "/examples/bulk",
+            json=[
+                {"name": "A", "value": 1},
+                {"name": "Existing"},
+                {"name": "B"},
+                {"name": "A"},
+            ],
+        )
+        assert response.status_code == 201
+        data = response.json()
+
+        assert data["error"] is False
+        items = data["result"]
+        assert [i["error"] for i in items] == [False, True, False, True]
+        assert items[0]["result"]["name"] == "A"
+        assert items[1]["error_message"] is not None
+
+        listed = client.get("/examples").json()["result"]
+        assert listed["total"] == 3
+
+    def test_bulk_create_validates_each_item(self, client: TestClient) -> None:
+        response = client.post("/examples/bulk", json=[{"name": ""}])
+        assert response.status_code == 422
+
+
+class TestExport:
+    """testes para exportacao NDJSON"""
+
+    def test_export_streams_one_line_per_item(self, client: TestClient) -> None:
+        for i in range(3):
+            client.post("/examples", json={"name": f"Item {i}", "value": i})
+
+        response = client.get("/examples/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["name"] for line in lines] == ["Item 0", "Item 1", "Item 2"]
+
+    def test_export_empty(self, client: TestClient) -> None:
+        response = client.get("/examples/export")
+        assert response.status_code == 200
+        assert response.text == ""
+
+
+class TestResponseCache:
+    """testes para cache de GET /examples/{id}"""
+
+    @pytest.fixture
+    def cached_client(self) -> Iterator[tuple[TestClient, LruTtlCache]]:
+        responses: LruTtlCache = LruTtlCache(max_size=100)
+        repo = CachedExampleRepository(
+            InMemoryExampleRepository(), LruTtlCache(max_size=100), (responses,)
+        )
+        app.dependency_overrides[get_example_repository] = lambda: repo
+        app.dependency_overrides[get_response_cache] = lambda: responses
+        yield TestClient(app), responses
+        app.dependency_overrides.clear()
+
+    def test_cached_body_matches_and_invalidates_on_update(
+        self, cached_client: tuple[TestClient, LruTtlCache]
+    ) -> None:
+        cached, responses = cached_client
+        id = cached.post("/examples", json={"name": "Cached"}).json()["result"]["id"]
+
+        first = cached.get(f"/examples/{id}")
+        second = cached.get(f"/examples/{id}")
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert first.json()["result"]["name"] == "Cached"
+        assert responses.stats.hits == 1
+
+        cached.put(f"/examples/{id}", json={"name": "Renamed"})
+        third = cached.get(f"/examples/{id}")
+        assert third.json()["result"]["name"] == "Renamed"
+
+    def test_not_found_is_not_cached(self, cached_client: tuple[TestClient, LruTtlCache]) -> None:
+        cached, responses = cached_client
+        response = cached.get("/examples/00000000-0000-0000-0000-000000000000")
+
+        assert response.status_code == 404
+        assert len(responses) == 0
+
+
+class HeldRepository(InMemoryExampleRepository):
+    """repositorio que segura a proxima leitura (depois de ler) ate o teste liberar"""
+
+    __slots__ = ("hold",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hold: asyncio.Event | None = None
+
+    async def _held(self, result):
+        hold, self.hold = self.hold, None
+        if hold is not None:
+            await hold.wait()
+        return result
+
+    async def get_by_id(self, id: UUID):
+        return await self._held(await super().get_by_id(id))
+
+    async def list_after(self, cursor: str | None, page_size: int = 10):
+        return await self._held(await super().list_after(cursor, page_size))
+
+
+class TestSingleFlightFreshness:
+    """leitura iniciada antes de uma escrita nao serve quem chega depois dela"""
+
+    @pytest.fixture
+    def held(self) -> Iterator[tuple[HeldRepository, LruTtlCache]]:
+        inner = HeldRepository()
+        responses: LruTtlCache = LruTtlCache(max_size=100)
+        repo = CachedExampleRepository(inner, LruTtlCache(max_size=100), (responses,))
+        app.dependency_overrides[get_example_repository] = lambda: repo
+        app.dependency_overrides[get_response_cache] = lambda: responses
+        yield inner, responses
+        app.dependency_overrides.clear()
+
+    # GET segurado no repo, escrita confirmada, segundo GET igual, libera o primeiro
+    async def _overlap(self, inner: HeldRepository, url: str, write) -> tuple:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            inner.hold = hold = asyncio.Event()
+            first = asyncio.create_task(client.get(url))
+            while inner.hold is not None:
+                await asyncio.sleep(0)
+            await write(client)
+            second = asyncio.create_task(client.get(url))
+            await asyncio.sleep(0.05)
+            hold.set()
+            return await first, await second, await client.get(url)
+
+    @pytest.mark.asyncio
+    async def test_get_after_update_is_fresh_and_cached_fresh(
+        self, held: tuple[HeldRepository, LruTtlCache]
+    ) -> None:
+        inner, _ = held
+        created = await inner.save(Example(name="Fresh", value=1))
+        id = created.value.id
+
+        async def write(client: httpx.AsyncClient) -> None:
+            response = await client.put(f"/examples/{id}", json={"value": 2})
+            assert response.json()["result"]["value"] == 2
+
+        first, second, later = await self._overlap(inner, f"/examples/{id}", write)
+
+        assert first.json()["result"]["value"] == 1
+        assert second.json()["result"]["value"] == 2
+        assert second.headers["ETag"] == '"2"'
+        assert later.json()["result"]["value"] == 2
+
+    @pytest.mark.asyncio
+    async def test_list_after_create_matches_its_etag(
+        self, held: tuple[HeldRepository, LruTtlCache]
+    ) -> None:
+        inner, _ = held
+        await inner.save(Example(name="One"))
+
+        async def write(client: httpx.AsyncClient) -> None:
+            await client.post("/examples", json={"name": "Two"})
+
+        first, second, later = await self._overlap(inner, "/examples", write)
+
+        assert first.json()["result"]["total"] == 1
+        assert second.json()["result"]["total"] == 2
+        assert second.headers["ETag"] == later.headers["ETag"] != first.headers["ETag"]
+
+
+class TestETag:
+    """testes para ETag / If-None-Match"""
+
+    def test_get_by_id_returns_304_until_updated(self, client: TestClient) -> None:
+        id = client.post("/examples", json={"name": "Tagged"}).json()["result"]["id"]
+
+        first = client.get(f"/examples/{id}")
+        etag = first.headers["etag"]
+        assert first.json()["result"]["version"] == 1
+
+        cached = client.get(f"/examples/{id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        client.put(f"/examples/{id}", json={"value": 7})
+        changed = client.get(f"/examples/{id}", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["result"]["version"] == 2
+
+    def test_if_none_match_accepts_list_and_weak_tags(self, client: TestClient) -> None:
+        id = client.post("/examples", json={"name": "Tagged"}).json()["result"]["id"]
+        etag = client.get(f"/examples/{id}").headers["etag"]
+
+        response = client.get(f"/examples/{id}", headers={"If-None-Match": f'"x", W/{etag}'})
+
+        assert response.status_code == 304
+
+    def test_list_etag_changes_on_write(self, client: TestClient) -> None:
+        client.post("/examples", json={"name": "Item 0"})
+        etag = client.get("/examples").headers["etag"]
+
+        assert client.get("/examples", headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/examples", json={"name": "Item 1"})
+        response = client.get("/examples", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["result"]["total"] == 2
+
+
+class TestIfMatch:
+    """testes para update condicional"""
+
+    def test_update_with_current_etag_succeeds(self, client: TestClient) -> None:
+        id = client.post("/examples", json={"name": "Guarded"}).json()["result"]["id"]
+        etag = client.get(f"/examples/{id}").headers["etag"]
+
+        response = client.put(f"/examples/{id}", json={"value": 1}, headers={"If-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == '"2"'
+
+    def test_update_with_stale_etag_returns_409(self, client: TestClient) -> None:
+        id = client.post("/examples", json={"name": "Guarded"}).json()["result"]["id"]
+        etag = client.get(f"/examples/{id}").headers["etag"]
+        client.put(f"/examples/{id}", json={"value": 1})
+
+        response = client.put(f"/examples/{id}", json={"value": 2}, headers={"If-Match": etag})
+
+        assert response.status_code == 409
+        assert client.get(f"/examples/{id}").json()["result"]["value"] == 1
+
+    def test_update_with_invalid_if_match_returns_400(self, client: TestClient) -> None:
+        id = client.post("/examples", json={"name": "Guarded"}).json()["result"]["id"]
+
+        response = client.put(f"/examples/{id}", json={"value": 1}, headers={"If-Match": 'W/"1"'})
+
+        assert response.status_code == 400
@@ -4,14 +4,27 @@ Tests for Logger
 
 from __future__ import annotations
 
+import json
 import logging
+import queue
+import time
+from datetime import datetime
+
 import pytest
 
 from src.core.logger import (
+    DIM,
+    BoundedQueueHandler,
     ColoredFormatter,
+    JsonFormatter,
+    RateLimitFilter,
     SimpleFormatter,
+    TimestampCache,
+    dropped_records,
     get_logger,
+    module_label,
     setup_logger,
+    shutdown_logging,
 )
 
 
@@ -78,3 +91,286 @@ class TestLogger:
         log2 = setup_logger("test_level2", level="ERROR")
         assert log2.level == logging.ERROR
 
+
+
+class TestQueueLogger:
+    """testes para modo fila do logger"""
+
+    def _record(self, msg: str) -> logging.LogRecord:
+        return logging.LogRecord("test", logging.INFO, "test.py", 1, msg, (), None)
+
+    def test_queue_mode_uses_queue_handler(self) -> None:
+        log = setup_logger("test_queue_mode", use_queue=True)
+        try:
+            assert len(log.handlers) == 1
+            assert isinstance(log.handlers[0], BoundedQueueHandler)
+        finally:
+            shutdown_logging()
+
+    def test_queue_mode_flushes_on_shutdown(self, tmp_path) -> None:
+        log_file = tmp_path / "queue.log"
+        log = setup_logger("test_queue_flush", log_file=str(log_file), use_queue=True)
+
+        for i in range(100):
+            log.info("linha %d", i)
+        shutdown_logging()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 100
+        assert lines[-1].endswith("linha 99")
+
+    @pytest.mark.parametrize("overflow", ["drop", "block"])
+    def test_logs_after_shutdown_go_straight_to_handlers(self, tmp_path, overflow) -> None:
+        log_file = tmp_path / "after.log"
+        log = setup_logger(
+            "test_after_shutdown",
+            log_file=str(log_file),
+            use_queue=True,
+            queue_size=1,
+            overflow=overflow,
+        )
+        shutdown_logging()
+
+        # fila de 1: com a fila ainda no logger, block travaria e drop perderia
+        for i in range(5):
+            log.info("teardown %d", i)
+
+        assert not any(isinstance(h, BoundedQueueHandler) for h in log.handlers)
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert [line.rsplit(" ", 1)[-1] for line in lines] == ["0", "1", "2", "3", "4"]
+        setup_logger("test_after_shutdown")
+
+    def test_drop_policy_counts_dropped(self) -> None:
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), overflow="drop")
+
+        for i in range(3):
+            handler.emit(self._record(f"msg {i}"))
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 2
+
+    def test_dropped_records_sums_logger_handlers(self) -> None:
+        log = logging.getLogger("test_dropped")
+        log.handlers.clear()
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+        log.addHandler(handler)
+
+        handler.emit(self._record("a"))
+        handler.emit(self._record("b"))
+
+        assert dropped_records("test_dropped") == 1
+
+
+class TestFormatterCaches:
+    """testes para caches dos formatters"""
+
+    def _record(self, name: str = "app.api.controllers", created: float | None = None):
+        record = logging.LogRecord(name, logging.INFO, "test.py", 1, "msg %s", ("x",), None)
+        if created is not None:
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+        return record
+
+    def test_timestamp_cache_reuses_same_second(self) -> None:
+        cache = TimestampCache("%H:%M:%S")
+        first = cache.format(1_700_000_000.1)
+
+        assert cache.format(1_700_000_000.9) is first
+        assert cache.format(1_700_000_001.0) != first
+
+    def test_module_label_is_short_and_padded(self) -> None:
+        label = module_label("app.api.controllers.example_controller")
+
+        assert label == "example_control"
+        assert module_label("app") == "app".ljust(15)
+
+    def test_colored_output_matches_previous_format(self) -> None:
+        record = self._record(created=1_700_000_000.5)
+        formatted = ColoredFormatter().format(record)
+
+        expected_time = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
+        assert expected_time in formatted
+        assert "controllers" in formatted
+        assert formatted.endswith("msg x")
+
+    def test_json_formatter_outputs_object(self) -> None:
+        record = self._record(created=1_700_000_000.25)
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["level"] == "INFO"
+        assert data["logger"] == "app.api.controllers"
+        assert data["msg"] == "msg x"
+        assert data["ts"].endswith(".250")
+
+    def test_setup_logger_json_format(self) -> None:
+        log = setup_logger("test_json", json_format=True)
+        assert isinstance(log.handlers[0].formatter, JsonFormatter)
+
+
+class TestFormatterCacheBehaviour:
+    """cache dos formatters: mesmo texto que o caminho sem cache (tempo em benchmarks/)"""
+
+    def test_cached_timestamp_matches_format_time(self) -> None:
+        formatter = ColoredFormatter()
+        base = 1_700_000_000
+        for offset in (0.1, 0.9, 1.0, 61.5):
+            record = logging.LogRecord("app", logging.INFO, "test.py", 1, "m", (), None)
+            record.created = base + offset
+
+            assert formatter.format(record).startswith(
+                f"{DIM}{formatter.formatTime(record, '%H:%M:%S')}"
+            )
+
+    def test_module_label_hits_cache(self) -> None:
+        module_label.cache_clear()
+
+        first = module_label("app.api.cache_probe")
+        again = module_label("app.api.cache_probe")
+
+        assert again is first
+        info = module_label.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestRateLimitFilter:
+    """testes para rate limit por call site"""
+
+    def _record(self, msg: str = "hot path %d", level: int = logging.WARNING):
+        return logging.LogRecord("app", level, "test.py", 1, msg, (1,), None)
+
+    def test_allows_burst_then_suppresses(self) -> None:
+        rate_filter = RateLimitFilter(rate=0.001, burst=3)
+
+        allowed = [rate_filter.filter(self._record()) for _ in range(10)]
+
+        assert allowed == [True] * 3 + [False] * 7
+
+    def test_keys_are_per_template_and_level(self) -> None:
+        rate_filter = RateLimitFilter(rate=0.001, burst=1)
+
+        assert rate_filter.filter(self._record("a %d"))
+        assert rate_filter.filter(self._record("b %d"))
+        assert rate_filter.filter(self._record("a %d", logging.ERROR))
+        assert not rate_filter.filter(self._record("a %d"))
+
+    def test_summary_after_refill(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        rate_filter = RateLimitFilter(rate=1, burst=1)
+
+        rate_filter.filter(self._record())
+        for _ in range(5):
+            rate_filter.filter(self._record())
+        now[0] += 1.0
+        record = self._record()
+
+        assert rate_filter.filter(record)
+        assert record.getMessage() == "hot path 1 (suppressed 5 similar messages)"
+
+    def test_non_string_messages_are_limited(self) -> None:
+        rate_filter = RateLimitFilter(rate=0.001, burst=1)
+
+        def record(msg: object) -> logging.LogRecord:
+            return logging.LogRecord("app", logging.INFO, "test.py", 1, msg, None, None)
+
+        assert rate_filter.filter(record({"a": 1}))
+        assert not rate_filter.filter(record({"a": 1}))
+        assert rate_filter.filter(record(["b"]))
+
+    def test_logging_unhashable_message_with_rate_limit(self, tmp_path) -> None:
+        log_file = tmp_path / "dict.log"
+        log = setup_logger("test_rate_dict", log_file=str(log_file), rate_limit=10)
+        try:
+            log.info({"a": 1})
+        finally:
+            setup_logger("test_rate_dict")
+
+        assert log_file.read_text(encoding="utf-8").rstrip().endswith("{'a': 1}")
+
+    def test_evicts_least_recently_used_key(self) -> None:
+        rate_filter = RateLimitFilter(rate=0.001, burst=1, max_keys=2)
+
+        rate_filter.filter(self._record("a %d"))
+        rate_filter.filter(self._record("b %d"))
+        # "a" usado de novo: "b" vira a menos recente e sai quando "c" entra
+        assert not rate_filter.filter(self._record("a %d"))
+        rate_filter.filter(self._record("c %d"))
+
+        assert not rate_filter.filter(self._record("a %d"))
+        assert rate_filter.filter(self._record("b %d"))
+
+    def test_shared_filter_decides_once_per_record(self) -> None:
+        rate_filter = RateLimitFilter(rate=0.001, burst=1)
+        record = self._record()
+
+        # mesmo filtro em dois handlers: o segundo reusa a decisao do primeiro
+        assert rate_filter.filter(record)
+        assert rate_filter.filter(record)
+        assert not rate_filter.filter(self._record())
+
+    def test_summaries_report_pending_suppression(self) -> None:
+        rate_filter = RateLimitFilter(rate=0.001, burst=1)
+        for _ in range(4):
+            rate_filter.filter(self._record())
+
+        summaries = rate_filter.summaries()
+
+        assert [r.getMessage() for r in summaries] == ["hot path 1 (suppressed 3 similar messages)"]
+        assert summaries[0].levelno == logging.WARNING
+        assert rate_filter.filter(summaries[0])
+        assert rate_filter.summaries() == []
+
+    def test_setup_logger_installs_single_filter(self) -> None:
+        setup_logger("test_rate", rate_limit=5)
+        log = setup_logger("test_rate", rate_limit=10)
+
+        assert not log.filters
+        filters = {id(f) for h in log.handlers for f in h.filters if isinstance(f, RateLimitFilter)}
+        assert len(filters) == 1
+
+        log = setup_logger("test_rate")
+        assert not any(h.filters for h in log.handlers)
+
+    @pytest.mark.parametrize("use_queue", [False, True])
+    def test_limits_records_propagated_from_children(self, tmp_path, use_queue) -> None:
+        log_file = tmp_path / "child.log"
+        setup_logger(
+            "test_rate_child",
+            log_file=str(log_file),
+            use_queue=use_queue,
+            rate_limit=0.001,
+            rate_burst=2,
+        )
+        child = logging.getLogger("test_rate_child.service")
+
+        for i in range(10):
+            child.warning("hot path %d", i)
+        shutdown_logging()
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert lines[-1].endswith("hot path 9 (suppressed 8 similar messages)")
+        setup_logger("test_rate_child")
+
+    def test_pending_summary_emitted_on_timer(self, tmp_path) -> None:
+        log_file = tmp_path / "timer.log"
+        log = setup_logger(
+            "test_rate_timer",
+            log_file=str(log_file),
+            rate_limit=0.001,
+            rate_burst=1,
+            rate_summary_interval=0.05,
+        )
+        try:
+            for i in range(5):
+                log.warning("burst %d", i)
+
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline:
+                lines = log_file.read_text(encoding="utf-8").splitlines()
+                if len(lines) == 2:
+                    break
+                time.sleep(0.01)
+            assert lines[-1].endswith("burst 4 (suppressed 4 similar messages)")
+        finally:
+            setup_logger("test_rate_timer")
@@ -0,0 +1,189 @@
+"""
+Tests for compiled Pipeline and lazy AsyncPipeline
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.core import Pipe, Pipeline, async_pipe, async_pipeline, pipeline
+from src.core.pipe import collect
+
+
+class TestPipeline:
+    """testes para Pipeline"""
+
+    def test_matches_pipe_chain(self) -> None:
+        seen: list[int] = []
+        compiled = (
+            pipeline()
+            .map(lambda x: x + 1)
+            .when_pred(lambda x: x % 2 == 0, lambda x: x * 10)
+            .tap(seen.append)
+            .filter(lambda x: x < 100, -1)
+        )
+
+        for value in range(20):
+            expected = (
+                Pipe(value)
+                .map(lambda x: x + 1)
+                .when_pred(lambda x: x % 2 == 0, lambda x: x * 10)
+                .filter(lambda x: x < 100, -1)
+                .value
+            )
+            assert compiled(value) == expected
+
+        assert len(seen) == 20
+
+    def test_when_and_unless_resolve_at_build_time(self) -> None:
+        double = pipeline().when(True, lambda x: x * 2).unless(True, lambda x: x + 100)
+
+        assert len(double) == 1
+        assert double(3) == 6
+
+    def test_stages_return_new_pipeline(self) -> None:
+        base = pipeline().map(lambda x: x + 1)
+        doubled = base.map(lambda x: x * 2)
+        negated = base.map(lambda x: -x)
+
+        assert base(1) == 2
+        assert doubled(1) == 4
+        assert negated(1) == -2
+
+    def test_compile_is_cached(self) -> None:
+        compiled = pipeline().map(str)
+
+        assert compiled.compile() is compiled.compile()
+
+    def test_stream_is_lazy(self) -> None:
+        calls: list[int] = []
+        compiled = pipeline().tap(calls.append).map(lambda x: x * x)
+
+        stream = compiled.stream(range(5))
+        assert calls == []
+        assert next(stream) == 0
+        assert list(stream) == [1, 4, 9, 16]
+        assert calls == [0, 1, 2, 3, 4]
+
+    def test_empty_pipeline_is_identity(self) -> None:
+        empty: Pipeline[int, int] = pipeline()
+
+        assert empty(7) == 7
+        assert repr(pipeline().map(str).tap(print)) == "Pipeline(map, tap)"
+
+
+class TestAsyncPipeline:
+    """testes para AsyncPipeline"""
+
+    @pytest.mark.asyncio
+    async def test_records_stages_until_awaited(self) -> None:
+        calls: list[str] = []
+
+        async def fetch(x: int) -> int:
+            calls.append("fetch")
+            return x * 2
+
+        async def audit(x: int) -> None:
+            calls.append(f"audit {x}")
+
+        lazy = async_pipe(3).lazy().map(lambda x: x + 1).map_async(fetch).tap_async(audit)
+        assert calls == []
+
+        assert await lazy == 8
+        assert calls == ["fetch", "audit 8"]
+
+    @pytest.mark.asyncio
+    async def test_reusable_definition(self) -> None:
+        async def double(x: int) -> int:
+            return x * 2
+
+        run = async_pipeline().map_async(double).filter(lambda x: x < 10, 0)
+
+        assert [await run(x) for x in (1, 4, 6)] == [2, 8, 0]
+        assert repr(run) == "AsyncPipeline(map_async, filter)"
+        with pytest.raises(TypeError):
+            await run
+
+    @pytest.mark.asyncio
+    async def test_map_concurrent_ordered_respects_limit(self) -> None:
+        running = peak = 0
+
+        async def slow(n: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # itens maiores terminam antes
+            await asyncio.sleep(0.001 * (10 - n))
+            running -= 1
+            return n * n
+
+        result = await async_pipe(range(10)).lazy().map_concurrent(slow, limit=3).map(sum)
+
+        assert result == sum(n * n for n in range(10))
+        assert peak == 3
+        assert await async_pipeline().map_concurrent(slow, limit=3)(range(5)) == [0, 1, 4, 9, 16]
+
+    @pytest.mark.asyncio
+    async def test_map_concurrent_unordered_returns_in_completion_order(self) -> None:
+        async def delayed(n: int) -> int:
+            await asyncio.sleep(0.002 * n)
+            return n
+
+        result = await async_pipeline().map_concurrent(delayed, ordered=False)([3, 1, 2, 0])
+
+        assert result == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_siblings(self) -> None:
+        cancelled: list[int] = []
+
+        async def lookup(n: int) -> int:
+            if n == 0:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(n)
+                raise
+            return n
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await async_pipeline().map_concurrent(lookup, limit=3)(range(10))
+        assert sorted(cancelled) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stream_over_async_iterable(self) -> None:
+        produced: list[int] = []
+
+        async def source() -> AsyncIterator[int]:
+            for n in range(100):
+                produced.append(n)
+                yield n
+
+        async def double(x: int) -> int:
+            await asyncio.sleep(0)
+            return x * 2
+
+        stream = async_pipeline().map_async(double).stream(source(), limit=4)
+        first = [await anext(stream) for _ in range(3)]
+        await stream.aclose()  # type: ignore
+
+        assert first == [0, 2, 4]
+        # fonte lida sob demanda: no maximo limit itens a frente do consumidor
+        assert len(produced) <= 3 + 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_rejects_limit_below_one(self, limit: int) -> None:
+        async def echo(x: int) -> int:
+            return x
+
+        with pytest.raises(ValueError):
+            async_pipeline().map_concurrent(echo, limit=limit)
+        with pytest.raises(ValueError):
+            async_pipeline().map_async(echo).stream([1, 2, 3], limit=limit)
+        with pytest.raises(ValueError):
+            await collect([1, 2, 3], echo, limit, True)
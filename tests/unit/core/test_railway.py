@@ -0,0 +1,164 @@
+"""
+Tests for async railway combinators
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.core import (
+    Either,
+    ErrorResult,
+    Left,
+    Right,
+    combine_all_async,
+    traverse_async,
+    validate_async,
+)
+
+
+class TestTraverseAsync:
+    """testes para traverse_async"""
+
+    @pytest.mark.asyncio
+    async def test_keeps_input_order_and_respects_limit(self) -> None:
+        running = peak = 0
+
+        async def double(n: int) -> Either[str, int]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # itens maiores terminam antes: ordem de chegada != ordem de entrada
+            await asyncio.sleep(0.001 * (10 - n))
+            running -= 1
+            return Right(n * 2)
+
+        result = await traverse_async(range(10), double, limit=3)
+
+        assert result == Right([n * 2 for n in range(10)])
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_first_left_cancels_siblings(self) -> None:
+        cancelled: list[int] = []
+        started: list[int] = []
+
+        async def lookup(n: int) -> Either[str, int]:
+            started.append(n)
+            if n == 1:
+                await asyncio.sleep(0.01)
+                return Left(f"falhou {n}")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(n)
+                raise
+            return Right(n)
+
+        result = await asyncio.wait_for(traverse_async(range(10), lookup, limit=4), timeout=0.5)
+
+        assert result == Left("falhou 1")
+        assert sorted(cancelled) == [0, 2, 3]
+        # itens alem do limite nunca comecaram
+        assert sorted(started) == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_after_cancelling(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def lookup(n: int) -> Either[str, int]:
+            if n == 0:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return Right(n)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await traverse_async(range(2), lookup)
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self) -> None:
+        async def never(n: int) -> Either[str, int]:
+            raise AssertionError
+
+        assert await traverse_async([], never) == Right([])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_rejects_limit_below_one(self, limit: int) -> None:
+        async def value(n: int) -> Either[str, int]:
+            return Right(n)
+
+        with pytest.raises(ValueError):
+            await traverse_async(range(3), value, limit=limit)
+        with pytest.raises(ValueError):
+            await validate_async(range(3), value, limit=limit)  # type: ignore
+
+
+class TestValidateAsync:
+    """testes para validate_async"""
+
+    @pytest.mark.asyncio
+    async def test_accumulates_all_errors_in_input_order(self) -> None:
+        async def check(n: int) -> Either[ErrorResult, int]:
+            await asyncio.sleep(0.001 * (5 - n))
+            if n % 2:
+                return Left(ErrorResult.validation(f"item {n} invalido"))
+            return Right(n)
+
+        result = await validate_async(range(5), check, limit=2)
+
+        assert isinstance(result, Left)
+        assert result.value.messages == ("item 1 invalido", "item 3 invalido")
+        assert result.value.is_validation
+
+    @pytest.mark.asyncio
+    async def test_all_valid(self) -> None:
+        async def check(n: int) -> Either[ErrorResult, int]:
+            return Right(n)
+
+        assert await validate_async(range(3), check) == Right([0, 1, 2])
+
+
+class TestCombineAllAsync:
+    """testes para combine_all_async"""
+
+    @pytest.mark.asyncio
+    async def test_combines_into_tuple(self) -> None:
+        async def value(n: int) -> Either[str, int]:
+            await asyncio.sleep(0)
+            return Right(n)
+
+        assert await combine_all_async(value(1), value(2), value(3)) == Right((1, 2, 3))
+
+    @pytest.mark.asyncio
+    async def test_left_closes_unstarted_coroutines(self) -> None:
+        ran: list[int] = []
+
+        async def value(n: int) -> Either[str, int]:
+            ran.append(n)
+            return Left("erro") if n == 0 else Right(n)
+
+        pending = [value(n) for n in range(4)]
+        result = await combine_all_async(*pending, limit=1)
+
+        assert result == Left("erro")
+        assert ran == [0]
+        assert all(c.cr_frame is None for c in pending)
+
+
+class TestErrorResultMerge:
+    """testes para ErrorResult.merge"""
+
+    def test_merge_keeps_messages_and_flags(self) -> None:
+        merged = ErrorResult.merge([ErrorResult.validation("a"), ErrorResult.not_found("b")])
+
+        assert merged.messages == ("a", "b")
+        assert merged.is_validation and merged.is_not_found
+        assert merged.http_status == 400
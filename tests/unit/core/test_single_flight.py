@@ -0,0 +1,77 @@
+"""
+Tests for SingleFlight
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.core import SingleFlight
+
+
+class TestSingleFlight:
+    """testes para coalescencia de chamadas"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_same_key_runs_once(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+        runs = 0
+
+        async def work() -> int:
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flights.do("k", work) for _ in range(10)))
+
+        assert results == [42] * 10
+        assert runs == 1
+        assert flights.snapshot() == {"calls": 10, "executions": 1, "coalesced": 9, "inflight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_and_sequential_calls_run_separately(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def work() -> str:
+            await asyncio.sleep(0)
+            return "ok"
+
+        await asyncio.gather(flights.do("a", work), flights.do("b", work))
+        await flights.do("a", work)
+
+        assert flights.stats.executions == 3
+        assert flights.stats.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(flights.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flights.stats.executions == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def work() -> int:
+            await asyncio.sleep(0.02)
+            return 1
+
+        first = asyncio.ensure_future(flights.do("k", work))
+        second = asyncio.ensure_future(flights.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 1
+        assert first.cancelled()
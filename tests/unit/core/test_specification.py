@@ -4,9 +4,13 @@ Tests for Specification Pattern
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 
-from src.core import Left, Right, Specification
+from src.core import Left, Right, Specification, specification
+from src.core.filters import AllOf, AnyOf, Compare, Negate, to_predicate
+from src.core.option import Nothing, Some
 from src.core.specification import (
     InRangeSpec,
     MaxLengthSpec,
@@ -126,3 +130,131 @@ class TestSpecification:
         assert isinstance(result, Left)
         assert result.value.is_validation
 
+
+
+class TestCompiledSpecification:
+    """testes para Specification.compile"""
+
+    def test_flattens_nested_and_into_single_node(self) -> None:
+        spec = (NotEmptySpec() & MinLengthSpec(2)) & (MaxLengthSpec(10) & MinLengthSpec(1))
+        compiled = spec.compile()
+
+        assert compiled.node[0] == "and"
+        assert len(compiled.node[1]) == 4
+
+    def test_removes_double_negation(self) -> None:
+        leaf = NotEmptySpec()
+        compiled = (~~leaf).compile()
+
+        assert compiled.node == ("leaf", leaf)
+
+    def test_matches_recursive_evaluation(self) -> None:
+        spec = (MinLengthSpec(3) | ~NotEmptySpec()) & ~~MaxLengthSpec(5) & NotEmptySpec()
+        compiled = spec.compile()
+
+        for value in ["", "a", "abc", "abcde", "abcdef", "   "]:
+            assert compiled.is_satisfied_by(value) == spec.is_satisfied_by(value)
+
+    def test_validate_accumulates_all_and_errors(self) -> None:
+        spec = (NotEmptySpec("Nome") & MinLengthSpec(3, "Nome")) & MaxLengthSpec(5, "Nome")
+        compiled = spec.compile()
+
+        result = compiled.validate("")
+
+        assert isinstance(result, Left)
+        assert result.value.messages == (
+            "Nome nao pode estar vazio",
+            "Nome deve ter no minimo 3 caracteres",
+        )
+
+    def test_validate_returns_right_on_success(self) -> None:
+        compiled = (NotEmptySpec() & MaxLengthSpec(5)).compile()
+        result = compiled.validate("John")
+        assert isinstance(result, Right)
+
+    def test_compiled_spec_composes_again(self) -> None:
+        compiled = (NotEmptySpec() & MinLengthSpec(2)).compile()
+        recompiled = (compiled & MaxLengthSpec(4)).compile()
+
+        assert len(recompiled.node[1]) == 3
+        assert recompiled.is_satisfied_by("abc")
+        assert not recompiled.is_satisfied_by("abcde")
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def numpy_mode(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """roda o teste com e sem numpy"""
+    if request.param and not specification.NUMPY_AVAILABLE:
+        pytest.skip("numpy nao instalado")
+    monkeypatch.setattr(specification, "NUMPY_AVAILABLE", request.param)
+    return request.param
+
+
+class TestBatchSpecification:
+    """testes para avaliacao em lote"""
+
+    def test_numeric_mask_matches_per_item(self, numpy_mode: bool) -> None:
+        values = [-5, 0, 1, 50, 100, 101]
+        spec = InRangeSpec(1, 100) & PositiveNumberSpec() | ~PositiveNumberSpec()
+
+        assert spec.mask(values) == [spec.is_satisfied_by(v) for v in values]
+
+    def test_filter_many_and_indices(self, numpy_mode: bool) -> None:
+        values = [3, -1, 7, 0]
+        spec = PositiveNumberSpec()
+
+        assert spec.indices(values) == [0, 2]
+        assert spec.filter_many(values) == [3, 7]
+
+    def test_field_spec_filters_entities(self, numpy_mode: bool) -> None:
+        rows = [SimpleNamespace(name=n, value=v) for n, v in [("a", 5), ("b", 50), ("", 70)]]
+        spec = InRangeSpec(10, 100).on("value") & NotEmptySpec().on("name")
+
+        assert spec.filter_many(rows) == [rows[1]]
+        assert spec.is_satisfied_by(rows[1])
+
+    def test_compiled_spec_batch(self, numpy_mode: bool) -> None:
+        values = ["", "ab", "abcdef", "abc"]
+        spec = (NotEmptySpec() & MinLengthSpec(2) & ~~MaxLengthSpec(4)).compile()
+
+        assert spec.mask(values) == [False, True, False, True]
+
+    def test_non_numeric_falls_back(self, numpy_mode: bool) -> None:
+        values = [1, 2**70, 3]
+        assert PositiveNumberSpec().mask(values) == [True, True, True]
+
+    def test_empty_batch(self, numpy_mode: bool) -> None:
+        assert PositiveNumberSpec().filter_many([]) == []
+
+
+class TestSpecificationFilter:
+    """testes para traducao de spec em filtro de repositorio"""
+
+    def test_field_spec_translates_leaf(self) -> None:
+        result = PositiveNumberSpec().on("value").to_filter()
+        assert result == Some(Compare("value", "gt", 0))
+
+    def test_composition_translates_tree(self) -> None:
+        spec = InRangeSpec(1, 9).on("value") | ~PositiveNumberSpec().on("value")
+
+        result = spec.to_filter()
+
+        assert isinstance(result, Some)
+        assert isinstance(result.value, AnyOf)
+        assert isinstance(result.value.items[0], AllOf)
+        assert result.value.items[1] == Negate(Compare("value", "gt", 0))
+
+    def test_untranslatable_leaf_makes_tree_untranslatable(self) -> None:
+        spec = PositiveNumberSpec().on("value") & NotEmptySpec().on("name")
+        assert isinstance(spec.to_filter(), Nothing)
+        assert isinstance(spec.compile().to_filter(), Nothing)
+
+    def test_compiled_spec_filter_matches_evaluation(self) -> None:
+        rows = [SimpleNamespace(value=v) for v in [-3, 0, 4, 12]]
+        spec = (InRangeSpec(1, 10).on("value") | ~~PositiveNumberSpec().on("value")).compile()
+
+        result = spec.to_filter()
+
+        assert isinstance(result, Some)
+        predicate = to_predicate(result.value)
+        assert [predicate(r) for r in rows] == [spec.is_satisfied_by(r) for r in rows]
@@ -4,17 +4,23 @@ Tests for Example Handler
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from src.core import Left, Right
+from src.core import Left, Right, SingleFlight
 from src.application.handlers.example_handler import (
     CreateExampleCommand,
     ExampleHandler,
     GetByIdQuery,
     ListAllQuery,
+    UpdateExampleCommand,
+    to_response,
 )
 from src.application.services.example_service import ExampleService
+from src.application.view_models import ExampleResponse
+from src.domain.entities.example import Example
 from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
 
 
@@ -45,6 +51,37 @@ class TestCreateExample:
         assert isinstance(result, Left)
 
 
+class TestCreateMany:
+    """testes para criacao em lote"""
+
+    @pytest.mark.asyncio
+    async def test_create_many_keeps_input_order(self, handler: ExampleHandler) -> None:
+        cmds = [CreateExampleCommand(name=f"Item {i}") for i in range(3)]
+        results = await handler.create_many(cmds)
+
+        assert all(isinstance(r, Right) for r in results)
+        assert [r.value.name for r in results] == ["Item 0", "Item 1", "Item 2"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_rejects_duplicates_in_batch_and_store(
+        self, handler: ExampleHandler
+    ) -> None:
+        await handler.create(CreateExampleCommand(name="Stored"))
+        cmds = [
+            CreateExampleCommand(name="New"),
+            CreateExampleCommand(name="New"),
+            CreateExampleCommand(name="Stored"),
+            CreateExampleCommand(name=""),
+        ]
+
+        results = await handler.create_many(cmds)
+
+        assert isinstance(results[0], Right)
+        assert all(isinstance(r, Left) and r.value.is_validation for r in results[1:])
+        listed = await handler.list_all(ListAllQuery())
+        assert listed.total == 2
+
+
 class TestGetById:
     """testes para busca por id"""
 
@@ -108,3 +145,178 @@ class TestListAll:
         assert result.page == 1
         assert result.total_pages == 3
 
+    @pytest.mark.asyncio
+    async def test_list_cursor_continues_first_page(self, handler: ExampleHandler) -> None:
+        for i in range(8):
+            await handler.create(CreateExampleCommand(name=f"Item {i}"))
+
+        first = await handler.list_all(ListAllQuery(page_size=5))
+        second = await handler.list_all(ListAllQuery(page_size=5, cursor=first.next_cursor))
+
+        assert first.next_cursor is not None
+        assert [i.name for i in second.items] == ["Item 5", "Item 6", "Item 7"]
+        assert second.next_cursor is None
+        assert second.total == 8
+
+
+
+class TestUpdateExample:
+    """testes para atualizacao"""
+
+    @pytest.mark.asyncio
+    async def test_rename_to_existing_name_fails(self, handler: ExampleHandler) -> None:
+        await handler.create(CreateExampleCommand(name="First"))
+        created = await handler.create(CreateExampleCommand(name="Second"))
+
+        cmd = UpdateExampleCommand(id=created.value.id, name="First")
+        result = await handler.update(cmd)
+
+        assert isinstance(result, Left)
+        assert result.value.is_validation
+
+    @pytest.mark.asyncio
+    async def test_rename_frees_old_name(self, handler: ExampleHandler) -> None:
+        created = await handler.create(CreateExampleCommand(name="Old"))
+
+        await handler.update(UpdateExampleCommand(id=created.value.id, name="New"))
+        result = await handler.create(CreateExampleCommand(name="Old"))
+
+        assert isinstance(result, Right)
+
+
+class SlowRepository(InMemoryExampleRepository):
+    """repositorio com latencia que conta leituras"""
+
+    __slots__ = ("reads",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    async def get_by_id(self, id: UUID):
+        # le antes da latencia: quem le junto ve a mesma versao (janela de corrida)
+        self.reads += 1
+        result = await super().get_by_id(id)
+        await asyncio.sleep(0.01)
+        return result
+
+    async def list_after(self, cursor: str | None, page_size: int = 10):
+        self.reads += 1
+        await asyncio.sleep(0.01)
+        return await super().list_after(cursor, page_size)
+
+
+class TestSingleFlightQueries:
+    """testes para coalescencia de leituras no handler"""
+
+    @pytest.mark.asyncio
+    async def test_thundering_herd_hits_backend_once(self) -> None:
+        repo = SlowRepository()
+        flights: SingleFlight[object] = SingleFlight()
+        # um handler por request, single flight compartilhado (como na DI)
+        handlers = [ExampleHandler(ExampleService(repo), flights) for _ in range(50)]
+        created = await handlers[0].create(CreateExampleCommand(name="Hot"))
+        query = GetByIdQuery(id=created.value.id)
+
+        results = await asyncio.gather(*(h.get_by_id(query) for h in handlers))
+
+        assert all(r.value.name == "Hot" for r in results)
+        assert repo.reads == 1
+        assert flights.stats.coalesced == 49
+
+    @pytest.mark.asyncio
+    async def test_list_queries_coalesce_by_value(self) -> None:
+        repo = SlowRepository()
+        handler = ExampleHandler(ExampleService(repo))
+
+        await asyncio.gather(
+            handler.list_all(ListAllQuery(page_size=5)),
+            handler.list_all(ListAllQuery(page_size=5)),
+            handler.list_all(ListAllQuery(page_size=6)),
+        )
+
+        assert repo.reads == 2
+
+
+class TestOptimisticConcurrency:
+    """testes para update com versao esperada"""
+
+    @pytest.mark.asyncio
+    async def test_stale_expected_version_conflicts(self, handler: ExampleHandler) -> None:
+        created = await handler.create(CreateExampleCommand(name="Versioned"))
+        id = created.value.id
+        await handler.update(UpdateExampleCommand(id=id, value=1, expected_version=1))
+
+        result = await handler.update(UpdateExampleCommand(id=id, value=2, expected_version=1))
+
+        assert isinstance(result, Left)
+        assert result.value.is_conflict
+        assert result.value.http_status == 409
+
+    @pytest.mark.asyncio
+    async def test_update_does_not_mutate_entity_seen_by_readers(self) -> None:
+        repo = InMemoryExampleRepository()
+        service = ExampleService(repo)
+        created = await service.create(name="Snapshot", value=1)
+        seen = created.value
+
+        await service.update(seen.id, value=2)
+
+        assert seen.value == 1
+        assert seen.version == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_same_version_only_one_wins(self) -> None:
+        repo = SlowRepository()
+        handler = ExampleHandler(ExampleService(repo))
+        created = await handler.create(CreateExampleCommand(name="Contended"))
+        id = created.value.id
+
+        results = await asyncio.gather(
+            *(
+                handler.update(UpdateExampleCommand(id=id, value=i, expected_version=1))
+                for i in range(20)
+            )
+        )
+
+        assert sum(isinstance(r, Right) for r in results) == 1
+        assert all(r.value.is_conflict for r in results if isinstance(r, Left))
+
+    @pytest.mark.asyncio
+    async def test_stress_no_lost_updates(self) -> None:
+        repo = SlowRepository()
+        service = ExampleService(repo)
+        created = await service.create(name="Stress")
+        id = created.value.id
+
+        results = await asyncio.gather(
+            *(service.update(id, description=f"writer {i}") for i in range(50))
+        )
+
+        # cada sucesso gravou uma versao distinta, nenhuma escrita sumiu em silencio
+        wins = [r.value for r in results if isinstance(r, Right)]
+        final = (await service.get_by_id(id)).value
+        assert wins
+        assert final.version == 1 + len(wins)
+        assert len({w.version for w in wins}) == len(wins)
+        assert final.description == max(wins, key=lambda w: w.version).description
+        assert all(r.value.is_conflict for r in results if isinstance(r, Left))
+
+
+class TestToResponse:
+    """testes para o mapper entidade -> response"""
+
+    def test_maps_entity_fields(self) -> None:
+        entity = Example.create(name="Mapped", description="d", value=7)
+        entity.activate()
+
+        response = to_response(entity)
+
+        assert response == ExampleResponse(
+            id=entity.id,
+            name="Mapped",
+            description="d",
+            value=7,
+            status="active",
+            version=entity.version,
+        )
@@ -0,0 +1 @@
+# repository tests
@@ -0,0 +1,155 @@
+"""
+Tests for LruTtlCache and CachedExampleRepository
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+
+from src.core.option import Nothing, Some
+from src.domain.entities.example import Example
+from src.infrastructure.repositories import CachedExampleRepository, InMemoryExampleRepository
+from src.infrastructure.services.cache import LruTtlCache
+
+
+class FakeClock:
+    """relogio manual"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingRepository(InMemoryExampleRepository):
+    """conta idas a origem"""
+
+    __slots__ = ("reads",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    async def get_by_id(self, id: UUID):
+        self.reads += 1
+        return await super().get_by_id(id)
+
+
+@pytest.fixture
+def counting() -> CountingRepository:
+    return CountingRepository()
+
+
+@pytest.fixture
+def responses() -> LruTtlCache[UUID, bytes]:
+    return LruTtlCache(max_size=10)
+
+
+@pytest.fixture
+def cached(
+    counting: CountingRepository, responses: LruTtlCache[UUID, bytes]
+) -> CachedExampleRepository:
+    return CachedExampleRepository(counting, LruTtlCache(max_size=10), (responses,))
+
+
+class TestLruTtlCache:
+    """testes para o cache LRU/TTL"""
+
+    def test_hit_and_miss_counters(self) -> None:
+        cache: LruTtlCache[str, int] = LruTtlCache(max_size=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == Some(1)
+        assert isinstance(cache.get("b"), Nothing)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LruTtlCache[str, int] = LruTtlCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert isinstance(cache.get("b"), Nothing)
+        assert cache.get("a") == Some(1)
+        assert cache.stats.evictions == 1
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache: LruTtlCache[str, int] = LruTtlCache(max_size=2, ttl=5, clock=clock)
+        cache.put("a", 1)
+
+        clock.now = 4.9
+        assert cache.get("a") == Some(1)
+        clock.now = 5.0
+        assert isinstance(cache.get("a"), Nothing)
+        assert cache.stats.expirations == 1
+
+    def test_put_with_stale_generation_is_ignored(self) -> None:
+        cache: LruTtlCache[str, int] = LruTtlCache()
+        generation = cache.generation
+        cache.invalidate("a")
+
+        cache.put("a", 1, generation)
+
+        assert isinstance(cache.get("a"), Nothing)
+
+
+class TestCachedExampleRepository:
+    """testes para o decorator de cache"""
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_cache(
+        self, cached: CachedExampleRepository, counting: CountingRepository, sample_entity: Example
+    ) -> None:
+        await cached.save(sample_entity)
+
+        first = await cached.get_by_id(sample_entity.id)
+        second = await cached.get_by_id(sample_entity.id)
+
+        assert first == second == Some(sample_entity)
+        assert counting.reads == 1
+        assert cached.cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_is_not_cached(
+        self, cached: CachedExampleRepository, counting: CountingRepository, sample_entity: Example
+    ) -> None:
+        assert isinstance(await cached.get_by_id(sample_entity.id), Nothing)
+        await cached.save(sample_entity)
+
+        assert await cached.get_by_id(sample_entity.id) == Some(sample_entity)
+        assert counting.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_entity_and_dependents(
+        self,
+        cached: CachedExampleRepository,
+        responses: LruTtlCache[UUID, bytes],
+        sample_entity: Example,
+    ) -> None:
+        await cached.save(sample_entity)
+        await cached.get_by_id(sample_entity.id)
+        responses.put(sample_entity.id, b"{}")
+
+        await cached.delete(sample_entity.id)
+
+        assert isinstance(await cached.get_by_id(sample_entity.id), Nothing)
+        assert isinstance(responses.get(sample_entity.id), Nothing)
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_inner_and_caches(
+        self, cached: CachedExampleRepository, sample_entity: Example
+    ) -> None:
+        await cached.save(sample_entity)
+        await cached.get_by_id(sample_entity.id)
+
+        cached.clear()
+
+        assert len(cached.cache) == 0
+        assert isinstance(await cached.get_by_id(sample_entity.id), Nothing)
@@ -0,0 +1,248 @@
+"""
+Tests for ColumnarExampleRepository
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+
+from src.application.specifications.example_specs import (
+    ExampleActiveSpec,
+    ExampleStatusSpec,
+    NameNotEmptySpec,
+    ValueInRangeSpec,
+)
+from src.core import Left, Right
+from src.core.option import Nothing, Some
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.repositories.columnar_example_repository import (
+    NUMPY_AVAILABLE,
+    ColumnarExampleRepository,
+)
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy nao instalado")
+
+
+@pytest.fixture
+def columnar_repository() -> ColumnarExampleRepository:
+    """retorna repositorio colunar com capacidade pequena (forca crescimento)"""
+    return ColumnarExampleRepository(capacity=2)
+
+
+class TestColumnarExampleRepository:
+    """testes para repositorio colunar"""
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_roundtrip(
+        self, columnar_repository: ColumnarExampleRepository, active_entity: Example
+    ) -> None:
+        active_entity.created_by = "alice"
+        result = await columnar_repository.save(active_entity)
+        assert isinstance(result, Right)
+
+        found = await columnar_repository.get_by_id(active_entity.id)
+
+        assert isinstance(found, Some)
+        assert found.value == active_entity
+        assert found.value is not active_entity
+
+    @pytest.mark.asyncio
+    async def test_get_by_name_and_update(
+        self, columnar_repository: ColumnarExampleRepository, sample_entity: Example
+    ) -> None:
+        await columnar_repository.save(sample_entity)
+        sample_entity.name = "Renamed"
+        sample_entity.mark_updated()
+        await columnar_repository.save(sample_entity)
+
+        assert isinstance(await columnar_repository.get_by_name("Test"), Nothing)
+        found = await columnar_repository.get_by_name("Renamed")
+        assert isinstance(found, Some)
+        assert found.value.updated_at == sample_entity.updated_at
+        assert found.value.version == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_is_soft(
+        self, columnar_repository: ColumnarExampleRepository, sample_entity: Example
+    ) -> None:
+        await columnar_repository.save(sample_entity)
+        await columnar_repository.delete(sample_entity.id)
+
+        assert isinstance(await columnar_repository.get_by_id(sample_entity.id), Nothing)
+        assert isinstance(await columnar_repository.get_by_name("Test"), Nothing)
+        assert columnar_repository.count() == 0
+        _, total = await columnar_repository.list_all(1, 10)
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_list_all_and_cursor_grow_past_capacity(
+        self, columnar_repository: ColumnarExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(7)]
+        await columnar_repository.save_many(created[:3])
+        for entity in created[3:]:
+            await columnar_repository.save(entity)
+
+        page, total = await columnar_repository.list_all(2, 2)
+        assert total == 7
+        assert [e.id for e in page] == [created[2].id, created[3].id]
+
+        first, _, cursor = await columnar_repository.list_after(None, 4)
+        second, _, last_cursor = await columnar_repository.list_after(cursor, 4)
+        assert [e.id for e in first + second] == [e.id for e in created]
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_breaks_created_at_ties_by_id(
+        self, columnar_repository: ColumnarExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        for entity in created:
+            entity.created_at = created[0].created_at
+        await columnar_repository.save_many(created)
+
+        first, _, cursor = await columnar_repository.list_after(None, 2)
+        rest, _, _ = await columnar_repository.list_after(cursor, 10)
+
+        expected = sorted(created, key=lambda e: e.id)
+        assert [e.id for e in first + rest] == [e.id for e in expected]
+
+    @pytest.mark.asyncio
+    async def test_iter_batches_tolerates_insert_between_batches(
+        self, columnar_repository: ColumnarExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        await columnar_repository.save_many(created)
+        early = Example.create(name="Early")
+        early.created_at -= timedelta(days=1)
+
+        seen: list[UUID] = []
+        async for batch in columnar_repository.iter_batches(2):
+            seen.extend(e.id for e in batch)
+            await columnar_repository.save(early)
+
+        assert seen == [e.id for e in created]
+
+    @pytest.mark.asyncio
+    async def test_find_uses_column_mask(
+        self, columnar_repository: ColumnarExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}", value=i * 10) for i in range(10)]
+        for entity in created[::2]:
+            entity.activate()
+        await columnar_repository.save_many(created)
+        spec = ExampleActiveSpec() & ~ValueInRangeSpec(0, 30).on("value")
+
+        items, total = await columnar_repository.find(spec, 1, 2)
+
+        assert [e.id for e in items] == [created[4].id, created[6].id]
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_find_by_status_and_untranslatable_spec(
+        self, columnar_repository: ColumnarExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        created[3].deactivate()
+        await columnar_repository.save_many(created)
+
+        inactive, total = await columnar_repository.find(ExampleStatusSpec(Status.INACTIVE))
+        assert [e.id for e in inactive] == [created[3].id]
+        assert total == 1
+
+        items, total = await columnar_repository.find(NameNotEmptySpec().on("name"), 2, 2)
+        assert [e.id for e in items] == [e.id for e in created[2:4]]
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_stats_and_counts(self, columnar_repository: ColumnarExampleRepository) -> None:
+        created = [Example.create(name=f"Item {i}", value=i * 10) for i in range(4)]
+        created[1].activate()
+        await columnar_repository.save_many(created)
+        await columnar_repository.delete(created[0].id)
+
+        stats = await columnar_repository.stats()
+
+        assert stats.total == 3
+        assert (stats.value_sum, stats.value_min, stats.value_max) == (60, 10, 30)
+        assert stats.value_avg == 20
+        assert stats.by_status == {"pending": 2, "active": 1, "inactive": 0}
+        assert columnar_repository.count(Status.ACTIVE) == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_empty(self, columnar_repository: ColumnarExampleRepository) -> None:
+        stats = await columnar_repository.stats()
+
+        assert stats.total == 0
+        assert stats.value_min is None and stats.value_avg is None
+
+    @pytest.mark.asyncio
+    async def test_compare_and_save_checks_version(
+        self, columnar_repository: ColumnarExampleRepository, sample_entity: Example
+    ) -> None:
+        await columnar_repository.save(sample_entity)
+        sample_entity.mark_updated()
+
+        assert isinstance(await columnar_repository.compare_and_save(sample_entity, 1), Right)
+        stale = await columnar_repository.compare_and_save(sample_entity, 1)
+        missing = await columnar_repository.compare_and_save(Example.create(name="Ghost"), 1)
+
+        assert isinstance(stale, Left) and stale.value.is_conflict
+        assert isinstance(missing, Left) and missing.value.is_not_found
+
+    @pytest.mark.asyncio
+    async def test_revision_changes_on_write(
+        self, columnar_repository: ColumnarExampleRepository, sample_entity: Example
+    ) -> None:
+        before = await columnar_repository.revision()
+        await columnar_repository.save(sample_entity)
+
+        assert await columnar_repository.revision() != before
+
+    @pytest.mark.asyncio
+    async def test_value_beyond_int64_is_left(
+        self, columnar_repository: ColumnarExampleRepository, sample_entity: Example
+    ) -> None:
+        await columnar_repository.save(sample_entity)
+        big = Example.create(name="Big", value=2**63)
+
+        assert isinstance(await columnar_repository.save(big), Left)
+        result = await columnar_repository.save_many([Example.create(name="Ok"), big])
+        assert isinstance(result, Left) and result.value.is_validation
+        # lote rejeitado inteiro
+        assert columnar_repository.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_order_stays_sorted_under_mixed_writes(
+        self, columnar_repository: ColumnarExampleRepository
+    ) -> None:
+        rng = random.Random(7)
+        base = Example.create(name="base").created_at
+        live: dict[UUID, Example] = {}
+        for i in range(300):
+            op = rng.random()
+            if op < 0.5 or not live:
+                # created_at fora de ordem e empatado de proposito
+                entity = Example.create(name=f"Item {i}")
+                entity.created_at = base + timedelta(seconds=rng.randrange(20))
+                await columnar_repository.save(entity)
+                live[entity.id] = entity
+            elif op < 0.8:
+                id = rng.choice(list(live))
+                await columnar_repository.delete(id)
+                del live[id]
+            else:
+                entity = live[rng.choice(list(live))]
+                entity.created_at = base + timedelta(seconds=rng.randrange(20))
+                await columnar_repository.save(entity)
+
+        page, total = await columnar_repository.list_all(1, 1000)
+
+        expected = sorted(live.values(), key=lambda e: (e.created_at, e.id.int))
+        assert total == len(live)
+        assert [e.id for e in page] == [e.id for e in expected]
@@ -0,0 +1,188 @@
+"""
+Tests for ExampleJournal and DurableExampleRepository
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.core import Left, Right
+from src.core.option import Nothing, Some
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.repositories.durable_example_repository import DurableExampleRepository
+from src.infrastructure.repositories.example_journal import (
+    ExampleJournal,
+    decode_row,
+    encode_row,
+)
+
+
+@pytest.fixture
+def durable_repository(tmp_path: Path) -> DurableExampleRepository:
+    """retorna repositorio duravel num diretorio temporario"""
+    return DurableExampleRepository.recover(ExampleJournal(tmp_path))
+
+
+def reopen(repository: DurableExampleRepository, path: Path) -> DurableExampleRepository:
+    """simula restart: fecha o journal e recupera do disco"""
+    repository.stop()
+    return DurableExampleRepository.recover(ExampleJournal(path))
+
+
+class TestRowCodec:
+    """testes para a codificacao binaria das linhas"""
+
+    def test_roundtrip_keeps_all_fields(self, active_entity: Example) -> None:
+        active_entity.description = "descricao com acento: cafe"
+        active_entity.created_by = "alice"
+        active_entity.mark_updated("bob")
+
+        decoded, offset = decode_row(encode_row(active_entity), 0)
+
+        assert decoded == active_entity
+        assert decoded.updated_by == "bob" and decoded.version == active_entity.version
+        assert offset == len(encode_row(active_entity))
+
+    def test_roundtrip_keeps_none_fields(self, sample_entity: Example) -> None:
+        decoded, _ = decode_row(encode_row(sample_entity), 0)
+
+        assert decoded.updated_at is None
+        assert decoded.created_by is None and decoded.updated_by is None
+
+
+class TestDurableExampleRepository:
+    """testes para repositorio em memoria com journal"""
+
+    @pytest.mark.asyncio
+    async def test_writes_survive_restart(
+        self, durable_repository: DurableExampleRepository, tmp_path: Path
+    ) -> None:
+        created = [Example.create(name=f"Item {i}", value=i) for i in range(3)]
+        await durable_repository.save_many(created)
+        created[1].activate()
+        await durable_repository.save(created[1])
+        await durable_repository.delete(created[2].id)
+
+        restarted = reopen(durable_repository, tmp_path)
+
+        found = await restarted.get_by_id(created[1].id)
+        assert isinstance(found, Some) and found.value.status == Status.ACTIVE
+        assert isinstance(await restarted.get_by_id(created[2].id), Nothing)
+        assert isinstance(await restarted.get_by_name("Item 0"), Some)
+        _, total = await restarted.list_all(1, 10)
+        assert total == 2
+        restarted.stop()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_then_replay_tail(
+        self, durable_repository: DurableExampleRepository, tmp_path: Path
+    ) -> None:
+        created = [Example.create(name=f"Item {i}", value=i) for i in range(4)]
+        await durable_repository.save_many(created)
+        await durable_repository.delete(created[0].id)
+
+        assert await durable_repository.checkpoint() == 3
+        created[1].value = 99
+        await durable_repository.save(created[1])
+
+        restarted = reopen(durable_repository, tmp_path)
+
+        stats = restarted.journal.snapshot()
+        assert stats["recovered_rows"] == 3
+        assert stats["replayed_records"] == 1
+        # so o segmento atual e o anterior ao restart sobram
+        assert len(list(tmp_path.glob("log-*.bin"))) == 2
+        found = await restarted.get_by_id(created[1].id)
+        assert isinstance(found, Some) and found.value.value == 99
+        assert (await restarted.stats()).total == 3
+        restarted.stop()
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_is_truncated(
+        self, durable_repository: DurableExampleRepository, tmp_path: Path
+    ) -> None:
+        first, second = Example.create(name="First"), Example.create(name="Second")
+        await durable_repository.save(first)
+        await durable_repository.save(second)
+        durable_repository.stop()
+        # escrita interrompida no meio do ultimo registro
+        segment = max(tmp_path.glob("log-*.bin"))
+        segment.write_bytes(segment.read_bytes()[:-5])
+
+        restarted = DurableExampleRepository.recover(ExampleJournal(tmp_path))
+
+        assert isinstance(await restarted.get_by_id(first.id), Some)
+        assert isinstance(await restarted.get_by_id(second.id), Nothing)
+        # cauda cortada: proximo replay nao tropeca no lixo
+        await restarted.save(second)
+        again = reopen(restarted, tmp_path)
+        assert isinstance(await again.get_by_id(second.id), Some)
+        again.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_fsync(
+        self, durable_repository: DurableExampleRepository
+    ) -> None:
+        entities = [Example.create(name=f"Item {i}") for i in range(50)]
+
+        results = await asyncio.gather(*(durable_repository.save(e) for e in entities))
+
+        assert all(isinstance(r, Right) for r in results)
+        stats = durable_repository.journal.snapshot()
+        assert stats["records"] == 50
+        assert stats["commits"] < 50
+        durable_repository.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_not_logged(
+        self, durable_repository: DurableExampleRepository, sample_entity: Example
+    ) -> None:
+        await durable_repository.save(sample_entity)
+
+        stale = await durable_repository.compare_and_save(sample_entity, 7)
+
+        assert isinstance(stale, Left) and stale.value.is_conflict
+        assert durable_repository.journal.snapshot()["records"] == 1
+        durable_repository.stop()
+
+    @pytest.mark.asyncio
+    async def test_value_beyond_int64_is_left_and_not_applied(
+        self, durable_repository: DurableExampleRepository
+    ) -> None:
+        big = Example.create(name="Big", value=-(2**63) - 1)
+
+        result = await durable_repository.save(big)
+
+        assert isinstance(result, Left) and result.value.is_validation
+        assert isinstance(await durable_repository.get_by_id(big.id), Nothing)
+        assert durable_repository.journal.snapshot()["records"] == 0
+        durable_repository.stop()
+
+    @pytest.mark.asyncio
+    async def test_fsync_error_becomes_left(
+        self,
+        durable_repository: DurableExampleRepository,
+        sample_entity: Example,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def broken(fd: int) -> None:
+            raise OSError("disco cheio")
+
+        monkeypatch.setattr("src.infrastructure.repositories.example_journal.os.fsync", broken)
+
+        result = await durable_repository.save(sample_entity)
+
+        assert isinstance(result, Left)
+        monkeypatch.undo()
+        durable_repository.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_without_pending_returns(
+        self, durable_repository: DurableExampleRepository
+    ) -> None:
+        await asyncio.wait_for(durable_repository.journal.flush(), timeout=1)
+        durable_repository.stop()
@@ -0,0 +1,344 @@
+"""
+Tests for InMemoryExampleRepository
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.core import Right
+from src.core.option import Nothing, Some
+from src.application.specifications.example_specs import (
+    ExampleActiveSpec,
+    NameNotEmptySpec,
+    ValueInRangeSpec,
+)
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+
+
+class TestNameIndex:
+    """testes para indice de nome"""
+
+    @pytest.mark.asyncio
+    async def test_get_by_name_finds_saved(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        await repository.save(sample_entity)
+
+        result = await repository.get_by_name("Test")
+
+        assert isinstance(result, Some)
+        assert result.value.id == sample_entity.id
+
+    @pytest.mark.asyncio
+    async def test_get_by_name_missing_returns_nothing(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        result = await repository.get_by_name("Missing")
+        assert isinstance(result, Nothing)
+
+    @pytest.mark.asyncio
+    async def test_rename_moves_index(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        await repository.save(sample_entity)
+
+        sample_entity.name = "Renamed"
+        await repository.save(sample_entity)
+
+        assert isinstance(await repository.get_by_name("Test"), Nothing)
+        renamed = await repository.get_by_name("Renamed")
+        assert isinstance(renamed, Some)
+        assert renamed.value.id == sample_entity.id
+
+    @pytest.mark.asyncio
+    async def test_delete_frees_name(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        await repository.save(sample_entity)
+        await repository.delete(sample_entity.id)
+
+        assert isinstance(await repository.get_by_name("Test"), Nothing)
+
+        # nome pode ser reutilizado
+        other = Example.create(name="Test")
+        result = await repository.save(other)
+        assert isinstance(result, Right)
+        found = await repository.get_by_name("Test")
+        assert isinstance(found, Some)
+        assert found.value.id == other.id
+
+    @pytest.mark.asyncio
+    async def test_clear_resets_index(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        await repository.save(sample_entity)
+        repository.clear()
+
+        assert isinstance(await repository.get_by_name("Test"), Nothing)
+
+
+class TestCursorPagination:
+    """testes para paginacao por cursor"""
+
+    @pytest.mark.asyncio
+    async def test_walks_all_pages_in_order(self, repository: InMemoryExampleRepository) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(7)]
+        for entity in created:
+            await repository.save(entity)
+
+        seen: list[Example] = []
+        cursor: str | None = None
+        while True:
+            items, total, cursor = await repository.list_after(cursor, 3)
+            seen.extend(items)
+            assert total == 7
+            if cursor is None:
+                break
+
+        assert [e.id for e in seen] == [e.id for e in created]
+
+    @pytest.mark.asyncio
+    async def test_skips_deleted_and_updates_total(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(4)]
+        for entity in created:
+            await repository.save(entity)
+        await repository.delete(created[1].id)
+
+        items, total, cursor = await repository.list_after(None, 10)
+
+        assert total == 3
+        assert created[1] not in items
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_survives_deleting_last_seen(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(4)]
+        for entity in created:
+            await repository.save(entity)
+
+        first, _, cursor = await repository.list_after(None, 2)
+        await repository.delete(first[-1].id)
+        second, _, _ = await repository.list_after(cursor, 2)
+
+        assert [e.id for e in second] == [created[2].id, created[3].id]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_empty(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        await repository.save(sample_entity)
+
+        items, total, cursor = await repository.list_after("lixo", 10)
+
+        assert items == []
+        assert total == 1
+        assert cursor is None
+
+
+class TestIterBatches:
+    """testes para iteracao em lotes"""
+
+    @pytest.mark.asyncio
+    async def test_yields_all_live_in_batches(self, repository: InMemoryExampleRepository) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        for entity in created:
+            await repository.save(entity)
+        await repository.delete(created[0].id)
+
+        batches = [batch async for batch in repository.iter_batches(2)]
+
+        assert [len(b) for b in batches] == [2, 2]
+        assert [e.id for b in batches for e in b] == [e.id for e in created[1:]]
+
+
+# salva exemplos com valores 0, 10, 20, ... (pares ativos)
+async def seed_values(repository: InMemoryExampleRepository, count: int) -> list[Example]:
+    created = []
+    for i in range(count):
+        entity = Example.create(name=f"Item {i}", value=i * 10)
+        if i % 2 == 0:
+            entity.activate()
+        await repository.save(entity)
+        created.append(entity)
+    return created
+
+
+class TestFind:
+    """testes para busca por spec"""
+
+    @pytest.mark.asyncio
+    async def test_find_by_status_and_value_range(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 10)
+        spec = ExampleActiveSpec() & ValueInRangeSpec(10, 60).on("value")
+
+        items, total = await repository.find(spec, 1, 10)
+
+        assert [e.id for e in items] == [created[2].id, created[4].id, created[6].id]
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_find_paginates_in_list_order(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 10)
+
+        items, total = await repository.find(ValueInRangeSpec(0, 90).on("value"), 2, 4)
+
+        assert [e.id for e in items] == [e.id for e in created[4:8]]
+        assert total == 10
+
+    @pytest.mark.asyncio
+    async def test_find_follows_value_update_and_delete(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 5)
+        created[0].value = 500
+        await repository.save(created[0])
+        await repository.delete(created[4].id)
+
+        items, total = await repository.find(ValueInRangeSpec(25, 1000).on("value"), 1, 10)
+
+        assert [e.id for e in items] == [created[0].id, created[3].id]
+        assert total == 2
+
+    @pytest.mark.asyncio
+    async def test_find_pages_cover_matches_with_stable_total(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 10)
+        spec = ValueInRangeSpec(0, 90).on("value")
+
+        pages = [await repository.find(spec, page, 3) for page in range(1, 6)]
+
+        assert [e.id for items, _ in pages for e in items] == [e.id for e in created]
+        assert [len(items) for items, _ in pages] == [3, 3, 3, 1, 0]
+        assert {total for _, total in pages} == {10}
+
+    @pytest.mark.asyncio
+    async def test_find_untranslatable_spec_falls_back_to_scan(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 3)
+
+        items, total = await repository.find(NameNotEmptySpec().on("name"), 1, 10)
+
+        assert [e.id for e in items] == [e.id for e in created]
+        assert total == 3
+
+
+class TestStatusBuckets:
+    """testes para particao por status e compactacao"""
+
+    @pytest.mark.asyncio
+    async def test_counts_follow_status_changes(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 4)
+        created[0].deactivate()
+        await repository.save(created[0])
+        await repository.delete(created[1].id)
+
+        assert repository.count() == 3
+        assert repository.count(Status.ACTIVE) == 1
+        assert repository.count(Status.INACTIVE) == 1
+        assert repository.count(Status.PENDING) == 1
+        assert repository.count(Status.DELETED) == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_cover_live_only(self, repository: InMemoryExampleRepository) -> None:
+        created = await seed_values(repository, 4)
+        await repository.delete(created[0].id)
+
+        stats = await repository.stats()
+
+        live = [e.value for e in created[1:]]
+        assert stats.total == 3
+        assert stats.value_sum == sum(live)
+        assert (stats.value_min, stats.value_max) == (min(live), max(live))
+        assert stats.by_status == {"pending": 2, "active": 1, "inactive": 0}
+
+    @pytest.mark.asyncio
+    async def test_find_by_status_uses_bucket_in_list_order(
+        self, repository: InMemoryExampleRepository
+    ) -> None:
+        created = await seed_values(repository, 6)
+
+        items, total = await repository.find(ExampleActiveSpec(), 1, 10)
+
+        assert [e.id for e in items] == [created[0].id, created[2].id, created[4].id]
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_saving_deleted_entity_restores_it(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        await repository.save(sample_entity)
+        await repository.delete(sample_entity.id)
+        assert isinstance(await repository.get_by_id(sample_entity.id), Nothing)
+
+        sample_entity.activate()
+        await repository.save(sample_entity)
+
+        assert isinstance(await repository.get_by_id(sample_entity.id), Some)
+        assert repository.count(Status.ACTIVE) == 1
+        assert repository.purge_deleted(0) == 0
+
+    @pytest.mark.asyncio
+    async def test_purge_respects_retention(self, repository: InMemoryExampleRepository) -> None:
+        created = await seed_values(repository, 3)
+        for entity in created[:2]:
+            await repository.delete(entity.id)
+
+        assert repository.purge_deleted(3600) == 0
+        assert repository.purge_deleted(0) == 2
+        assert repository.purge_deleted(0) == 0
+        assert repository.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_background_compaction(self, repository: InMemoryExampleRepository) -> None:
+        created = await seed_values(repository, 2)
+        await repository.delete(created[0].id)
+
+        repository.start_compaction(retention=0, interval=0.01)
+        await asyncio.sleep(0.05)
+        repository.stop_compaction()
+
+        assert repository.purge_deleted(0) == 0
+        assert repository.count() == 1
+
+
+class TestRevision:
+    """testes para versao da entidade e revisao do repositorio"""
+
+    @pytest.mark.asyncio
+    async def test_mutations_bump_entity_version(self, sample_entity: Example) -> None:
+        assert sample_entity.version == 1
+        sample_entity.activate()
+        sample_entity.deactivate()
+        sample_entity.mark_updated()
+
+        assert sample_entity.version == 4
+
+    @pytest.mark.asyncio
+    async def test_revision_changes_on_every_write(
+        self, repository: InMemoryExampleRepository, sample_entity: Example
+    ) -> None:
+        seen = {await repository.revision()}
+        await repository.save(sample_entity)
+        seen.add(await repository.revision())
+        await repository.delete(sample_entity.id)
+        seen.add(await repository.revision())
+
+        assert len(seen) == 3
+        assert await repository.revision() == await repository.revision()
@@ -0,0 +1,69 @@
+"""
+Tests for stats across repository backends
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.example import Example
+from src.infrastructure.database import SqlitePool
+from src.infrastructure.repositories.columnar_example_repository import (
+    NUMPY_AVAILABLE,
+    ColumnarExampleRepository,
+)
+from src.infrastructure.repositories.example_repository import InMemoryExampleRepository
+from src.infrastructure.repositories.sqlite_example_repository import SqliteExampleRepository
+
+BACKENDS = [
+    "memory",
+    "sqlite",
+    pytest.param(
+        "columnar", marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy nao instalado")
+    ),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator:
+    """retorna cada backend vazio"""
+    if request.param == "memory":
+        yield InMemoryExampleRepository()
+    elif request.param == "columnar":
+        yield ColumnarExampleRepository(capacity=2)
+    else:
+        repo = SqliteExampleRepository(SqlitePool(str(tmp_path / "stats.db"), size=2))
+        yield repo
+        repo.close()
+
+
+class TestStatsAcrossBackends:
+    """testes para agregados iguais em todos os backends"""
+
+    @pytest.mark.asyncio
+    async def test_sum_beyond_int64_is_exact(self, backend) -> None:
+        created = [Example.create(name=f"Big {i}", value=2**62) for i in range(2)]
+        created.append(Example.create(name="Max", value=2**63 - 1))
+        created.append(Example.create(name="Small", value=7))
+        created[3].activate()
+        await backend.save_many(created)
+
+        stats = await backend.stats()
+
+        assert stats.total == 4
+        assert stats.value_sum == 2 * 2**62 + 2**63 - 1 + 7
+        assert (stats.value_min, stats.value_max) == (7, 2**63 - 1)
+        assert stats.by_status == {"pending": 3, "active": 1, "inactive": 0}
+
+    @pytest.mark.asyncio
+    async def test_negative_values_sum_exactly(self, backend) -> None:
+        values = [-(2**63), -5, 3, 2**40 + 1]
+        await backend.save_many([Example.create(name=f"N {v}", value=v) for v in values])
+
+        stats = await backend.stats()
+
+        assert stats.value_sum == sum(values)
+        assert (stats.value_min, stats.value_max) == (min(values), max(values))
@@ -0,0 +1,238 @@
+"""
+Tests for SqliteExampleRepository
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.application.specifications.example_specs import (
+    ExampleActiveSpec,
+    NameNotEmptySpec,
+    ValueInRangeSpec,
+)
+from src.core import Left, Right
+from src.core.option import Nothing, Some
+from src.domain.entities.example import Example
+from src.domain.enums import Status
+from src.infrastructure.database import SqlitePool, sqlite_path
+from src.infrastructure.repositories.sqlite_example_repository import SqliteExampleRepository
+
+
+@pytest.fixture
+def sqlite_repository(tmp_path: Path) -> Iterator[SqliteExampleRepository]:
+    """retorna repositorio sqlite em arquivo temporario"""
+    repo = SqliteExampleRepository(SqlitePool(str(tmp_path / "test.db"), size=2))
+    yield repo
+    repo.close()
+
+
+class TestSqliteExampleRepository:
+    """testes para repositorio sqlite"""
+
+    def test_sqlite_path_parses_url(self) -> None:
+        assert sqlite_path("sqlite:///./app.db") == "./app.db"
+
+    def test_sqlite_path_rejects_other_schemes(self) -> None:
+        with pytest.raises(ValueError):
+            sqlite_path("postgresql://localhost/db")
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_roundtrip(
+        self, sqlite_repository: SqliteExampleRepository, active_entity: Example
+    ) -> None:
+        result = await sqlite_repository.save(active_entity)
+        assert isinstance(result, Right)
+
+        found = await sqlite_repository.get_by_id(active_entity.id)
+
+        assert isinstance(found, Some)
+        assert found.value == active_entity
+
+    @pytest.mark.asyncio
+    async def test_get_by_name_and_update(
+        self, sqlite_repository: SqliteExampleRepository, sample_entity: Example
+    ) -> None:
+        await sqlite_repository.save(sample_entity)
+        sample_entity.name = "Renamed"
+        sample_entity.mark_updated()
+        await sqlite_repository.save(sample_entity)
+
+        assert isinstance(await sqlite_repository.get_by_name("Test"), Nothing)
+        found = await sqlite_repository.get_by_name("Renamed")
+        assert isinstance(found, Some)
+        assert found.value.updated_at == sample_entity.updated_at
+
+    @pytest.mark.asyncio
+    async def test_delete_is_soft(
+        self, sqlite_repository: SqliteExampleRepository, sample_entity: Example
+    ) -> None:
+        await sqlite_repository.save(sample_entity)
+        await sqlite_repository.delete(sample_entity.id)
+
+        assert isinstance(await sqlite_repository.get_by_id(sample_entity.id), Nothing)
+        assert isinstance(await sqlite_repository.get_by_name("Test"), Nothing)
+        _, total = await sqlite_repository.list_all(1, 10)
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_list_all_and_cursor(self, sqlite_repository: SqliteExampleRepository) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        for entity in created:
+            await sqlite_repository.save(entity)
+
+        page, total = await sqlite_repository.list_all(2, 2)
+        assert total == 5
+        assert [e.id for e in page] == [created[2].id, created[3].id]
+
+        first, _, cursor = await sqlite_repository.list_after(None, 3)
+        second, _, last_cursor = await sqlite_repository.list_after(cursor, 3)
+        assert [e.id for e in first + second] == [e.id for e in created]
+        assert last_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_data_survives_reopen(self, tmp_path: Path, sample_entity: Example) -> None:
+        path = str(tmp_path / "persist.db")
+        repo = SqliteExampleRepository(SqlitePool(path, size=1))
+        sample_entity.status = Status.ACTIVE
+        await repo.save(sample_entity)
+        repo.close()
+
+        reopened = SqliteExampleRepository(SqlitePool(path, size=1))
+        found = await reopened.get_by_id(sample_entity.id)
+        reopened.close()
+
+        assert isinstance(found, Some)
+        assert found.value.status == Status.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_save_many_and_existing_names(
+        self, sqlite_repository: SqliteExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(3)]
+
+        result = await sqlite_repository.save_many(created)
+
+        assert isinstance(result, Right)
+        taken = await sqlite_repository.existing_names(["Item 0", "Item 2", "Other"])
+        assert taken == {"Item 0", "Item 2"}
+
+    @pytest.mark.asyncio
+    async def test_iter_batches(self, sqlite_repository: SqliteExampleRepository) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        await sqlite_repository.save_many(created)
+
+        batches = [batch async for batch in sqlite_repository.iter_batches(2)]
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert [e.id for b in batches for e in b] == [e.id for e in created]
+
+    @pytest.mark.asyncio
+    async def test_find_pushes_spec_into_where(
+        self, sqlite_repository: SqliteExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}", value=i * 10) for i in range(10)]
+        for entity in created[::2]:
+            entity.activate()
+        await sqlite_repository.save_many(created)
+        spec = ExampleActiveSpec() & ~ValueInRangeSpec(0, 30).on("value")
+
+        items, total = await sqlite_repository.find(spec, 1, 2)
+
+        assert [e.id for e in items] == [created[4].id, created[6].id]
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_find_untranslatable_spec_scans(
+        self, sqlite_repository: SqliteExampleRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(5)]
+        await sqlite_repository.save_many(created)
+
+        items, total = await sqlite_repository.find(NameNotEmptySpec().on("name"), 2, 2)
+
+        assert [e.id for e in items] == [e.id for e in created[2:4]]
+        assert total == 5
+
+    @pytest.mark.asyncio
+    async def test_version_roundtrip_and_revision(
+        self, sqlite_repository: SqliteExampleRepository, sample_entity: Example
+    ) -> None:
+        before = await sqlite_repository.revision()
+        await sqlite_repository.save(sample_entity)
+        sample_entity.activate()
+        await sqlite_repository.save(sample_entity)
+
+        found = await sqlite_repository.get_by_id(sample_entity.id)
+
+        assert isinstance(found, Some)
+        assert found.value.version == 2
+        assert int(await sqlite_repository.revision()) == int(before) + 2
+
+    @pytest.mark.asyncio
+    async def test_migrates_table_without_version(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE examples (id TEXT PRIMARY KEY, name TEXT NOT NULL, "
+            "description TEXT NOT NULL, value INTEGER NOT NULL, status TEXT NOT NULL, "
+            "created_at INTEGER NOT NULL, updated_at INTEGER, created_by TEXT, updated_by TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO examples VALUES ('00000000000000000000000000000001', 'Old', '', 1, "
+            "'active', 0, NULL, NULL, NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        repo = SqliteExampleRepository(SqlitePool(path, size=1))
+        found = await repo.get_by_name("Old")
+        repo.close()
+
+        assert isinstance(found, Some)
+        assert found.value.version == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_and_save_checks_version(
+        self, sqlite_repository: SqliteExampleRepository, sample_entity: Example
+    ) -> None:
+        await sqlite_repository.save(sample_entity)
+        sample_entity.mark_updated()
+
+        assert isinstance(await sqlite_repository.compare_and_save(sample_entity, 1), Right)
+        stale = await sqlite_repository.compare_and_save(sample_entity, 1)
+        missing = await sqlite_repository.compare_and_save(Example.create(name="Ghost"), 1)
+
+        assert isinstance(stale, Left) and stale.value.is_conflict
+        assert isinstance(missing, Left) and missing.value.is_not_found
+
+    @pytest.mark.asyncio
+    async def test_stats_group_by_status(self, sqlite_repository: SqliteExampleRepository) -> None:
+        created = [Example.create(name=f"Item {i}", value=i * 10) for i in range(4)]
+        created[1].activate()
+        await sqlite_repository.save_many(created)
+        await sqlite_repository.delete(created[0].id)
+
+        stats = await sqlite_repository.stats()
+
+        assert stats.total == 3
+        assert (stats.value_sum, stats.value_min, stats.value_max) == (60, 10, 30)
+        assert stats.value_avg == 20
+        assert stats.by_status == {"pending": 2, "active": 1, "inactive": 0}
+
+    @pytest.mark.asyncio
+    async def test_value_beyond_int64_is_left(
+        self, sqlite_repository: SqliteExampleRepository, sample_entity: Example
+    ) -> None:
+        await sqlite_repository.save(sample_entity)
+        sample_entity.value = 2**63
+
+        saved = await sqlite_repository.save(sample_entity)
+        updated = await sqlite_repository.compare_and_save(sample_entity, 1)
+
+        assert isinstance(saved, Left) and saved.value.is_validation
+        assert isinstance(updated, Left) and updated.value.is_validation
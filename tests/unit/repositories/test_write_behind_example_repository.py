@@ -0,0 +1,174 @@
+"""
+Tests for WriteBehindExampleRepository
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from src.core import Either, ErrorResult, Left, Right
+from src.core.option import Nothing, Some
+from src.domain.entities.example import Example
+from src.infrastructure.repositories import (
+    InMemoryExampleRepository,
+    WriteBehindExampleRepository,
+)
+
+
+class BatchRecordingRepository(InMemoryExampleRepository):
+    """guarda cada lote recebido e pode falhar sob demanda"""
+
+    __slots__ = ("batches", "fail")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[Example]] = []
+        self.fail = False
+
+    async def save_many(self, entities: list[Example]) -> Either[ErrorResult, list[Example]]:
+        if self.fail:
+            return Left(ErrorResult.exception("backend fora"))
+        self.batches.append(list(entities))
+        return await super().save_many(entities)
+
+
+@pytest.fixture
+def recording() -> BatchRecordingRepository:
+    return BatchRecordingRepository()
+
+
+@pytest.fixture
+def write_behind(recording: BatchRecordingRepository) -> WriteBehindExampleRepository:
+    return WriteBehindExampleRepository(recording, max_batch=3, max_delay=0.01)
+
+
+class TestWriteBehindExampleRepository:
+    """testes para o decorator write-behind"""
+
+    @pytest.mark.asyncio
+    async def test_save_is_acknowledged_before_flush(
+        self,
+        write_behind: WriteBehindExampleRepository,
+        recording: BatchRecordingRepository,
+        sample_entity: Example,
+    ) -> None:
+        assert isinstance(await write_behind.save(sample_entity), Right)
+
+        assert isinstance(await recording.get_by_id(sample_entity.id), Nothing)
+        assert isinstance(await write_behind.get_by_id(sample_entity.id), Some)
+        assert isinstance(await write_behind.get_by_name("Test"), Some)
+        assert write_behind.snapshot()["queue_depth"] == 1
+
+        await asyncio.sleep(0.05)
+
+        assert isinstance(await recording.get_by_id(sample_entity.id), Some)
+        assert write_behind.snapshot()["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_same_id_writes_coalesce(
+        self,
+        write_behind: WriteBehindExampleRepository,
+        recording: BatchRecordingRepository,
+        sample_entity: Example,
+    ) -> None:
+        for value in range(5):
+            sample_entity.value = value
+            await write_behind.save(sample_entity)
+
+        assert await write_behind.flush()
+
+        assert [len(b) for b in recording.batches] == [1]
+        stats = write_behind.snapshot()
+        assert stats["enqueued"] == 5 and stats["coalesced"] == 4
+        assert stats["batches"] == 1 and stats["flushed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_are_bounded_by_size(
+        self, write_behind: WriteBehindExampleRepository, recording: BatchRecordingRepository
+    ) -> None:
+        await write_behind.save_many([Example.create(name=f"Item {i}") for i in range(7)])
+
+        # lista esvazia a fila antes de ler
+        _, total = await write_behind.list_all(1, 10)
+
+        assert total == 7
+        assert [len(b) for b in recording.batches] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_delete_and_rename_hide_stored_row(
+        self,
+        write_behind: WriteBehindExampleRepository,
+        recording: BatchRecordingRepository,
+        sample_entity: Example,
+    ) -> None:
+        other = Example.create(name="Other")
+        await recording.save_many([sample_entity, other])
+        renamed = Example.create(name="Renamed")
+        renamed.id, renamed.created_at = other.id, other.created_at
+
+        await write_behind.delete(sample_entity.id)
+        await write_behind.save(renamed)
+
+        assert isinstance(await write_behind.get_by_id(sample_entity.id), Nothing)
+        assert isinstance(await write_behind.get_by_name("Test"), Nothing)
+        assert isinstance(await write_behind.get_by_name("Other"), Nothing)
+        assert (await write_behind.stats()).total == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_and_save_checks_queued_version(
+        self, write_behind: WriteBehindExampleRepository, sample_entity: Example
+    ) -> None:
+        await write_behind.save(sample_entity)
+        # copia como o service faz, o objeto na fila continua na versao 1
+        updated = replace(sample_entity)
+        updated.mark_updated()
+
+        assert isinstance(await write_behind.compare_and_save(updated, 1), Right)
+        stale = await write_behind.compare_and_save(replace(updated), 1)
+        missing = await write_behind.compare_and_save(Example.create(name="Ghost"), 1)
+
+        assert isinstance(stale, Left) and stale.value.is_conflict
+        assert isinstance(missing, Left) and missing.value.is_not_found
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_requeued(
+        self,
+        write_behind: WriteBehindExampleRepository,
+        recording: BatchRecordingRepository,
+        sample_entity: Example,
+    ) -> None:
+        recording.fail = True
+        await write_behind.save(sample_entity)
+
+        assert not await write_behind.flush()
+        assert write_behind.snapshot()["failures"] == 1
+        assert isinstance(await write_behind.get_by_id(sample_entity.id), Some)
+
+        recording.fail = False
+        assert await write_behind.drain()
+        assert isinstance(await recording.get_by_id(sample_entity.id), Some)
+
+    @pytest.mark.asyncio
+    async def test_drain_flushes_everything(
+        self, write_behind: WriteBehindExampleRepository, recording: BatchRecordingRepository
+    ) -> None:
+        created = [Example.create(name=f"Item {i}") for i in range(10)]
+        for entity in created:
+            await write_behind.save(entity)
+
+        assert await write_behind.drain()
+
+        assert recording.count() == 10
+        assert write_behind.snapshot()["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_value_beyond_int64_is_rejected_before_queueing(
+        self, write_behind: WriteBehindExampleRepository
+    ) -> None:
+        result = await write_behind.save(Example.create(name="Big", value=2**63))
+
+        assert isinstance(result, Left) and result.value.is_validation
+        assert write_behind.snapshot()["queue_depth"] == 0
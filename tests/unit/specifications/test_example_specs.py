@@ -10,11 +10,15 @@ from src.core import Left, Right
 from src.application.specifications.example_specs import (
     ExampleActiveSpec,
     ExampleNotDeletedSpec,
+    ExampleStatusSpec,
     NameNotEmptySpec,
     ValueInRangeSpec,
     ValuePositiveSpec,
     example_can_be_modified,
+    example_search,
 )
+from src.core.filters import Compare
+from src.core.option import Some
 from src.domain.entities.example import Example
 from src.domain.enums import Status
 
@@ -105,3 +109,49 @@ class TestComposedSpecs:
         assert isinstance(result, Right)
         assert result.value == active_entity
 
+
+
+class TestBatchExampleSpecs:
+    """testes para avaliacao em lote das specs de exemplo"""
+
+    def test_value_range_on_examples(self, active_entity: Example) -> None:
+        entities = [Example.create(name=f"Item {v}", value=v) for v in (5, 10, 100, 101)]
+        entities.append(active_entity)
+        spec = ValueInRangeSpec(10, 100).on("value") & ValuePositiveSpec().on("value")
+
+        result = spec.filter_many(entities)
+
+        assert [e.value for e in result] == [10, 100, 50]
+
+    def test_active_and_value_range(self, active_entity: Example) -> None:
+        pending = Example.create(name="Pending", value=50)
+        spec = ExampleActiveSpec() & ValueInRangeSpec(10, 100).on("value")
+
+        assert spec.mask([pending, active_entity]) == [False, True]
+
+
+class TestExampleSearch:
+    """testes para spec de busca"""
+
+    def test_no_filters_returns_none(self) -> None:
+        assert example_search() is None
+
+    def test_status_spec_translates(self) -> None:
+        spec = ExampleStatusSpec(Status.INACTIVE)
+        assert spec.to_filter() == Some(Compare("status", "eq", "inactive"))
+
+    def test_open_range_keeps_one_bound(self) -> None:
+        spec = example_search(status=Status.ACTIVE, min_value=10)
+        low = Example.create(name="a", value=5)
+        high = Example.create(name="b", value=50)
+        for entity in (low, high):
+            entity.activate()
+
+        assert spec is not None
+        assert isinstance(spec.to_filter(), Some)
+        assert not spec.is_satisfied_by(low)
+        assert spec.is_satisfied_by(high)
+
+    def test_modifiable_spec_translates(self) -> None:
+        assert isinstance(example_can_be_modified().to_filter(), Some)
+        assert isinstance(ExampleNotDeletedSpec().to_filter(), Some)
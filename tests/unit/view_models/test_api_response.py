@@ -4,9 +4,20 @@ Tests for ApiResponse
 
 from __future__ import annotations
 
+import json
+from uuid import uuid4
+
 import pytest
 
-from src.application.view_models import ApiResponse, PaginatedResult
+from src.api import responses
+from src.api.responses import FastJSONResponse, dump_json
+from src.application.view_models import (
+    ApiResponse,
+    ExamplePage,
+    ExamplePageEnvelope,
+    ExampleResponse,
+    PaginatedResult,
+)
 
 
 class TestApiResponse:
@@ -104,3 +115,80 @@ class TestPaginatedResult:
         assert response.result.items == [{"id": 1}, {"id": 2}]
         assert response.result.total == 2
 
+
+@pytest.fixture(params=[True, False], ids=["orjson", "pydantic-core"])
+def orjson_mode(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """roda o teste com e sem orjson"""
+    if request.param and not responses.ORJSON_AVAILABLE:
+        pytest.skip("orjson nao instalado")
+    monkeypatch.setattr(responses, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestFastJSONResponse:
+    """testes para serializacao em um passo"""
+
+    def test_model_matches_pydantic_dump(self, orjson_mode: bool) -> None:
+        item = ExampleResponse(
+            id=uuid4(), name="a", description="", value=1, status="active", version=1
+        )
+        response = ApiResponse.success(PaginatedResult.create([item], 1, 1, 10))
+
+        assert json.loads(dump_json(response)) == json.loads(response.model_dump_json())
+
+    def test_typed_envelope_same_body_as_generic(self) -> None:
+        item = ExampleResponse(
+            id=uuid4(), name="a", description="", value=1, status="active", version=1
+        )
+        generic = ApiResponse.success(PaginatedResult.create([item], 1, 1, 10))
+        typed = ExamplePageEnvelope.success(ExamplePage.create([item], 1, 1, 10))
+
+        assert dump_json(typed) == dump_json(generic)
+
+    def test_plain_content_with_uuid(self, orjson_mode: bool) -> None:
+        id = uuid4()
+        assert json.loads(dump_json({"id": id, "items": [1, 2]})) == {
+            "id": str(id),
+            "items": [1, 2],
+        }
+
+    def test_bytes_pass_through(self) -> None:
+        response = FastJSONResponse(b'{"ok":true}', headers={"ETag": '"1"'})
+
+        assert response.body == b'{"ok":true}'
+        assert response.headers["etag"] == '"1"'
+        assert response.media_type == "application/json"
+
+
+class TestExampleResponseDto:
+    """testes para o DTO de response (dataclass)"""
+
+    def test_inside_envelope_serializes_all_fields(self) -> None:
+        id = uuid4()
+        item = ExampleResponse(id=id, name="a", description="", value=1, status="active", version=2)
+        page = ExamplePageEnvelope.success(ExamplePage.create([item], 1, 1, 10))
+
+        assert json.loads(dump_json(page))["result"]["items"] == [
+            {
+                "id": str(id),
+                "name": "a",
+                "description": "",
+                "value": 1,
+                "status": "active",
+                "version": 2,
+            }
+        ]
+
+    def test_plain_item_same_body_with_and_without_orjson(self, orjson_mode: bool) -> None:
+        id = uuid4()
+        item = ExampleResponse(id=id, name="a", description="", value=1, status="active", version=2)
+
+        assert json.loads(dump_json(item))["id"] == str(id)
+        assert json.loads(dump_json(item))["version"] == 2
+
+    def test_has_no_instance_dict(self) -> None:
+        item = ExampleResponse(
+            id=uuid4(), name="a", description="", value=1, status="active", version=2
+        )
+
+        assert not hasattr(item, "__dict__")